@@ -27,7 +27,8 @@ from ..models.journal_entries import (
     AccountType,
     FlowDirection,
     JournalEntryStatus,
-    RecurrenceFrequency
+    RecurrenceFrequency,
+    BulkStatusUpdate
 )
 from ..models.budget_envelopes import (
     BudgetEnvelope,
@@ -151,10 +152,10 @@ async def create_journal_entry(entry: JournalEntry):
     """
     # Validate balanced
     if not entry.is_balanced():
+        from_total, to_total = entry.balance_totals()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Journal entry is not balanced. FROM: {sum(d.amount for d in entry.get_from_distributions())}, "
-                   f"TO: {sum(d.amount for d in entry.get_to_distributions())}"
+            detail=f"Journal entry is not balanced. FROM: {from_total}, TO: {to_total}"
         )
 
     # Save to database
@@ -218,6 +219,29 @@ async def update_journal_entry(entry_id: str, entry: JournalEntry):
     journal_entries_db[entry_id] = entry
     return entry
 
+@app.patch("/api/journal-entries:bulk-status", tags=["Journal Entries"])
+async def bulk_update_journal_entry_status(updates: List[BulkStatusUpdate]):
+    """Change status/posting_date of many journal entries in one request."""
+    if any(update.status == JournalEntryStatus.POSTED for update in updates):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use the post endpoint to post journal entries"
+        )
+
+    # Posted entries (and unknown ids) are left untouched and reported back
+    updated_count = 0
+    skipped = []
+    for update in updates:
+        entry = journal_entries_db.get(update.journal_entry_id)
+        if entry is None or entry.status == JournalEntryStatus.POSTED:
+            skipped.append(update.journal_entry_id)
+            continue
+        entry.status = update.status
+        entry.posting_date = update.posting_date
+        updated_count += 1
+
+    return {"updated": updated_count, "skipped": skipped}
+
 @app.delete("/api/journal-entries/{entry_id}", tags=["Journal Entries"])
 async def void_journal_entry(entry_id: str):
     """Void a journal entry."""
@@ -485,8 +509,7 @@ async def expand_recurring_templates(
 
     # Optionally save to database
     if auto_post:
-        for entry in entries:
-            journal_entries_db[entry.journal_entry_id] = entry
+        recurring_service.bulk_post(entries, journal_entries_db)
 
     return entries
 
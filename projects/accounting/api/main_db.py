@@ -6,6 +6,7 @@ REST API for the LiMOS accounting module with SQLite database backend.
 
 from fastapi import FastAPI, HTTPException, status, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from datetime import date, datetime
 from sqlalchemy.orm import Session
@@ -21,7 +22,8 @@ from ..models.journal_entries import (
     AccountType,
     FlowDirection,
     JournalEntryStatus,
-    RecurrenceFrequency
+    RecurrenceFrequency,
+    BulkStatusUpdate
 )
 from ..models.budget_envelopes import (
     BudgetEnvelope,
@@ -39,7 +41,9 @@ from ..database.repositories import (
     JournalEntryRepository,
     BudgetEnvelopeRepository,
     PaymentEnvelopeRepository,
-    RecurringJournalEntryRepository
+    RecurringJournalEntryRepository,
+    get_envelope_summary,
+    get_record_counts
 )
 
 # Import services
@@ -68,6 +72,9 @@ app.add_middleware(
 envelope_service = EnvelopeService()
 recurring_service = RecurringTransactionService()
 
+# Generated entries inserted per round trip when expanding templates
+EXPAND_INSERT_BATCH_SIZE = 500
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
@@ -99,7 +106,7 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check(db: Session = Depends(get_db_session)):
+def health_check(db: Session = Depends(get_db_session)):
     """Detailed health check."""
     accounts_count = len(ChartOfAccountsRepository.get_all(db))
     entries_count = len(JournalEntryRepository.get_all(db))
@@ -125,8 +132,15 @@ async def health_check(db: Session = Depends(get_db_session)):
 # JOURNAL ENTRIES
 # ============================================================================
 
-@app.post("/api/journal-entries", response_model=JournalEntry, status_code=status.HTTP_201_CREATED, tags=["Journal Entries"])
-async def create_journal_entry(entry: JournalEntry, db: Session = Depends(get_db_session)):
+@app.post(
+    "/api/journal-entries",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": JournalEntry}},
+    tags=["Journal Entries"]
+)
+def create_journal_entry(entry: JournalEntry, db: Session = Depends(get_db_session)):
     """
     Create a new journal entry.
 
@@ -134,10 +148,10 @@ async def create_journal_entry(entry: JournalEntry, db: Session = Depends(get_db
     """
     # Validate balanced
     if not entry.is_balanced():
+        from_total, to_total = entry.balance_totals()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Journal entry is not balanced. FROM: {sum(d.amount for d in entry.get_from_distributions())}, "
-                   f"TO: {sum(d.amount for d in entry.get_to_distributions())}"
+            detail=f"Journal entry is not balanced. FROM: {from_total}, TO: {to_total}"
         )
 
     # Save to database
@@ -147,11 +161,17 @@ async def create_journal_entry(entry: JournalEntry, db: Session = Depends(get_db
     if entry.status == JournalEntryStatus.POSTED:
         envelope_service.post_journal_entry(entry)
 
-    return created_entry
+    return ORJSONResponse(created_entry.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@app.get("/api/journal-entries", response_model=List[JournalEntry], tags=["Journal Entries"])
-async def list_journal_entries(
+@app.get(
+    "/api/journal-entries",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[JournalEntry]}},
+    tags=["Journal Entries"]
+)
+def list_journal_entries(
     start_date: Optional[str] = Query(None, description="Filter by start date (ISO format)"),
     end_date: Optional[str] = Query(None, description="Filter by end date (ISO format)"),
     status: Optional[JournalEntryStatus] = Query(None, description="Filter by status"),
@@ -166,11 +186,17 @@ async def list_journal_entries(
         status=status.value if status else None,
         limit=limit
     )
-    return entries
+    return ORJSONResponse([entry.model_dump(mode="json") for entry in entries])
 
 
-@app.get("/api/journal-entries/{entry_id}", response_model=JournalEntry, tags=["Journal Entries"])
-async def get_journal_entry(entry_id: str, db: Session = Depends(get_db_session)):
+@app.get(
+    "/api/journal-entries/{entry_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": JournalEntry}},
+    tags=["Journal Entries"]
+)
+def get_journal_entry(entry_id: str, db: Session = Depends(get_db_session)):
     """Get a specific journal entry by ID."""
     entry = JournalEntryRepository.get_by_id(db, entry_id)
     if not entry:
@@ -178,11 +204,17 @@ async def get_journal_entry(entry_id: str, db: Session = Depends(get_db_session)
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Journal entry {entry_id} not found"
         )
-    return entry
+    return ORJSONResponse(entry.model_dump(mode="json"))
 
 
-@app.put("/api/journal-entries/{entry_id}", response_model=JournalEntry, tags=["Journal Entries"])
-async def update_journal_entry(entry_id: str, entry: JournalEntry, db: Session = Depends(get_db_session)):
+@app.put(
+    "/api/journal-entries/{entry_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": JournalEntry}},
+    tags=["Journal Entries"]
+)
+def update_journal_entry(entry_id: str, entry: JournalEntry, db: Session = Depends(get_db_session)):
     """Update a journal entry (only if not posted)."""
     existing = JournalEntryRepository.get_by_id(db, entry_id)
     if not existing:
@@ -199,21 +231,36 @@ async def update_journal_entry(entry_id: str, entry: JournalEntry, db: Session =
 
     # Validate balanced
     if not entry.is_balanced():
+        from_total, to_total = entry.balance_totals()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Journal entry is not balanced. FROM: {sum(d.amount for d in entry.get_from_distributions())}, "
-                   f"TO: {sum(d.amount for d in entry.get_to_distributions())}"
+            detail=f"Journal entry is not balanced. FROM: {from_total}, TO: {to_total}"
         )
 
     # Ensure the entry_id matches
     entry.journal_entry_id = entry_id
 
     updated_entry = JournalEntryRepository.update(db, entry_id, entry)
-    return updated_entry
+    return ORJSONResponse(updated_entry.model_dump(mode="json"))
+
+
+@app.patch("/api/journal-entries:bulk-status", tags=["Journal Entries"])
+def bulk_update_journal_entry_status(updates: List[BulkStatusUpdate], db: Session = Depends(get_db_session)):
+    """Change status/posting_date of many journal entries in one request and commit."""
+    if any(update.status == JournalEntryStatus.POSTED for update in updates):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use the post endpoint to post journal entries"
+        )
+
+    # Posted entries (and unknown ids) are left untouched and reported back
+    updated_ids = set(JournalEntryRepository.bulk_update_status(db, updates))
+    skipped = [update.journal_entry_id for update in updates if update.journal_entry_id not in updated_ids]
+    return {"updated": len(updated_ids), "skipped": skipped}
 
 
 @app.delete("/api/journal-entries/{entry_id}", tags=["Journal Entries"])
-async def void_journal_entry(entry_id: str, db: Session = Depends(get_db_session)):
+def void_journal_entry(entry_id: str, db: Session = Depends(get_db_session)):
     """Void a journal entry."""
     entry = JournalEntryRepository.get_by_id(db, entry_id)
     if not entry:
@@ -228,8 +275,14 @@ async def void_journal_entry(entry_id: str, db: Session = Depends(get_db_session
     return {"message": f"Journal entry {entry_id} voided successfully"}
 
 
-@app.post("/api/journal-entries/{entry_id}/post", response_model=JournalEntry, tags=["Journal Entries"])
-async def post_journal_entry(entry_id: str, db: Session = Depends(get_db_session)):
+@app.post(
+    "/api/journal-entries/{entry_id}/post",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": JournalEntry}},
+    tags=["Journal Entries"]
+)
+def post_journal_entry(entry_id: str, db: Session = Depends(get_db_session)):
     """
     Post a journal entry.
 
@@ -256,15 +309,21 @@ async def post_journal_entry(entry_id: str, db: Session = Depends(get_db_session
     # Update envelopes
     envelope_service.post_journal_entry(updated_entry)
 
-    return updated_entry
+    return ORJSONResponse(updated_entry.model_dump(mode="json"))
 
 
 # ============================================================================
 # CHART OF ACCOUNTS
 # ============================================================================
 
-@app.get("/api/accounts", response_model=List[ChartOfAccounts], tags=["Chart of Accounts"])
-async def list_accounts(
+@app.get(
+    "/api/accounts",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ChartOfAccounts]}},
+    tags=["Chart of Accounts"]
+)
+def list_accounts(
     account_type: Optional[AccountType] = Query(None, description="Filter by account type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: Session = Depends(get_db_session)
@@ -275,11 +334,17 @@ async def list_accounts(
         account_type=account_type.value if account_type else None,
         is_active=is_active
     )
-    return accounts
+    return ORJSONResponse([account.model_dump(mode="json") for account in accounts])
 
 
-@app.get("/api/accounts/{account_id}", response_model=ChartOfAccounts, tags=["Chart of Accounts"])
-async def get_account(account_id: str, db: Session = Depends(get_db_session)):
+@app.get(
+    "/api/accounts/{account_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ChartOfAccounts}},
+    tags=["Chart of Accounts"]
+)
+def get_account(account_id: str, db: Session = Depends(get_db_session)):
     """Get a specific account by ID."""
     account = ChartOfAccountsRepository.get_by_id(db, account_id)
     if not account:
@@ -287,46 +352,69 @@ async def get_account(account_id: str, db: Session = Depends(get_db_session)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Account {account_id} not found"
         )
-    return account
+    return ORJSONResponse(account.model_dump(mode="json"))
 
 
-@app.post("/api/accounts", response_model=ChartOfAccounts, status_code=status.HTTP_201_CREATED, tags=["Chart of Accounts"])
-async def create_account(account: ChartOfAccounts, db: Session = Depends(get_db_session)):
+@app.post(
+    "/api/accounts",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": ChartOfAccounts}},
+    tags=["Chart of Accounts"]
+)
+def create_account(account: ChartOfAccounts, db: Session = Depends(get_db_session)):
     """Create a new account."""
     created_account = ChartOfAccountsRepository.create(db, account)
-    return created_account
+    return ORJSONResponse(created_account.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@app.put("/api/accounts/{account_id}", response_model=ChartOfAccounts, tags=["Chart of Accounts"])
-async def update_account(account_id: str, account: ChartOfAccounts, db: Session = Depends(get_db_session)):
+@app.put(
+    "/api/accounts/{account_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ChartOfAccounts}},
+    tags=["Chart of Accounts"]
+)
+def update_account(account_id: str, account: ChartOfAccounts, db: Session = Depends(get_db_session)):
     """Update an existing account."""
-    existing = ChartOfAccountsRepository.get_by_id(db, account_id)
-    if not existing:
+    updated_account = ChartOfAccountsRepository.update(db, account_id, account)
+    if not updated_account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Account {account_id} not found"
         )
-
-    updated_account = ChartOfAccountsRepository.update(db, account_id, account)
-    return updated_account
+    return ORJSONResponse(updated_account.model_dump(mode="json"))
 
 
 # ============================================================================
 # BUDGET ENVELOPES
 # ============================================================================
 
-@app.get("/api/envelopes/budget", response_model=List[BudgetEnvelope], tags=["Envelopes"])
-async def list_budget_envelopes(
+@app.get(
+    "/api/envelopes/budget",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[BudgetEnvelope]}},
+    tags=["Envelopes"]
+)
+def list_budget_envelopes(
     active_only: bool = Query(False, description="Return only active envelopes"),
     db: Session = Depends(get_db_session)
 ):
     """List all budget envelopes."""
     envelopes = BudgetEnvelopeRepository.get_all(db, active_only=active_only)
-    return envelopes
+    return ORJSONResponse([envelope.model_dump(mode="json") for envelope in envelopes])
 
 
-@app.get("/api/envelopes/budget/{envelope_id}", response_model=BudgetEnvelope, tags=["Envelopes"])
-async def get_budget_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
+@app.get(
+    "/api/envelopes/budget/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": BudgetEnvelope}},
+    tags=["Envelopes"]
+)
+def get_budget_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
     """Get a specific budget envelope."""
     envelope = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
     if not envelope:
@@ -334,41 +422,49 @@ async def get_budget_envelope(envelope_id: str, db: Session = Depends(get_db_ses
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget envelope {envelope_id} not found"
         )
-    return envelope
+    return ORJSONResponse(envelope.model_dump(mode="json"))
 
 
-@app.post("/api/envelopes/budget", response_model=BudgetEnvelope, status_code=status.HTTP_201_CREATED, tags=["Envelopes"])
-async def create_budget_envelope(envelope: BudgetEnvelope, db: Session = Depends(get_db_session)):
+@app.post(
+    "/api/envelopes/budget",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": BudgetEnvelope}},
+    tags=["Envelopes"]
+)
+def create_budget_envelope(envelope: BudgetEnvelope, db: Session = Depends(get_db_session)):
     """Create a new budget envelope."""
     created_envelope = BudgetEnvelopeRepository.create(db, envelope)
-    return created_envelope
+    return ORJSONResponse(created_envelope.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@app.put("/api/envelopes/budget/{envelope_id}", response_model=BudgetEnvelope, tags=["Envelopes"])
-async def update_budget_envelope(envelope_id: str, envelope: BudgetEnvelope, db: Session = Depends(get_db_session)):
+@app.put(
+    "/api/envelopes/budget/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": BudgetEnvelope}},
+    tags=["Envelopes"]
+)
+def update_budget_envelope(envelope_id: str, envelope: BudgetEnvelope, db: Session = Depends(get_db_session)):
     """Update a budget envelope."""
-    existing = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    updated_envelope = BudgetEnvelopeRepository.update(db, envelope_id, envelope)
+    if not updated_envelope:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget envelope {envelope_id} not found"
         )
-
-    updated_envelope = BudgetEnvelopeRepository.update(db, envelope_id, envelope)
-    return updated_envelope
+    return ORJSONResponse(updated_envelope.model_dump(mode="json"))
 
 
 @app.delete("/api/envelopes/budget/{envelope_id}", tags=["Envelopes"])
-async def delete_budget_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
+def delete_budget_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
     """Delete a budget envelope."""
-    existing = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    if not BudgetEnvelopeRepository.delete(db, envelope_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget envelope {envelope_id} not found"
         )
-
-    BudgetEnvelopeRepository.delete(db, envelope_id)
     return {"message": f"Budget envelope {envelope_id} deleted successfully"}
 
 
@@ -376,18 +472,30 @@ async def delete_budget_envelope(envelope_id: str, db: Session = Depends(get_db_
 # PAYMENT ENVELOPES
 # ============================================================================
 
-@app.get("/api/envelopes/payment", response_model=List[PaymentEnvelope], tags=["Envelopes"])
-async def list_payment_envelopes(
+@app.get(
+    "/api/envelopes/payment",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[PaymentEnvelope]}},
+    tags=["Envelopes"]
+)
+def list_payment_envelopes(
     active_only: bool = Query(False, description="Return only active envelopes"),
     db: Session = Depends(get_db_session)
 ):
     """List all payment envelopes."""
     envelopes = PaymentEnvelopeRepository.get_all(db, active_only=active_only)
-    return envelopes
+    return ORJSONResponse([envelope.model_dump(mode="json") for envelope in envelopes])
 
 
-@app.get("/api/envelopes/payment/{envelope_id}", response_model=PaymentEnvelope, tags=["Envelopes"])
-async def get_payment_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
+@app.get(
+    "/api/envelopes/payment/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": PaymentEnvelope}},
+    tags=["Envelopes"]
+)
+def get_payment_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
     """Get a specific payment envelope."""
     envelope = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
     if not envelope:
@@ -395,41 +503,49 @@ async def get_payment_envelope(envelope_id: str, db: Session = Depends(get_db_se
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment envelope {envelope_id} not found"
         )
-    return envelope
+    return ORJSONResponse(envelope.model_dump(mode="json"))
 
 
-@app.post("/api/envelopes/payment", response_model=PaymentEnvelope, status_code=status.HTTP_201_CREATED, tags=["Envelopes"])
-async def create_payment_envelope(envelope: PaymentEnvelope, db: Session = Depends(get_db_session)):
+@app.post(
+    "/api/envelopes/payment",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": PaymentEnvelope}},
+    tags=["Envelopes"]
+)
+def create_payment_envelope(envelope: PaymentEnvelope, db: Session = Depends(get_db_session)):
     """Create a new payment envelope."""
     created_envelope = PaymentEnvelopeRepository.create(db, envelope)
-    return created_envelope
+    return ORJSONResponse(created_envelope.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@app.put("/api/envelopes/payment/{envelope_id}", response_model=PaymentEnvelope, tags=["Envelopes"])
-async def update_payment_envelope(envelope_id: str, envelope: PaymentEnvelope, db: Session = Depends(get_db_session)):
+@app.put(
+    "/api/envelopes/payment/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": PaymentEnvelope}},
+    tags=["Envelopes"]
+)
+def update_payment_envelope(envelope_id: str, envelope: PaymentEnvelope, db: Session = Depends(get_db_session)):
     """Update a payment envelope."""
-    existing = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    updated_envelope = PaymentEnvelopeRepository.update(db, envelope_id, envelope)
+    if not updated_envelope:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment envelope {envelope_id} not found"
         )
-
-    updated_envelope = PaymentEnvelopeRepository.update(db, envelope_id, envelope)
-    return updated_envelope
+    return ORJSONResponse(updated_envelope.model_dump(mode="json"))
 
 
 @app.delete("/api/envelopes/payment/{envelope_id}", tags=["Envelopes"])
-async def delete_payment_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
+def delete_payment_envelope(envelope_id: str, db: Session = Depends(get_db_session)):
     """Delete a payment envelope."""
-    existing = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    if not PaymentEnvelopeRepository.delete(db, envelope_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment envelope {envelope_id} not found"
         )
-
-    PaymentEnvelopeRepository.delete(db, envelope_id)
     return {"message": f"Payment envelope {envelope_id} deleted successfully"}
 
 
@@ -437,18 +553,30 @@ async def delete_payment_envelope(envelope_id: str, db: Session = Depends(get_db
 # RECURRING TEMPLATES
 # ============================================================================
 
-@app.get("/api/recurring-templates", response_model=List[RecurringJournalEntry], tags=["Recurring"])
-async def list_recurring_templates(
+@app.get(
+    "/api/recurring-templates",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[RecurringJournalEntry]}},
+    tags=["Recurring"]
+)
+def list_recurring_templates(
     active_only: bool = Query(False, description="Return only active templates"),
     db: Session = Depends(get_db_session)
 ):
     """List all recurring journal entry templates."""
     templates = RecurringJournalEntryRepository.get_all(db, active_only=active_only)
-    return templates
+    return ORJSONResponse([template.model_dump(mode="json") for template in templates])
 
 
-@app.get("/api/recurring-templates/{template_id}", response_model=RecurringJournalEntry, tags=["Recurring"])
-async def get_recurring_template(template_id: str, db: Session = Depends(get_db_session)):
+@app.get(
+    "/api/recurring-templates/{template_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecurringJournalEntry}},
+    tags=["Recurring"]
+)
+def get_recurring_template(template_id: str, db: Session = Depends(get_db_session)):
     """Get a specific recurring template."""
     template = RecurringJournalEntryRepository.get_by_id(db, template_id)
     if not template:
@@ -456,91 +584,115 @@ async def get_recurring_template(template_id: str, db: Session = Depends(get_db_
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-    return template
+    return ORJSONResponse(template.model_dump(mode="json"))
 
 
-@app.post("/api/recurring-templates", response_model=RecurringJournalEntry, status_code=status.HTTP_201_CREATED, tags=["Recurring"])
-async def create_recurring_template(template: RecurringJournalEntry, db: Session = Depends(get_db_session)):
+@app.post(
+    "/api/recurring-templates",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": RecurringJournalEntry}},
+    tags=["Recurring"]
+)
+def create_recurring_template(template: RecurringJournalEntry, db: Session = Depends(get_db_session)):
     """Create a new recurring template."""
     created_template = RecurringJournalEntryRepository.create(db, template)
-    return created_template
+    return ORJSONResponse(created_template.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@app.put("/api/recurring-templates/{template_id}", response_model=RecurringJournalEntry, tags=["Recurring"])
-async def update_recurring_template(template_id: str, template: RecurringJournalEntry, db: Session = Depends(get_db_session)):
+@app.put(
+    "/api/recurring-templates/{template_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecurringJournalEntry}},
+    tags=["Recurring"]
+)
+def update_recurring_template(template_id: str, template: RecurringJournalEntry, db: Session = Depends(get_db_session)):
     """Update a recurring template."""
-    existing = RecurringJournalEntryRepository.get_by_id(db, template_id)
-    if not existing:
+    updated_template = RecurringJournalEntryRepository.update(db, template_id, template)
+    if not updated_template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
+    return ORJSONResponse(updated_template.model_dump(mode="json"))
 
-    updated_template = RecurringJournalEntryRepository.update(db, template_id, template)
-    return updated_template
 
-
-@app.patch("/api/recurring-templates/{template_id}/toggle-active", response_model=RecurringJournalEntry, tags=["Recurring"])
-async def toggle_recurring_template(template_id: str, db: Session = Depends(get_db_session)):
+@app.patch(
+    "/api/recurring-templates/{template_id}/toggle-active",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecurringJournalEntry}},
+    tags=["Recurring"]
+)
+def toggle_recurring_template(template_id: str, db: Session = Depends(get_db_session)):
     """Toggle active status of a recurring template."""
-    template = RecurringJournalEntryRepository.get_by_id(db, template_id)
-    if not template:
+    toggled_template = RecurringJournalEntryRepository.toggle_active(db, template_id)
+    if not toggled_template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-
-    # Toggle is_active
-    template.is_active = not template.is_active
-    updated_template = RecurringJournalEntryRepository.update(db, template_id, template)
-    return updated_template
+    return ORJSONResponse(toggled_template.model_dump(mode="json"))
 
 
 @app.delete("/api/recurring-templates/{template_id}", tags=["Recurring"])
-async def delete_recurring_template(template_id: str, db: Session = Depends(get_db_session)):
+def delete_recurring_template(template_id: str, db: Session = Depends(get_db_session)):
     """Delete a recurring template."""
-    existing = RecurringJournalEntryRepository.get_by_id(db, template_id)
-    if not existing:
+    if not RecurringJournalEntryRepository.delete(db, template_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-
-    RecurringJournalEntryRepository.delete(db, template_id)
     return {"message": f"Recurring template {template_id} deleted successfully"}
 
 
-@app.post("/api/recurring-templates/expand", response_model=List[JournalEntry], tags=["Recurring"])
-async def expand_recurring_templates(
-    start_date: str = Query(..., description="Start date (ISO format)"),
-    end_date: str = Query(..., description="End date (ISO format)"),
+@app.post(
+    "/api/recurring-templates/expand",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[JournalEntry]}},
+    tags=["Recurring"]
+)
+def expand_recurring_templates(
+    start_date: date = Query(..., description="Start date (ISO format)"),
+    end_date: date = Query(..., description="End date (ISO format)"),
     auto_post: bool = Query(False, description="Automatically post generated entries"),
     db: Session = Depends(get_db_session)
 ):
     """
     Expand all active recurring templates into journal entries for the specified date range.
     """
-    templates = RecurringJournalEntryRepository.get_all(db, active_only=True)
-    generated_entries = []
-
-    for template in templates:
-        entries = recurring_service.expand_recurring_entry(
-            template=template,
+    # One posting timestamp shared by every entry in this expansion
+    now = datetime.utcnow()
+    created_entries = []
+    pending_entries = []
+
+    # Stream active templates and expand them one batch at a time
+    for templates in RecurringJournalEntryRepository.iter_active_batches(db):
+        entries_by_template = recurring_service.expand_recurring_entries_by_template(
+            recurring_templates=templates,
             start_date=start_date,
             end_date=end_date
         )
+        auto_post_ids = {t.recurring_entry_id for t in templates if auto_post and t.auto_post}
+
+        for template_id, entries in entries_by_template.items():
+            if template_id in auto_post_ids:
+                for entry in entries:
+                    entry.status = JournalEntryStatus.POSTED
+                    entry.posted_at = now
 
-        for entry in entries:
-            # Set status based on auto_post
-            if auto_post and template.auto_post:
-                entry.status = JournalEntryStatus.POSTED
-                entry.posted_at = datetime.utcnow()
+            pending_entries.extend(entries)
 
-            # Save to database
-            created_entry = JournalEntryRepository.create(db, entry)
-            generated_entries.append(created_entry)
+        # Insert in chunks; everything is committed together below
+        if len(pending_entries) >= EXPAND_INSERT_BATCH_SIZE:
+            created_entries.extend(JournalEntryRepository.bulk_create(db, pending_entries, commit=False))
+            pending_entries = []
 
-    return generated_entries
+    created_entries.extend(JournalEntryRepository.bulk_create(db, pending_entries))
+    return ORJSONResponse([entry.model_dump(mode="json") for entry in created_entries])
 
 
 # ============================================================================
@@ -548,9 +700,9 @@ async def expand_recurring_templates(
 # ============================================================================
 
 @app.get("/api/forecast/account/{account_id}", tags=["Forecasting"])
-async def forecast_account(
+def forecast_account(
     account_id: str,
-    target_date: str = Query(..., description="Target date for forecast"),
+    target_date: date = Query(..., description="Target date for forecast"),
     db: Session = Depends(get_db_session)
 ):
     """
@@ -559,8 +711,6 @@ async def forecast_account(
     NOTE: This is a simplified implementation that returns current balance as projection.
     Full forecasting logic with recurring transactions needs to be implemented.
     """
-    from datetime import datetime
-
     # Get account details
     account = ChartOfAccountsRepository.get_by_id(db, account_id)
     if not account:
@@ -572,7 +722,7 @@ async def forecast_account(
     # For now, return current balance as projected balance
     # TODO: Implement actual forecasting logic with recurring transactions
     current_balance = account.current_balance
-    as_of_date = datetime.now().strftime("%Y-%m-%d")
+    as_of_date = date.today().isoformat()
 
     return {
         "account_id": account_id,
@@ -587,9 +737,9 @@ async def forecast_account(
 
 
 @app.get("/api/forecast/envelope/{envelope_id}", tags=["Forecasting"])
-async def forecast_envelope(
+def forecast_envelope(
     envelope_id: str,
-    target_date: str = Query(..., description="Target date for forecast"),
+    target_date: date = Query(..., description="Target date for forecast"),
     db: Session = Depends(get_db_session)
 ):
     """
@@ -598,40 +748,26 @@ async def forecast_envelope(
     NOTE: This is a simplified implementation that returns current balance as projection.
     Full forecasting logic with recurring transactions needs to be implemented.
     """
-    from datetime import datetime
-
-    # Try to get budget envelope first
-    budget_envelope = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
-    if budget_envelope:
-        return {
-            "envelope_id": envelope_id,
-            "envelope_name": budget_envelope.envelope_name,
-            "current_balance": budget_envelope.current_balance,
-            "as_of_date": datetime.now().strftime("%Y-%m-%d"),
-            "target_date": target_date,
-            "projected_balance": budget_envelope.current_balance,
-            "balance_change": 0.0,
-            "transactions_applied": 0
-        }
+    as_of_date = date.today().isoformat()
 
-    # Try payment envelope
-    payment_envelope = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
-    if payment_envelope:
-        return {
-            "envelope_id": envelope_id,
-            "envelope_name": payment_envelope.envelope_name,
-            "current_balance": payment_envelope.current_balance,
-            "as_of_date": datetime.now().strftime("%Y-%m-%d"),
-            "target_date": target_date,
-            "projected_balance": payment_envelope.current_balance,
-            "balance_change": 0.0,
-            "transactions_applied": 0
-        }
+    envelope = get_envelope_summary(db, envelope_id)
+    if not envelope:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Envelope {envelope_id} not found"
+        )
 
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Envelope {envelope_id} not found"
-    )
+    _, envelope_name, current_balance = envelope
+    return {
+        "envelope_id": envelope_id,
+        "envelope_name": envelope_name,
+        "current_balance": current_balance,
+        "as_of_date": as_of_date,
+        "target_date": target_date,
+        "projected_balance": current_balance,
+        "balance_change": 0.0,
+        "transactions_applied": 0
+    }
 
 
 # ============================================================================
@@ -639,12 +775,6 @@ async def forecast_envelope(
 # ============================================================================
 
 @app.get("/api/stats/summary", tags=["Statistics"])
-async def get_stats_summary(db: Session = Depends(get_db_session)):
+def get_stats_summary(db: Session = Depends(get_db_session)):
     """Get system statistics summary."""
-    return {
-        "accounts": len(ChartOfAccountsRepository.get_all(db)),
-        "journal_entries": len(JournalEntryRepository.get_all(db)),
-        "budget_envelopes": len(BudgetEnvelopeRepository.get_all(db)),
-        "payment_envelopes": len(PaymentEnvelopeRepository.get_all(db)),
-        "recurring_templates": len(RecurringJournalEntryRepository.get_all(db)),
-    }
+    return get_record_counts(db)
@@ -20,12 +20,23 @@ DATABASE_DIR.mkdir(exist_ok=True)
 DATABASE_PATH = DATABASE_DIR / "accounting.db"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
+# Connection pool sizing: the API runs sync handlers in a threadpool, so the
+# pool must cover concurrent requests or they queue on checkout
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 # Create engine with connection pooling for SQLite
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite with FastAPI
     echo=False,  # Set to True for SQL query logging
     pool_pre_ping=True,  # Verify connections before using
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
 )
 
 # Create session factory
@@ -38,6 +49,12 @@ def init_database():
     This should be called on application startup.
     """
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips existing tables, so add any indexes they are missing
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
     print(f"✅ Database initialized at: {DATABASE_PATH}")
 
 
@@ -7,7 +7,7 @@ All models map directly to the Pydantic models defined in models.py.
 
 from datetime import datetime
 from sqlalchemy import (
-    Column, String, Float, Integer, DateTime, Boolean, ForeignKey, Text, JSON, CheckConstraint
+    Column, String, Float, Integer, DateTime, Boolean, ForeignKey, Text, JSON, CheckConstraint, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -217,3 +217,29 @@ BudgetEnvelopeDB.__table_args__ = (
 RecurringJournalEntryDB.__table_args__ = (
     CheckConstraint("frequency IN ('daily', 'weekly', 'monthly', 'quarterly', 'yearly')", name="valid_frequency"),
 )
+
+# Partial indexes for the active-only list filters
+Index(
+    "idx_accounts_active_type",
+    ChartOfAccountsDB.account_type,
+    sqlite_where=ChartOfAccountsDB.is_active == True,
+    postgresql_where=ChartOfAccountsDB.is_active == True,
+)
+Index(
+    "idx_budget_envelopes_active",
+    BudgetEnvelopeDB.envelope_id,
+    sqlite_where=BudgetEnvelopeDB.is_active == True,
+    postgresql_where=BudgetEnvelopeDB.is_active == True,
+)
+Index(
+    "idx_payment_envelopes_active",
+    PaymentEnvelopeDB.envelope_id,
+    sqlite_where=PaymentEnvelopeDB.is_active == True,
+    postgresql_where=PaymentEnvelopeDB.is_active == True,
+)
+Index(
+    "idx_recurring_templates_active",
+    RecurringJournalEntryDB.recurring_entry_id,
+    sqlite_where=RecurringJournalEntryDB.is_active == True,
+    postgresql_where=RecurringJournalEntryDB.is_active == True,
+)
@@ -5,9 +5,9 @@ This module provides repository classes for CRUD operations on all entities.
 Repositories handle the conversion between Pydantic models and SQLAlchemy models.
 """
 
-from typing import List, Optional, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_, false, func, insert, literal, select, true, union_all, update
 from datetime import datetime, date
 
 from .models import (
@@ -15,9 +15,20 @@ from .models import (
     JournalEntryDB, DistributionDB, RecurringJournalEntryDB
 )
 from ..models.journal_entries import (
-    ChartOfAccounts, JournalEntry, Distribution, RecurringJournalEntry
+    ChartOfAccounts, JournalEntry, Distribution, RecurringJournalEntry, BulkStatusUpdate,
+    AccountType, FlowDirection, DebitCredit, DistributionStatus, JournalEntryType, JournalEntryStatus
 )
-from ..models.budget_envelopes import BudgetEnvelope, PaymentEnvelope
+from ..models.budget_envelopes import BudgetEnvelope, PaymentEnvelope, RolloverPolicy
+
+
+# Rows were validated on the way in, so read paths hydrate with
+# model_construct and only convert stored strings back to enums/dates.
+
+def _as_date(value) -> Optional[date]:
+    """Stored ISO date string (or date) -> date."""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
 
 
 # ============================================================================
@@ -64,36 +75,46 @@ class ChartOfAccountsRepository:
         if account_type:
             query = query.filter(ChartOfAccountsDB.account_type == account_type)
         if is_active is not None:
-            query = query.filter(ChartOfAccountsDB.is_active == is_active)
+            # Literal true/false (not a bound parameter) so the partial index applies
+            query = query.filter(ChartOfAccountsDB.is_active == (true() if is_active else false()))
 
         db_accounts = query.all()
         return [ChartOfAccountsRepository._to_pydantic(acc) for acc in db_accounts]
 
     @staticmethod
-    def update(db: Session, account_id: str, account: ChartOfAccounts) -> ChartOfAccounts:
-        """Update an existing account."""
-        db_account = db.query(ChartOfAccountsDB).filter(
-            ChartOfAccountsDB.account_id == account_id
-        ).first()
+    def update(db: Session, account_id: str, account: ChartOfAccounts) -> Optional[ChartOfAccounts]:
+        """
+        Update an existing account.
+
+        Runs a single UPDATE ... RETURNING; returns None if no row matched.
+        """
+        stmt = (
+            update(ChartOfAccountsDB)
+            .where(ChartOfAccountsDB.account_id == account_id)
+            .values(
+                account_name=account.account_name,
+                account_type=account.account_type,
+                account_subtype=account.account_subtype,
+                parent_account_id=account.parent_account_id,
+                description=account.description,
+                is_active=account.is_active,
+                current_balance=account.current_balance,
+                budget_envelope_id=account.budget_envelope_id,
+                payment_envelope_id=account.payment_envelope_id,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(ChartOfAccountsDB)
+        )
+        db_account = db.execute(stmt).scalar_one_or_none()
 
         if not db_account:
-            raise ValueError(f"Account {account_id} not found")
-
-        # Update fields
-        db_account.account_name = account.account_name
-        db_account.account_type = account.account_type
-        db_account.account_subtype = account.account_subtype
-        db_account.parent_account_id = account.parent_account_id
-        db_account.description = account.description
-        db_account.is_active = account.is_active
-        db_account.current_balance = account.current_balance
-        db_account.budget_envelope_id = account.budget_envelope_id
-        db_account.payment_envelope_id = account.payment_envelope_id
-        db_account.updated_at = datetime.utcnow()
+            db.rollback()
+            return None
 
+        # Convert before commit expires the returned row
+        updated_account = ChartOfAccountsRepository._to_pydantic(db_account)
         db.commit()
-        db.refresh(db_account)
-        return ChartOfAccountsRepository._to_pydantic(db_account)
+        return updated_account
 
     @staticmethod
     def update_balance(db: Session, account_id: str, new_balance: float):
@@ -108,24 +129,22 @@ class ChartOfAccountsRepository:
             db.commit()
 
     @staticmethod
-    def delete(db: Session, account_id: str):
-        """Delete an account."""
-        db_account = db.query(ChartOfAccountsDB).filter(
+    def delete(db: Session, account_id: str) -> bool:
+        """Delete an account. Returns False if it did not exist."""
+        deleted = db.query(ChartOfAccountsDB).filter(
             ChartOfAccountsDB.account_id == account_id
-        ).first()
-
-        if db_account:
-            db.delete(db_account)
-            db.commit()
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def _to_pydantic(db_account: ChartOfAccountsDB) -> ChartOfAccounts:
         """Convert SQLAlchemy model to Pydantic model."""
-        return ChartOfAccounts(
+        return ChartOfAccounts.model_construct(
             account_id=db_account.account_id,
             account_number=db_account.account_number,
             account_name=db_account.account_name,
-            account_type=db_account.account_type,
+            account_type=AccountType(db_account.account_type),
             account_subtype=db_account.account_subtype,
             parent_account_id=db_account.parent_account_id,
             description=db_account.description,
@@ -148,59 +167,53 @@ class JournalEntryRepository:
     @staticmethod
     def create(db: Session, entry: JournalEntry) -> JournalEntry:
         """Create a new journal entry with distributions."""
-        db_entry = JournalEntryDB(
-            journal_entry_id=entry.journal_entry_id,
-            entry_number=entry.entry_number,
-            entry_type=entry.entry_type,
-            entry_date=entry.entry_date,
-            posting_date=entry.posting_date,
-            description=entry.description,
-            memo=entry.memo,
-            notes=entry.notes,
-            source_document=entry.source_document,
-            transaction_id=entry.transaction_id,
-            recurring_entry_id=entry.recurring_entry_id,
-            reversed_entry_id=entry.reversed_entry_id,
-            category=entry.category,
-            tags=entry.tags or [],
-            status=entry.status,
-            created_by=entry.created_by,
-            approved_by=entry.approved_by,
-            approved_at=entry.approved_at,
-            posted_by=entry.posted_by,
-            posted_at=entry.posted_at,
-            revision_number=entry.revision_number,
-            previous_version_id=entry.previous_version_id,
-        )
+        db_entry = JournalEntryDB(**JournalEntryRepository._entry_values(entry))
         db.add(db_entry)
 
         # Add distributions
         for dist in entry.distributions:
-            db_dist = DistributionDB(
-                distribution_id=dist.distribution_id,
-                journal_entry_id=entry.journal_entry_id,
-                account_id=dist.account_id,
-                account_type=dist.account_type,
-                flow_direction=dist.flow_direction,
-                amount=dist.amount,
-                multiplier=dist.multiplier,
-                debit_credit=dist.debit_credit,
-                description=dist.description,
-                memo=dist.memo,
-                reference_id=dist.reference_id,
-                cost_center=dist.cost_center,
-                department=dist.department,
-                project_id=dist.project_id,
-                budget_envelope_id=dist.budget_envelope_id,
-                payment_envelope_id=dist.payment_envelope_id,
-                status=dist.status,
-            )
+            db_dist = DistributionDB(**JournalEntryRepository._distribution_values(entry.journal_entry_id, dist))
             db.add(db_dist)
 
         db.commit()
         db.refresh(db_entry)
         return JournalEntryRepository._to_pydantic(db_entry)
 
+    @staticmethod
+    def bulk_create(db: Session, entries: List[JournalEntry], commit: bool = True) -> List[JournalEntry]:
+        """
+        Create many journal entries with one executemany INSERT per table.
+
+        All entries and their distributions are written in a single
+        transaction. The entries' own created_at/updated_at are stored, so
+        the input models are returned as-is instead of re-reading the rows.
+        Pass commit=False to insert in chunks and commit with the last one.
+        """
+        entry_rows = []
+        distribution_rows = []
+        for entry in entries:
+            entry_rows.append({
+                **JournalEntryRepository._entry_values(entry),
+                "created_at": entry.created_at,
+                "updated_at": entry.updated_at,
+            })
+            for dist in entry.distributions:
+                distribution_rows.append({
+                    **JournalEntryRepository._distribution_values(entry.journal_entry_id, dist),
+                    "created_at": dist.created_at,
+                    "updated_at": dist.updated_at,
+                })
+
+        # render_nulls keeps None columns in every row, so rows are not split
+        # into separate INSERTs by which fields happen to be None
+        if entry_rows:
+            db.execute(insert(JournalEntryDB).execution_options(render_nulls=True), entry_rows)
+        if distribution_rows:
+            db.execute(insert(DistributionDB).execution_options(render_nulls=True), distribution_rows)
+        if commit:
+            db.commit()
+        return entries
+
     @staticmethod
     def get_by_id(db: Session, entry_id: str) -> Optional[JournalEntry]:
         """Get journal entry by ID."""
@@ -218,7 +231,8 @@ class JournalEntryRepository:
         limit: Optional[int] = None
     ) -> List[JournalEntry]:
         """Get all journal entries with optional filters."""
-        query = db.query(JournalEntryDB)
+        # Load every entry's distributions in one IN (...) query, not one per entry
+        query = db.query(JournalEntryDB).options(selectinload(JournalEntryDB.distributions))
 
         if start_date:
             query = query.filter(JournalEntryDB.entry_date >= start_date)
@@ -301,6 +315,44 @@ class JournalEntryRepository:
         db.refresh(db_entry)
         return JournalEntryRepository._to_pydantic(db_entry)
 
+    @staticmethod
+    def bulk_update_status(db: Session, updates: List[BulkStatusUpdate]) -> List[str]:
+        """
+        Set status/posting_date on many journal entries in one transaction.
+
+        Updates sharing the same target values are applied with a single
+        UPDATE ... WHERE journal_entry_id IN (...). Posted entries are never
+        changed here (un-posting must go through the envelope service), so
+        they are skipped along with ids that don't exist.
+
+        Returns:
+            Ids of the journal entries that were updated
+        """
+        ids_by_values: Dict[tuple, List[str]] = {}
+        for status_update in updates:
+            posting_date = status_update.posting_date.isoformat() if status_update.posting_date else None
+            ids_by_values.setdefault((status_update.status.value, posting_date), []).append(
+                status_update.journal_entry_id
+            )
+
+        updated_at = datetime.utcnow()
+        updated_ids: List[str] = []
+        for (status, posting_date), entry_ids in ids_by_values.items():
+            stmt = (
+                update(JournalEntryDB)
+                .where(
+                    JournalEntryDB.journal_entry_id.in_(entry_ids),
+                    JournalEntryDB.status != JournalEntryStatus.POSTED.value
+                )
+                .values(status=status, posting_date=posting_date, updated_at=updated_at)
+                .returning(JournalEntryDB.journal_entry_id)
+                .execution_options(synchronize_session=False)
+            )
+            updated_ids.extend(db.execute(stmt).scalars())
+
+        db.commit()
+        return updated_ids
+
     @staticmethod
     def delete(db: Session, entry_id: str):
         """Delete a journal entry and its distributions."""
@@ -312,18 +364,69 @@ class JournalEntryRepository:
             db.delete(db_entry)  # Cascade will delete distributions
             db.commit()
 
+    @staticmethod
+    def _entry_values(entry: JournalEntry) -> Dict:
+        """Column values for a journal entry row (timestamps left to the caller)."""
+        return {
+            "journal_entry_id": entry.journal_entry_id,
+            "entry_number": entry.entry_number,
+            "entry_type": entry.entry_type,
+            "entry_date": entry.entry_date,
+            "posting_date": entry.posting_date,
+            "description": entry.description,
+            "memo": entry.memo,
+            "notes": entry.notes,
+            "source_document": entry.source_document,
+            "transaction_id": entry.transaction_id,
+            "recurring_entry_id": entry.recurring_entry_id,
+            "reversed_entry_id": entry.reversed_entry_id,
+            "category": entry.category,
+            "tags": entry.tags or [],
+            "status": entry.status,
+            "created_by": entry.created_by,
+            "approved_by": entry.approved_by,
+            "approved_at": entry.approved_at,
+            "posted_by": entry.posted_by,
+            "posted_at": entry.posted_at,
+            "revision_number": entry.revision_number,
+            "previous_version_id": entry.previous_version_id,
+        }
+
+    @staticmethod
+    def _distribution_values(journal_entry_id: str, dist: Distribution) -> Dict:
+        """Column values for a distribution row (timestamps left to the caller)."""
+        return {
+            "distribution_id": dist.distribution_id,
+            "journal_entry_id": journal_entry_id,
+            "account_id": dist.account_id,
+            "account_type": dist.account_type,
+            "flow_direction": dist.flow_direction,
+            "amount": dist.amount,
+            "multiplier": dist.multiplier,
+            "debit_credit": dist.debit_credit,
+            "description": dist.description,
+            "memo": dist.memo,
+            "reference_id": dist.reference_id,
+            "cost_center": dist.cost_center,
+            "department": dist.department,
+            "project_id": dist.project_id,
+            "budget_envelope_id": dist.budget_envelope_id,
+            "payment_envelope_id": dist.payment_envelope_id,
+            "status": dist.status,
+        }
+
     @staticmethod
     def _to_pydantic(db_entry: JournalEntryDB) -> JournalEntry:
         """Convert SQLAlchemy model to Pydantic model."""
         distributions = [
-            Distribution(
+            Distribution.model_construct(
                 distribution_id=d.distribution_id,
                 account_id=d.account_id,
-                account_type=d.account_type,
-                flow_direction=d.flow_direction,
+                account_type=AccountType(d.account_type),
+                flow_direction=FlowDirection(d.flow_direction),
                 amount=d.amount,
                 multiplier=d.multiplier,
-                debit_credit=d.debit_credit,
+                debit_credit=DebitCredit(d.debit_credit),
                 description=d.description,
                 memo=d.memo,
                 reference_id=d.reference_id,
@@ -332,19 +435,19 @@ class JournalEntryRepository:
                 project_id=d.project_id,
                 budget_envelope_id=d.budget_envelope_id,
                 payment_envelope_id=d.payment_envelope_id,
-                status=d.status,
+                status=DistributionStatus(d.status),
                 created_at=d.created_at,
                 updated_at=d.updated_at,
             )
             for d in db_entry.distributions
         ]
 
-        return JournalEntry(
+        return JournalEntry.model_construct(
             journal_entry_id=db_entry.journal_entry_id,
             entry_number=db_entry.entry_number,
-            entry_type=db_entry.entry_type,
-            entry_date=db_entry.entry_date,
-            posting_date=db_entry.posting_date,
+            entry_type=JournalEntryType(db_entry.entry_type),
+            entry_date=_as_date(db_entry.entry_date),
+            posting_date=_as_date(db_entry.posting_date),
             distributions=distributions,
             description=db_entry.description,
             memo=db_entry.memo,
@@ -355,7 +458,7 @@ class JournalEntryRepository:
             reversed_entry_id=db_entry.reversed_entry_id,
             category=db_entry.category,
             tags=db_entry.tags or [],
-            status=db_entry.status,
+            status=JournalEntryStatus(db_entry.status),
             created_by=db_entry.created_by,
             approved_by=db_entry.approved_by,
             approved_at=db_entry.approved_at,
@@ -413,48 +516,55 @@ class BudgetEnvelopeRepository:
         return [BudgetEnvelopeRepository._to_pydantic(env) for env in db_envelopes]
 
     @staticmethod
-    def update(db: Session, envelope_id: str, envelope: BudgetEnvelope) -> BudgetEnvelope:
-        """Update a budget envelope."""
-        db_envelope = db.query(BudgetEnvelopeDB).filter(
-            BudgetEnvelopeDB.envelope_id == envelope_id
-        ).first()
+    def update(db: Session, envelope_id: str, envelope: BudgetEnvelope) -> Optional[BudgetEnvelope]:
+        """
+        Update a budget envelope.
+
+        Runs a single UPDATE ... RETURNING; returns None if no row matched.
+        """
+        stmt = (
+            update(BudgetEnvelopeDB)
+            .where(BudgetEnvelopeDB.envelope_id == envelope_id)
+            .values(
+                envelope_number=envelope.envelope_number,
+                envelope_name=envelope.envelope_name,
+                monthly_allocation=envelope.monthly_allocation,
+                rollover_policy=envelope.rollover_policy,
+                current_balance=envelope.current_balance,
+                is_active=envelope.is_active,
+                description=envelope.description,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(BudgetEnvelopeDB)
+        )
+        db_envelope = db.execute(stmt).scalar_one_or_none()
 
         if not db_envelope:
-            raise ValueError(f"Budget envelope {envelope_id} not found")
-
-        db_envelope.envelope_number = envelope.envelope_number
-        db_envelope.envelope_name = envelope.envelope_name
-        db_envelope.monthly_allocation = envelope.monthly_allocation
-        db_envelope.rollover_policy = envelope.rollover_policy
-        db_envelope.current_balance = envelope.current_balance
-        db_envelope.is_active = envelope.is_active
-        db_envelope.description = envelope.description
-        db_envelope.updated_at = datetime.utcnow()
+            db.rollback()
+            return None
 
+        updated_envelope = BudgetEnvelopeRepository._to_pydantic(db_envelope)
         db.commit()
-        db.refresh(db_envelope)
-        return BudgetEnvelopeRepository._to_pydantic(db_envelope)
+        return updated_envelope
 
     @staticmethod
-    def delete(db: Session, envelope_id: str):
-        """Delete a budget envelope."""
-        db_envelope = db.query(BudgetEnvelopeDB).filter(
+    def delete(db: Session, envelope_id: str) -> bool:
+        """Delete a budget envelope. Returns False if it did not exist."""
+        deleted = db.query(BudgetEnvelopeDB).filter(
             BudgetEnvelopeDB.envelope_id == envelope_id
-        ).first()
-
-        if db_envelope:
-            db.delete(db_envelope)
-            db.commit()
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def _to_pydantic(db_envelope: BudgetEnvelopeDB) -> BudgetEnvelope:
         """Convert SQLAlchemy model to Pydantic model."""
-        return BudgetEnvelope(
+        return BudgetEnvelope.model_construct(
             envelope_id=db_envelope.envelope_id,
             envelope_number=db_envelope.envelope_number,
             envelope_name=db_envelope.envelope_name,
             monthly_allocation=db_envelope.monthly_allocation,
-            rollover_policy=db_envelope.rollover_policy,
+            rollover_policy=RolloverPolicy(db_envelope.rollover_policy),
             current_balance=db_envelope.current_balance,
             is_active=db_envelope.is_active,
             description=db_envelope.description,
@@ -507,42 +617,49 @@ class PaymentEnvelopeRepository:
         return [PaymentEnvelopeRepository._to_pydantic(env) for env in db_envelopes]
 
     @staticmethod
-    def update(db: Session, envelope_id: str, envelope: PaymentEnvelope) -> PaymentEnvelope:
-        """Update a payment envelope."""
-        db_envelope = db.query(PaymentEnvelopeDB).filter(
-            PaymentEnvelopeDB.envelope_id == envelope_id
-        ).first()
+    def update(db: Session, envelope_id: str, envelope: PaymentEnvelope) -> Optional[PaymentEnvelope]:
+        """
+        Update a payment envelope.
+
+        Runs a single UPDATE ... RETURNING; returns None if no row matched.
+        """
+        stmt = (
+            update(PaymentEnvelopeDB)
+            .where(PaymentEnvelopeDB.envelope_id == envelope_id)
+            .values(
+                envelope_number=envelope.envelope_number,
+                envelope_name=envelope.envelope_name,
+                linked_account_id=envelope.linked_account_id,
+                current_balance=envelope.current_balance,
+                is_active=envelope.is_active,
+                description=envelope.description,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(PaymentEnvelopeDB)
+        )
+        db_envelope = db.execute(stmt).scalar_one_or_none()
 
         if not db_envelope:
-            raise ValueError(f"Payment envelope {envelope_id} not found")
-
-        db_envelope.envelope_number = envelope.envelope_number
-        db_envelope.envelope_name = envelope.envelope_name
-        db_envelope.linked_account_id = envelope.linked_account_id
-        db_envelope.current_balance = envelope.current_balance
-        db_envelope.is_active = envelope.is_active
-        db_envelope.description = envelope.description
-        db_envelope.updated_at = datetime.utcnow()
+            db.rollback()
+            return None
 
+        updated_envelope = PaymentEnvelopeRepository._to_pydantic(db_envelope)
         db.commit()
-        db.refresh(db_envelope)
-        return PaymentEnvelopeRepository._to_pydantic(db_envelope)
+        return updated_envelope
 
     @staticmethod
-    def delete(db: Session, envelope_id: str):
-        """Delete a payment envelope."""
-        db_envelope = db.query(PaymentEnvelopeDB).filter(
+    def delete(db: Session, envelope_id: str) -> bool:
+        """Delete a payment envelope. Returns False if it did not exist."""
+        deleted = db.query(PaymentEnvelopeDB).filter(
             PaymentEnvelopeDB.envelope_id == envelope_id
-        ).first()
-
-        if db_envelope:
-            db.delete(db_envelope)
-            db.commit()
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def _to_pydantic(db_envelope: PaymentEnvelopeDB) -> PaymentEnvelope:
         """Convert SQLAlchemy model to Pydantic model."""
-        return PaymentEnvelope(
+        return PaymentEnvelope.model_construct(
             envelope_id=db_envelope.envelope_id,
             envelope_number=db_envelope.envelope_number,
             envelope_name=db_envelope.envelope_name,
@@ -609,46 +726,93 @@ class RecurringJournalEntryRepository:
         return [RecurringJournalEntryRepository._to_pydantic(t) for t in db_templates]
 
     @staticmethod
-    def update(db: Session, template_id: str, template: RecurringJournalEntry) -> RecurringJournalEntry:
-        """Update a recurring template."""
-        db_template = db.query(RecurringJournalEntryDB).filter(
-            RecurringJournalEntryDB.recurring_entry_id == template_id
-        ).first()
+    def iter_active_batches(db: Session, batch_size: int = 100) -> Iterator[List[RecurringJournalEntry]]:
+        """
+        Stream active recurring templates in lists of up to batch_size.
+
+        Rows are fetched with yield_per, so the full template set is never
+        held in memory at once.
+        """
+        stmt = (
+            select(RecurringJournalEntryDB)
+            .where(RecurringJournalEntryDB.is_active == True)
+            .execution_options(yield_per=batch_size)
+        )
+        for db_templates in db.scalars(stmt).partitions():
+            yield [RecurringJournalEntryRepository._to_pydantic(t) for t in db_templates]
 
-        if not db_template:
-            raise ValueError(f"Recurring template {template_id} not found")
+    @staticmethod
+    def update(db: Session, template_id: str, template: RecurringJournalEntry) -> Optional[RecurringJournalEntry]:
+        """
+        Update a recurring template.
 
+        Runs a single UPDATE ... RETURNING; returns None if no row matched.
+        """
         distributions_json = [dist.dict() for dist in template.distributions]
 
-        db_template.template_name = template.template_name
-        db_template.description = template.description
-        db_template.entry_type = template.entry_type
-        db_template.frequency = template.frequency
-        db_template.start_date = template.start_date
-        db_template.end_date = template.end_date
-        db_template.last_generated_date = template.last_generated_date
-        db_template.is_active = template.is_active
-        db_template.auto_post = template.auto_post
-        db_template.distributions = distributions_json
-        db_template.category = template.category
-        db_template.tags = template.tags or []
-        db_template.notes = template.notes
-        db_template.updated_at = datetime.utcnow()
+        stmt = (
+            update(RecurringJournalEntryDB)
+            .where(RecurringJournalEntryDB.recurring_entry_id == template_id)
+            .values(
+                template_name=template.template_name,
+                description=template.description,
+                entry_type=template.entry_type,
+                frequency=template.frequency,
+                start_date=template.start_date,
+                end_date=template.end_date,
+                last_generated_date=template.last_generated_date,
+                is_active=template.is_active,
+                auto_post=template.auto_post,
+                distributions=distributions_json,
+                category=template.category,
+                tags=template.tags or [],
+                notes=template.notes,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(RecurringJournalEntryDB)
+        )
+        db_template = db.execute(stmt).scalar_one_or_none()
+
+        if not db_template:
+            db.rollback()
+            return None
 
+        updated_template = RecurringJournalEntryRepository._to_pydantic(db_template)
         db.commit()
-        db.refresh(db_template)
-        return RecurringJournalEntryRepository._to_pydantic(db_template)
+        return updated_template
 
     @staticmethod
-    def delete(db: Session, template_id: str):
-        """Delete a recurring template."""
-        db_template = db.query(RecurringJournalEntryDB).filter(
-            RecurringJournalEntryDB.recurring_entry_id == template_id
-        ).first()
+    def toggle_active(db: Session, template_id: str) -> Optional[RecurringJournalEntry]:
+        """
+        Flip a recurring template's is_active flag.
+
+        Runs a single UPDATE ... SET is_active = NOT is_active ... RETURNING,
+        so concurrent toggles cannot lose an update; returns None if no row matched.
+        """
+        stmt = (
+            update(RecurringJournalEntryDB)
+            .where(RecurringJournalEntryDB.recurring_entry_id == template_id)
+            .values(is_active=~RecurringJournalEntryDB.is_active, updated_at=datetime.utcnow())
+            .returning(RecurringJournalEntryDB)
+        )
+        db_template = db.execute(stmt).scalar_one_or_none()
 
-        if db_template:
-            db.delete(db_template)
-            db.commit()
+        if not db_template:
+            db.rollback()
+            return None
+
+        toggled_template = RecurringJournalEntryRepository._to_pydantic(db_template)
+        db.commit()
+        return toggled_template
+
+    @staticmethod
+    def delete(db: Session, template_id: str) -> bool:
+        """Delete a recurring template. Returns False if it did not exist."""
+        deleted = db.query(RecurringJournalEntryDB).filter(
+            RecurringJournalEntryDB.recurring_entry_id == template_id
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def _to_pydantic(db_template: RecurringJournalEntryDB) -> RecurringJournalEntry:
@@ -674,3 +838,57 @@ class RecurringJournalEntryRepository:
             created_at=db_template.created_at,
             updated_at=db_template.updated_at,
         )
+
+
+# ============================================================================
+# ENVELOPE LOOKUP (BUDGET OR PAYMENT)
+# ============================================================================
+
+def get_envelope_summary(db: Session, envelope_id: str) -> Optional[Tuple[str, str, float]]:
+    """
+    Look up an envelope ID in both envelope tables with one UNION ALL query.
+
+    Returns:
+        (kind, envelope_name, current_balance) where kind is "budget" or
+        "payment" (budget wins if both match), or None if neither has it
+    """
+    stmt = union_all(
+        select(
+            literal("budget").label("kind"),
+            BudgetEnvelopeDB.envelope_name,
+            BudgetEnvelopeDB.current_balance,
+        ).where(BudgetEnvelopeDB.envelope_id == envelope_id),
+        select(
+            literal("payment").label("kind"),
+            PaymentEnvelopeDB.envelope_name,
+            PaymentEnvelopeDB.current_balance,
+        ).where(PaymentEnvelopeDB.envelope_id == envelope_id),
+    ).order_by("kind").limit(1)
+
+    row = db.execute(stmt).first()
+    return tuple(row) if row else None
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+def get_record_counts(db: Session) -> Dict[str, int]:
+    """
+    Count rows in each accounting table with a single query.
+
+    Each count is a scalar subquery in one SELECT, so the database does the
+    aggregation and only five integers come back.
+    """
+    tables = {
+        "accounts": ChartOfAccountsDB,
+        "journal_entries": JournalEntryDB,
+        "budget_envelopes": BudgetEnvelopeDB,
+        "payment_envelopes": PaymentEnvelopeDB,
+        "recurring_templates": RecurringJournalEntryDB,
+    }
+    stmt = select(*(
+        select(func.count()).select_from(model).scalar_subquery().label(name)
+        for name, model in tables.items()
+    ))
+    return dict(db.execute(stmt).one()._mapping)
@@ -52,7 +52,7 @@ EXAMPLES:
 import uuid
 from datetime import datetime, date
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field, validator
 
 
@@ -308,6 +308,16 @@ class JournalEntry(BaseModel):
     revision_number: int = 1
     previous_version_id: Optional[str] = None
 
+    def balance_totals(self) -> Tuple[float, float]:
+        """Get the (FROM total, TO total) of the distributions in one pass."""
+        from_total = to_total = 0.0
+        for d in self.distributions:
+            if d.flow_direction == FlowDirection.FROM:
+                from_total += d.amount
+            elif d.flow_direction == FlowDirection.TO:
+                to_total += d.amount
+        return from_total, to_total
+
     def is_balanced(self) -> bool:
         """
         Check if the journal entry is balanced.
@@ -317,8 +327,7 @@ class JournalEntry(BaseModel):
 
         This ensures every dollar flowing OUT has a corresponding dollar flowing IN.
         """
-        from_total = sum(d.amount for d in self.distributions if d.flow_direction == FlowDirection.FROM)
-        to_total = sum(d.amount for d in self.distributions if d.flow_direction == FlowDirection.TO)
+        from_total, to_total = self.balance_totals()
 
         # Allow for floating point precision issues
         return abs(from_total - to_total) < 0.01
@@ -329,8 +338,7 @@ class JournalEntry(BaseModel):
 
         Should be 0 if balanced (FROM total - TO total = 0).
         """
-        from_total = sum(d.amount for d in self.distributions if d.flow_direction == FlowDirection.FROM)
-        to_total = sum(d.amount for d in self.distributions if d.flow_direction == FlowDirection.TO)
+        from_total, to_total = self.balance_totals()
         return from_total - to_total
 
     def get_from_distributions(self) -> List[Distribution]:
@@ -510,6 +518,13 @@ class JournalEntry(BaseModel):
         }
 
 
+class BulkStatusUpdate(BaseModel):
+    """Status change for one journal entry in a bulk status update."""
+    journal_entry_id: str
+    status: JournalEntryStatus
+    posting_date: Optional[date] = None
+
+
 class ChartOfAccounts(BaseModel):
     """
     Chart of Accounts entry.
@@ -5,9 +5,16 @@ Expands recurring journal entry templates into actual journal entries
 for forecasting and automated transaction creation.
 """
 
+import sys
+import uuid
 from datetime import date, timedelta
-from typing import List, Optional, Dict
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Dict
 from calendar import monthrange
+from itertools import chain
+
+import numpy as np
 
 # Handle relativedelta import
 try:
@@ -45,10 +52,122 @@ from ..models.journal_entries import (
     JournalEntryType,
     JournalEntryStatus,
     AccountType,
-    FlowDirection
+    FlowDirection,
+    DebitCredit
 )
 
 
+# Compiled entry builders kept, least recently used dropped first
+BUILDER_CACHE_SIZE = 1024
+
+# Names the generated builder source may reference
+_BUILDER_NAMESPACE = {
+    'JournalEntry': JournalEntry,
+    'Distribution': Distribution,
+    'JournalEntryType': JournalEntryType,
+    'JournalEntryStatus': JournalEntryStatus,
+    'AccountType': AccountType,
+    'FlowDirection': FlowDirection,
+    'DebitCredit': DebitCredit,
+    'uuid4': uuid.uuid4,
+}
+
+
+def _intern(value: Any) -> Any:
+    """Intern repeating strings such as account IDs; other values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _literal(value: Any) -> str:
+    """Render a validated field value as Python source for a builder."""
+    if isinstance(value, Enum) and type(value).__name__ in _BUILDER_NAMESPACE:
+        return f"{type(value).__name__}.{value.name}"
+    if value is None or isinstance(value, (str, bool, int)):
+        return repr(value)
+    if isinstance(value, float) and value == value and abs(value) != float('inf'):
+        return repr(value)
+    raise TypeError(f"Cannot embed {type(value).__name__} value in entry builder")
+
+
+@lru_cache(maxsize=BUILDER_CACHE_SIZE)
+def _compile_builder(src: str, recurring_entry_id: str) -> Callable[[date, bool], JournalEntry]:
+    """Compile generated builder source into its build function."""
+    namespace = dict(_BUILDER_NAMESPACE)
+    exec(compile(src, f"<entry builder {recurring_entry_id}>", "exec"), namespace)
+    return namespace['build']
+
+
+def _make_builder(
+    template: RecurringJournalEntry,
+    distribution_defaults: List[Dict[str, Any]]
+) -> Callable[[date, bool], JournalEntry]:
+    """
+    Compile a function that creates one journal entry for a template.
+
+    The template's validated fields are baked into the generated source as
+    literals, so each occurrence is a single call with no per-field lookups.
+    Compiled builders are cached by source in a bounded LRU cache.
+
+    Args:
+        template: Recurring journal entry template
+        distribution_defaults: Validated fields from build_distribution_defaults
+
+    Returns:
+        build(occurrence_date, is_posted) -> JournalEntry
+    """
+    distributions = ",\n".join(
+        "            Distribution.model_construct(distribution_id=str(uuid4()), "
+        + ", ".join(f"{name}={_literal(value)}" for name, value in fields.items())
+        + ")"
+        for fields in distribution_defaults
+    )
+    tags = ", ".join(_literal(tag) for tag in template.tags)
+    src = (
+        "def build(occurrence_date, is_posted):\n"
+        "    return JournalEntry.model_construct(\n"
+        "        entry_date=occurrence_date,\n"
+        "        posting_date=occurrence_date if is_posted else None,\n"
+        f"        description={_literal(template.description)},\n"
+        f"        distributions=[\n{distributions}\n        ],\n"
+        "        entry_type=JournalEntryType.RECURRING,\n"
+        "        status=JournalEntryStatus.POSTED if is_posted else JournalEntryStatus.DRAFT,\n"
+        f"        recurring_entry_id={_literal(template.recurring_entry_id)},\n"
+        f"        notes={_literal('Auto-generated from template: ' + template.template_name)},\n"
+        f"        tags=[{tags}],\n"
+        "    )\n"
+    )
+
+    return _compile_builder(src, template.recurring_entry_id)
+
+
+def _unbalanced_error(distribution_defaults: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the posting error for unbalanced distributions, or None."""
+    from_total = sum(d['amount'] for d in distribution_defaults if d['flow_direction'] == FlowDirection.FROM)
+    to_total = sum(d['amount'] for d in distribution_defaults if d['flow_direction'] == FlowDirection.TO)
+    if abs(from_total - to_total) >= 0.01:
+        return (
+            f"Cannot post unbalanced journal entry. "
+            f"FROM total: ${from_total:.2f}, TO total: ${to_total:.2f}. "
+            f"Difference: ${abs(from_total - to_total):.2f}"
+        )
+    return None
+
+# Fixed-length recurrence steps, in days per interval
+DAY_STEPS = {
+    RecurrenceFrequency.DAILY: 1,
+    RecurrenceFrequency.WEEKLY: 7,
+    RecurrenceFrequency.BIWEEKLY: 14,
+}
+
+# Calendar-month recurrence steps, in months per interval
+MONTH_STEPS = {
+    RecurrenceFrequency.MONTHLY: 1,
+    RecurrenceFrequency.QUARTERLY: 3,
+    RecurrenceFrequency.SEMIANNUALLY: 6,
+    RecurrenceFrequency.ANNUALLY: 12,
+}
+
+
 class RecurringTransactionService:
     """
     Service for expanding recurring transaction templates into actual transactions.
@@ -80,7 +199,35 @@ class RecurringTransactionService:
         Returns:
             List of generated journal entries sorted by entry_date
         """
-        all_entries = []
+        entries_by_template = self.expand_recurring_entries_by_template(
+            recurring_templates=recurring_templates,
+            start_date=start_date,
+            end_date=end_date,
+            auto_post=auto_post
+        )
+
+        return self.merge_expanded_entries(entries_by_template)
+
+    def expand_recurring_entries_by_template(
+        self,
+        recurring_templates: List[RecurringJournalEntry],
+        start_date: date,
+        end_date: date,
+        auto_post: bool = False
+    ) -> Dict[str, List[JournalEntry]]:
+        """
+        Expand all recurring templates, keeping each template's entries separate.
+
+        Args:
+            recurring_templates: List of recurring journal entry templates
+            start_date: Start date for expansion
+            end_date: End date for expansion
+            auto_post: Whether to mark generated entries as POSTED
+
+        Returns:
+            Dict of recurring_entry_id to that template's entries, in template order
+        """
+        entries_by_template = {}
 
         for template in recurring_templates:
             if not template.is_active:
@@ -92,13 +239,51 @@ class RecurringTransactionService:
                 end_date=end_date,
                 auto_post=auto_post
             )
-            all_entries.extend(entries)
+            entries_by_template.setdefault(template.recurring_entry_id, []).extend(entries)
+
+        return entries_by_template
+
+    @staticmethod
+    def merge_expanded_entries(
+        entries_by_template: Dict[str, List[JournalEntry]]
+    ) -> List[JournalEntry]:
+        """
+        Flatten per-template expansions into one list sorted by entry_date.
+
+        Args:
+            entries_by_template: Result of expand_recurring_entries_by_template
+
+        Returns:
+            List of journal entries sorted by entry_date
+        """
+        all_entries = list(chain.from_iterable(entries_by_template.values()))
 
         # Sort by entry date
         all_entries.sort(key=lambda e: e.entry_date)
 
         return all_entries
 
+    def bulk_post(
+        self,
+        entries: List[JournalEntry],
+        ledger: Dict[str, JournalEntry]
+    ) -> List[JournalEntry]:
+        """
+        Post a batch of generated journal entries into a keyed ledger.
+
+        The batch is stored with one dict.update rather than entry-by-entry
+        assignment.
+
+        Args:
+            entries: Journal entries to post
+            ledger: Storage keyed by journal_entry_id
+
+        Returns:
+            The posted journal entries
+        """
+        ledger.update((entry.journal_entry_id, entry) for entry in entries)
+        return entries
+
     def expand_single_template(
         self,
         template: RecurringJournalEntry,
@@ -126,14 +311,18 @@ class RecurringTransactionService:
         )
 
         # Generate journal entries for each occurrence
+        distribution_defaults = self.build_distribution_defaults(template)
+        build_entry = _make_builder(template, distribution_defaults)
+        unbalanced_error = _unbalanced_error(distribution_defaults)
+
+        # Posted if today or in the past, Draft if future
+        today = date.today()
         entries = []
         for occurrence_date in occurrence_dates:
-            entry = self.create_journal_entry_from_template(
-                template=template,
-                occurrence_date=occurrence_date,
-                auto_post=auto_post or template.auto_post
-            )
-            entries.append(entry)
+            is_posted = occurrence_date <= today
+            if is_posted and unbalanced_error:
+                raise ValueError(unbalanced_error)
+            entries.append(build_entry(occurrence_date, is_posted))
 
         return entries
 
@@ -154,8 +343,6 @@ class RecurringTransactionService:
         Returns:
             List of occurrence dates
         """
-        occurrence_dates = []
-
         # Start from template start_date or range start_date, whichever is later
         current_date = max(template.start_date, start_date)
 
@@ -164,31 +351,76 @@ class RecurringTransactionService:
         if template.end_date:
             final_date = min(template.end_date, end_date)
 
-        occurrence_count = 0
-
-        while current_date <= final_date:
-            # Check if we've hit occurrence limit
-            if template.end_after_occurrences:
-                if occurrence_count >= template.end_after_occurrences:
-                    break
-
-            # Add this occurrence
-            occurrence_dates.append(current_date)
-            occurrence_count += 1
-
-            # Calculate next occurrence
-            current_date = self.calculate_next_occurrence(
-                current_date=current_date,
-                frequency=template.frequency,
-                interval=template.interval,
-                day_of_month=template.day_of_month,
-                day_of_week=template.day_of_week,
-                month_of_quarter=template.month_of_quarter,
-                month_of_year=template.month_of_year
-            )
+        if current_date > final_date:
+            return []
+
+        occurrence_dates = self._occurrence_date_array(
+            template=template,
+            first_date=current_date,
+            final_date=final_date
+        ).tolist()
+
+        # Check if we've hit occurrence limit
+        if template.end_after_occurrences:
+            occurrence_dates = occurrence_dates[:template.end_after_occurrences]
 
         return occurrence_dates
 
+    def _occurrence_date_array(
+        self,
+        template: RecurringJournalEntry,
+        first_date: date,
+        final_date: date
+    ) -> np.ndarray:
+        """
+        Generate all occurrence dates from first_date through final_date at once.
+
+        Produces the same sequence as repeatedly applying
+        calculate_next_occurrence, but with NumPy datetime64 arithmetic
+        instead of per-occurrence Python date math.
+
+        Args:
+            template: Recurring journal entry template
+            first_date: First occurrence date
+            final_date: Last date an occurrence may fall on
+
+        Returns:
+            Array of occurrence dates (datetime64[D])
+        """
+        frequency = template.frequency
+        first_day = np.datetime64(first_date, 'D')
+        last_day = np.datetime64(final_date, 'D')
+
+        if frequency in DAY_STEPS:
+            return np.arange(first_day, last_day + 1, DAY_STEPS[frequency] * template.interval)
+
+        if frequency not in MONTH_STEPS:
+            raise ValueError(f"Unsupported frequency: {frequency}")
+
+        # Step through calendar months; annual templates moved onto
+        # month_of_year may land up to 11 months before their base month
+        first_month = np.datetime64(first_date, 'M')
+        last_month = np.datetime64(final_date, 'M')
+        if frequency == RecurrenceFrequency.ANNUALLY:
+            last_month += 12
+        months = np.arange(first_month, last_month + 1, MONTH_STEPS[frequency] * template.interval)
+        if frequency == RecurrenceFrequency.ANNUALLY and template.month_of_year:
+            months[1:] += template.month_of_year - first_date.month
+
+        # Later occurrences land on day_of_month, clamped to the month
+        # length; without it the start day carries forward, shrinking
+        # whenever a shorter month clamps it
+        month_starts = months.astype('datetime64[D]')
+        days_in_month = ((months + 1).astype('datetime64[D]') - month_starts).astype(np.int64)
+        if template.day_of_month:
+            days = np.minimum(template.day_of_month, days_in_month)
+        else:
+            days = np.minimum.accumulate(np.minimum(first_date.day, days_in_month))
+        days[0] = first_date.day
+
+        occurrences = month_starts + (days - 1)
+        return occurrences[occurrences <= last_day]
+
     def calculate_next_occurrence(
         self,
         current_date: date,
@@ -253,25 +485,24 @@ class RecurringTransactionService:
         else:
             raise ValueError(f"Unsupported frequency: {frequency}")
 
-    def create_journal_entry_from_template(
+    def build_distribution_defaults(
         self,
-        template: RecurringJournalEntry,
-        occurrence_date: date,
-        auto_post: bool = False
-    ) -> JournalEntry:
+        template: RecurringJournalEntry
+    ) -> List[Dict[str, Any]]:
         """
-        Create a journal entry from a recurring template for a specific date.
+        Resolve and validate a template's distributions once.
+
+        Every occurrence of a template shares the same distribution fields,
+        so they are validated here a single time and later occurrences are
+        created with model_construct from the returned values.
 
         Args:
             template: Recurring journal entry template
-            occurrence_date: Date for this occurrence
-            auto_post: Whether to mark as POSTED
 
         Returns:
-            Generated journal entry
+            List of Distribution field dicts (without distribution_id)
         """
-        # Create distributions from template
-        distributions = []
+        distribution_defaults = []
         for dist_template in template.distribution_template:
             account_type = AccountType(dist_template['account_type'])
             flow_direction = FlowDirection(dist_template['flow_direction'])
@@ -282,7 +513,6 @@ class RecurringTransactionService:
             ))
 
             # Calculate debit_credit indicator
-            from ..models.journal_entries import DebitCredit
             if account_type in [AccountType.ASSET, AccountType.EXPENSE]:
                 # Normal debit balance accounts
                 debit_credit = DebitCredit.DEBIT if multiplier == 1 else DebitCredit.CREDIT
@@ -290,27 +520,70 @@ class RecurringTransactionService:
                 # Normal credit balance accounts (LIABILITY, EQUITY, REVENUE)
                 debit_credit = DebitCredit.CREDIT if multiplier == 1 else DebitCredit.DEBIT
 
-            distribution = Distribution(
-                account_id=dist_template['account_id'],
-                account_type=account_type,
-                flow_direction=flow_direction,
-                amount=dist_template['amount'],
-                multiplier=multiplier,
-                debit_credit=debit_credit,
-                description=dist_template.get('description'),
-                budget_envelope_id=dist_template.get('budget_envelope_id'),
-                payment_envelope_id=dist_template.get('payment_envelope_id'),
-                reference_id=dist_template.get('reference_id')
-            )
-            distributions.append(distribution)
+            fields = {
+                'account_id': _intern(dist_template['account_id']),
+                'account_type': account_type,
+                'flow_direction': flow_direction,
+                'amount': dist_template['amount'],
+                'multiplier': multiplier,
+                'debit_credit': debit_credit,
+                'description': dist_template.get('description'),
+                'budget_envelope_id': dist_template.get('budget_envelope_id'),
+                'payment_envelope_id': dist_template.get('payment_envelope_id'),
+                'reference_id': dist_template.get('reference_id')
+            }
+
+            # Full validation once per template; keep the coerced values
+            validated = Distribution(**fields)
+            distribution_defaults.append({name: getattr(validated, name) for name in fields})
+
+        if len(distribution_defaults) < 2:
+            raise ValueError("Journal entry must have at least 2 distributions")
+
+        return distribution_defaults
+
+    def create_journal_entry_from_template(
+        self,
+        template: RecurringJournalEntry,
+        occurrence_date: date,
+        auto_post: bool = False,
+        distribution_defaults: Optional[List[Dict[str, Any]]] = None
+    ) -> JournalEntry:
+        """
+        Create a journal entry from a recurring template for a specific date.
+
+        Args:
+            template: Recurring journal entry template
+            occurrence_date: Date for this occurrence
+            auto_post: Whether to mark as POSTED
+            distribution_defaults: Pre-validated distribution fields from
+                build_distribution_defaults (built from the template if omitted)
+
+        Returns:
+            Generated journal entry
+        """
+        if distribution_defaults is None:
+            distribution_defaults = self.build_distribution_defaults(template)
+
+        # Create distributions from the validated template fields
+        distributions = [
+            Distribution.model_construct(distribution_id=str(uuid.uuid4()), **fields)
+            for fields in distribution_defaults
+        ]
 
         # Determine status based on occurrence date
         # Posted if today or in the past, Draft if future
         today = date.today()
         is_posted = occurrence_date <= today
 
-        # Create journal entry
-        entry = JournalEntry(
+        # Ensure entry is balanced before allowing it to be posted
+        if is_posted:
+            unbalanced_error = _unbalanced_error(distribution_defaults)
+            if unbalanced_error:
+                raise ValueError(unbalanced_error)
+
+        # Create journal entry (fields already validated above)
+        entry = JournalEntry.model_construct(
             entry_date=occurrence_date,
             posting_date=occurrence_date if is_posted else None,
             description=template.description,
@@ -319,7 +592,7 @@ class RecurringTransactionService:
             status=JournalEntryStatus.POSTED if is_posted else JournalEntryStatus.DRAFT,
             recurring_entry_id=template.recurring_entry_id,
             notes=f"Auto-generated from template: {template.template_name}",
-            tags=template.tags
+            tags=list(template.tags)
         )
 
         return entry
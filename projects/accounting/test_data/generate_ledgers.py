@@ -6,10 +6,21 @@ Reads the transaction dataset and creates:
 2. AccountBalance summaries (monthly summaries per account)
 """
 
-import json
-from datetime import datetime, date
-from collections import defaultdict
-from typing import Dict, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+import orjson
+
+# ijson is only needed to stream very large datasets
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Import models
 import sys
@@ -22,49 +33,166 @@ from projects.accounting.models.journal_entries import (
 )
 
 
+# Datasets larger than this are streamed with ijson instead of parsed whole
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
 def load_dataset(file_path: str) -> Dict:
     """Load the transaction dataset."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def load_chart_of_accounts(file_path: str) -> List[Dict]:
+    """Stream just the chart of accounts out of a dataset file."""
+    with open(file_path, 'rb') as f:
+        return list(ijson.items(f, 'chart_of_accounts.item', use_float=True))
+
+
+def iter_transactions(file_path: str) -> Iterator[Dict]:
+    """Stream transactions from a dataset file without loading the whole document."""
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, 'transactions.item', use_float=True)
+
+
+def to_cents(amount: float) -> int:
+    """Convert a dollar amount to integer cents."""
+    return int(round(amount * 100))
+
 
+@dataclass
+class LedgerColumns:
+    """
+    Account ledger stored column-wise (Structure-of-Arrays).
 
-def generate_account_ledgers(dataset: Dict) -> List[Dict]:
+    Each attribute is a NumPy array holding one ledger field for every entry,
+    so the numeric columns used by the monthly analytics can be reduced in
+    bulk. Monetary columns hold integer cents so sums and running balances
+    stay exact; they are converted back to dollars, and entries materialized
+    back into dicts, only by ``to_records`` when the ledger is written out.
+    """
+    ledger_entry_id: np.ndarray
+    account_id: np.ndarray
+    account_number: np.ndarray
+    account_name: np.ndarray
+    account_type: np.ndarray
+    journal_entry_id: np.ndarray
+    distribution_id: np.ndarray
+    entry_number: np.ndarray
+    transaction_date: np.ndarray  # datetime64[D]
+    posting_date: np.ndarray
+    description: np.ndarray
+    reference: np.ndarray
+    flow_direction: np.ndarray  # U4
+    amount: np.ndarray
+    debit_credit: np.ndarray
+    debit_amount: np.ndarray
+    credit_amount: np.ndarray
+    multiplier: np.ndarray
+    balance_impact: np.ndarray
+    balance_before: np.ndarray
+    balance_after: np.ndarray
+    posted_at: np.ndarray
+    created_at: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    MONEY_FIELDS = (
+        'amount', 'debit_amount', 'credit_amount',
+        'balance_impact', 'balance_before', 'balance_after'
+    )
+
+    @classmethod
+    def from_lists(cls, columns: Dict[str, list]) -> "LedgerColumns":
+        """Build the column arrays from per-field Python lists."""
+        arrays = {}
+        for f in fields(cls):
+            values = columns[f.name]
+            if f.name in cls.MONEY_FIELDS:
+                arrays[f.name] = np.array(values, dtype=np.int64)
+            elif f.name == 'multiplier':
+                arrays[f.name] = np.array(values, dtype=np.int8)
+            elif f.name == 'transaction_date':
+                arrays[f.name] = np.array(values, dtype='datetime64[D]')
+            elif f.name == 'flow_direction':
+                arrays[f.name] = np.array(values, dtype='U4')
+            else:
+                arrays[f.name] = np.array(values, dtype=object)
+        return cls(**arrays)
+
+    def take(self, indices: np.ndarray) -> "LedgerColumns":
+        """Return a ledger with every column reordered by ``indices``."""
+        return type(self)(**{f.name: getattr(self, f.name)[indices] for f in fields(self)})
+
+    def to_records(self) -> List[Dict]:
+        """Materialize the ledger as a list of AccountLedger dicts."""
+        names = [f.name for f in fields(self)]
+        columns = []
+        for name in names:
+            column = getattr(self, name)
+            if name == 'transaction_date':
+                column = np.datetime_as_string(column, unit='D')
+            elif name in self.MONEY_FIELDS:
+                column = column / 100.0
+            columns.append(column.tolist())
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def generate_account_ledgers(
+    transactions: Iterable[Dict],
+    chart_of_accounts: List[Dict]
+) -> LedgerColumns:
     """
     Generate AccountLedger entries from transactions.
 
     Each distribution creates one ledger entry showing the running balance.
+    Entries are accumulated column by column and returned as ``LedgerColumns``.
+    ``transactions`` may be a list or a stream from ``iter_transactions``.
+
+    Entries are returned ordered by (account, transaction date) so that the
+    monthly balances can be grouped without sorting again.
     """
-    ledger_entries = []
+    columns = {f.name: [] for f in fields(LedgerColumns)}
     account_balances = {}  # Track current balance per account
 
-    # Initialize account balances with opening balances
-    for account in dataset['chart_of_accounts']:
-        account_balances[account['account_id']] = account['opening_balance']
+    # Index chart of accounts by ID and initialize opening balances
+    accounts = {}
+    for account in chart_of_accounts:
+        accounts[account['account_id']] = account
+        account_balances[account['account_id']] = to_cents(account['opening_balance'])
 
     # Sort transactions by date
-    transactions = sorted(dataset['transactions'], key=lambda x: x['entry_date'])
+    transactions = sorted(transactions, key=itemgetter('entry_date'))
+    now_iso = datetime.utcnow().isoformat()
 
     # Process each transaction
     for txn in transactions:
+        # Transaction-level values shared by every distribution
+        txn_je_id = txn['journal_entry_id']
+        txn_entry_number = txn['entry_number']
+        txn_entry_date = txn['entry_date']
+        txn_posting_date = txn.get('posting_date', txn_entry_date)
+        txn_description = txn['description']
+        txn_created_at = txn.get('created_at', now_iso)
+
         # Process each distribution in the transaction
         for dist in txn['distributions']:
             account_id = dist['account_id']
 
             # Get account info from chart of accounts
-            account_info = next(
-                (acc for acc in dataset['chart_of_accounts'] if acc['account_id'] == account_id),
-                None
-            )
+            account_info = accounts.get(account_id)
 
             if not account_info:
                 print(f"Warning: Account {account_id} not found in chart of accounts")
                 continue
 
             # Get current balance
-            balance_before = account_balances.get(account_id, 0.0)
+            balance_before = account_balances.get(account_id, 0)
 
             # Calculate balance impact
-            balance_impact = dist['amount'] * dist['multiplier']
+            amount = to_cents(dist['amount'])
+            balance_impact = amount * dist['multiplier']
             balance_after = balance_before + balance_impact
 
             # Calculate debit/credit indicator
@@ -79,125 +207,134 @@ def generate_account_ledgers(dataset: Dict) -> List[Dict]:
 
             # Determine debit/credit amounts
             if debit_credit == 'Dr':
-                debit_amount = dist['amount']
-                credit_amount = 0.0
+                debit_amount = amount
+                credit_amount = 0
             else:
-                debit_amount = 0.0
-                credit_amount = dist['amount']
-
-            # Create ledger entry
-            ledger_entry = {
-                "ledger_entry_id": f"ledger-{txn['journal_entry_id']}-{dist.get('distribution_id', len(ledger_entries))}",
-                "account_id": account_id,
-                "account_number": account_info['account_number'],
-                "account_name": account_info['account_name'],
-                "account_type": dist['account_type'],
-                "journal_entry_id": txn['journal_entry_id'],
-                "distribution_id": dist.get('distribution_id', f"dist-{len(ledger_entries)}"),
-                "entry_number": txn['entry_number'],
-                "transaction_date": txn['entry_date'],
-                "posting_date": txn.get('posting_date', txn['entry_date']),
-                "description": dist.get('description', txn['description']),
-                "reference": dist.get('reference_id'),
-                "flow_direction": dist['flow_direction'],
-                "amount": dist['amount'],
-                "debit_credit": debit_credit,
-                "debit_amount": debit_amount,
-                "credit_amount": credit_amount,
-                "multiplier": dist['multiplier'],
-                "balance_impact": balance_impact,
-                "balance_before": balance_before,
-                "balance_after": balance_after,
-                "posted_at": txn.get('created_at', datetime.utcnow().isoformat()),
-                "created_at": txn.get('created_at', datetime.utcnow().isoformat())
-            }
-
-            ledger_entries.append(ledger_entry)
+                debit_amount = 0
+                credit_amount = amount
+
+            # Append ledger entry columns
+            distribution_id = dist.get('distribution_id')
+            if distribution_id is None:
+                entry_index = str(len(columns['amount']))
+                ledger_entry_id = "ledger-" + txn_je_id + "-" + entry_index
+                distribution_id = "dist-" + entry_index
+            else:
+                ledger_entry_id = "ledger-" + txn_je_id + "-" + distribution_id
+            columns['ledger_entry_id'].append(ledger_entry_id)
+            columns['account_id'].append(account_id)
+            columns['account_number'].append(account_info['account_number'])
+            columns['account_name'].append(account_info['account_name'])
+            columns['account_type'].append(dist['account_type'])
+            columns['journal_entry_id'].append(txn_je_id)
+            columns['distribution_id'].append(distribution_id)
+            columns['entry_number'].append(txn_entry_number)
+            columns['transaction_date'].append(txn_entry_date)
+            columns['posting_date'].append(txn_posting_date)
+            columns['description'].append(dist.get('description', txn_description))
+            columns['reference'].append(dist.get('reference_id'))
+            columns['flow_direction'].append(dist['flow_direction'])
+            columns['amount'].append(amount)
+            columns['debit_credit'].append(debit_credit)
+            columns['debit_amount'].append(debit_amount)
+            columns['credit_amount'].append(credit_amount)
+            columns['multiplier'].append(dist['multiplier'])
+            columns['balance_impact'].append(balance_impact)
+            columns['balance_before'].append(balance_before)
+            columns['balance_after'].append(balance_after)
+            columns['posted_at'].append(txn_created_at)
+            columns['created_at'].append(txn_created_at)
 
             # Update running balance
             account_balances[account_id] = balance_after
 
-    return ledger_entries
+    # Entries were generated in date order; a stable sort on account keeps
+    # that order within each account
+    ledger = LedgerColumns.from_lists(columns)
+    return ledger.take(np.argsort(ledger.account_id.astype(str), kind='stable'))
 
 
-def generate_monthly_balances(dataset: Dict, ledger_entries: List[Dict]) -> List[Dict]:
+def generate_monthly_balances(chart_of_accounts: List[Dict], ledger: LedgerColumns) -> List[Dict]:
     """
     Generate monthly AccountBalance summaries.
 
-    Creates one AccountBalance record per account per month.
+    Creates one AccountBalance record per account per month. The ledger
+    is expected in (account, transaction date) order, as returned by
+    ``generate_account_ledgers``, so groups are runs of adjacent entries and
+    each is reduced with ``np.add.reduceat`` in a single pass.
     """
-    monthly_balances = []
+    if len(ledger) == 0:
+        return []
+
+    accounts = {acc['account_id']: acc for acc in chart_of_accounts}
+
+    # Group ledger entries by account and month: a new group starts
+    # wherever either key changes from the previous entry
+    account_ids = ledger.account_id
+    months = ledger.transaction_date.astype('datetime64[M]')
+    is_group_start = np.empty(len(ledger), dtype=bool)
+    is_group_start[0] = True
+    is_group_start[1:] = (account_ids[1:] != account_ids[:-1]) | (months[1:] != months[:-1])
+    group_starts = np.flatnonzero(is_group_start)
+    group_ends = np.append(group_starts[1:], len(ledger)) - 1
+
+    # Calculate per-group totals (in cents) in one pass over each column. flow_direction only takes 'from' or 'to', so a single mask
+    # splits every amount into its FROM and TO share.
+    amount = ledger.amount
+    from_amount = np.where(ledger.flow_direction == 'from', amount, 0)
+    to_amount = amount - from_amount
+    total_from_amount = np.add.reduceat(from_amount, group_starts).tolist()
+    total_to_amount = np.add.reduceat(to_amount, group_starts).tolist()
+    total_debits = np.add.reduceat(ledger.debit_amount, group_starts).tolist()
+    total_credits = np.add.reduceat(ledger.credit_amount, group_starts).tolist()
+    transaction_counts = (group_ends - group_starts + 1).tolist()
+
+    # Opening balance is balance_before of the first entry, closing balance
+    # is balance_after of the last entry
+    opening_balances = ledger.balance_before[group_starts].tolist()
+    closing_balances = ledger.balance_after[group_ends].tolist()
+
+    # Determine period dates
+    group_months = months[group_starts]
+    period_starts = np.datetime_as_string(group_months.astype('datetime64[D]'), unit='D')
+    period_ends = np.datetime_as_string((group_months + 1).astype('datetime64[D]') - 1, unit='D')
+    month_keys = np.datetime_as_string(group_months, unit='M')
+    group_accounts = account_ids[group_starts]
 
-    # Group ledger entries by account and month
-    by_account_month = defaultdict(list)
-
-    for entry in ledger_entries:
-        account_id = entry['account_id']
-        txn_date = date.fromisoformat(entry['transaction_date'])
-        month_key = f"{txn_date.year}-{txn_date.month:02d}"
-        by_account_month[(account_id, month_key)].append(entry)
+    monthly_balances = []
 
     # Generate monthly summary for each account/month combination
-    for (account_id, month_key), entries in sorted(by_account_month.items()):
-        if not entries:
-            continue
-
+    for i, (account_id, month_key) in enumerate(zip(group_accounts.tolist(), month_keys.tolist())):
         # Get account info
-        account_info = next(
-            (acc for acc in dataset['chart_of_accounts'] if acc['account_id'] == account_id),
-            None
-        )
+        account_info = accounts.get(account_id)
 
         if not account_info:
             continue
 
-        # Sort entries by date
-        entries = sorted(entries, key=lambda x: x['transaction_date'])
-
-        # Parse month
-        year, month = map(int, month_key.split('-'))
-
-        # Determine period dates
-        period_start = date(year, month, 1)
-        if month == 12:
-            period_end = date(year, 12, 31)
-        else:
-            next_month = date(year, month + 1, 1)
-            period_end = date(year, month, (next_month - timedelta(days=1)).day)
-
-        # Get opening balance (balance_before of first entry)
-        opening_balance = entries[0]['balance_before']
-
-        # Get closing balance (balance_after of last entry)
-        closing_balance = entries[-1]['balance_after']
-
-        # Calculate totals
-        total_from_amount = sum(e['amount'] for e in entries if e['flow_direction'] == 'from')
-        total_to_amount = sum(e['amount'] for e in entries if e['flow_direction'] == 'to')
-        total_debits = sum(e['debit_amount'] for e in entries)
-        total_credits = sum(e['credit_amount'] for e in entries)
+        opening_balance = opening_balances[i]
+        closing_balance = closing_balances[i]
         net_change = closing_balance - opening_balance
-        transaction_count = len(entries)
+        period_start = str(period_starts[i])
 
         # Create monthly balance record
         balance_record = {
-            "balance_id": f"bal-{account_id}-{month_key}",
+            "balance_id": "bal-" + account_id + "-" + month_key,
             "account_id": account_id,
             "account_number": account_info['account_number'],
             "account_name": account_info['account_name'],
             "account_type": account_info['account_type'],
-            "period_start": period_start.isoformat(),
-            "period_end": period_end.isoformat(),
+            "period_start": period_start,
+            "period_end": str(period_ends[i]),
             "period_label": month_key,
-            "opening_balance": round(opening_balance, 2),
-            "opening_balance_date": period_start.isoformat(),
-            "total_from_amount": round(total_from_amount, 2),
-            "total_to_amount": round(total_to_amount, 2),
-            "transaction_count": transaction_count,
-            "total_debits": round(total_debits, 2),
-            "total_credits": round(total_credits, 2),
-            "net_change": round(net_change, 2),
-            "closing_balance": round(closing_balance, 2),
+            "opening_balance": opening_balance / 100.0,
+            "opening_balance_date": period_start,
+            "total_from_amount": total_from_amount[i] / 100.0,
+            "total_to_amount": total_to_amount[i] / 100.0,
+            "transaction_count": transaction_counts[i],
+            "total_debits": total_debits[i] / 100.0,
+            "total_credits": total_credits[i] / 100.0,
+            "net_change": net_change / 100.0,
+            "closing_balance": closing_balance / 100.0,
             "is_reconciled": False,
             "created_at": datetime.utcnow().isoformat(),
             "updated_at": datetime.utcnow().isoformat()
@@ -205,7 +342,13 @@ def generate_monthly_balances(dataset: Dict, ledger_entries: List[Dict]) -> List
 
         monthly_balances.append(balance_record)
 
-    return sorted(monthly_balances, key=lambda x: (x['period_label'], x['account_number']))
+    return sorted(monthly_balances, key=itemgetter('period_label', 'account_number'))
+
+
+def write_json(file_path: str, data) -> None:
+    """Serialize data with orjson and write it to file_path."""
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 def generate_summary_report(monthly_balances: List[Dict]) -> Dict:
@@ -235,39 +378,45 @@ def main():
 
     # Load dataset
     dataset_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/three_month_dataset.json"
-    dataset = load_dataset(dataset_file)
-
-    print(f"\n📊 Processing {len(dataset['transactions'])} transactions...")
+    if ijson is not None and os.path.getsize(dataset_file) > STREAMING_THRESHOLD_BYTES:
+        chart_of_accounts = load_chart_of_accounts(dataset_file)
+        transactions = iter_transactions(dataset_file)
+        print("\n📊 Streaming transactions...")
+    else:
+        dataset = load_dataset(dataset_file)
+        chart_of_accounts = dataset['chart_of_accounts']
+        transactions = dataset['transactions']
+        print(f"\n📊 Processing {len(transactions)} transactions...")
 
     # Generate account ledgers
     print("\n🔄 Generating account ledger entries...")
-    ledger_entries = generate_account_ledgers(dataset)
-    print(f"   ✅ Created {len(ledger_entries)} ledger entries")
+    ledger = generate_account_ledgers(transactions, chart_of_accounts)
+    print(f"   ✅ Created {len(ledger)} ledger entries")
 
     # Generate monthly balances
     print("\n📅 Generating monthly account balances...")
-    monthly_balances = generate_monthly_balances(dataset, ledger_entries)
+    monthly_balances = generate_monthly_balances(chart_of_accounts, ledger)
     print(f"   ✅ Created {len(monthly_balances)} monthly balance records")
 
     # Generate summary
     summary = generate_summary_report(monthly_balances)
 
-    # Save ledger entries
-    ledger_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/account_ledgers.json"
-    with open(ledger_file, 'w') as f:
-        json.dump(ledger_entries, f, indent=2)
-    print(f"\n💾 Saved ledger entries to: {ledger_file}")
+    # Materialize ledger entries for output
+    ledger_entries = ledger.to_records()
 
-    # Save monthly balances
+    # Save ledger entries, monthly balances and summary concurrently
+    ledger_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/account_ledgers.json"
     balances_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/monthly_balances.json"
-    with open(balances_file, 'w') as f:
-        json.dump(monthly_balances, f, indent=2)
-    print(f"💾 Saved monthly balances to: {balances_file}")
-
-    # Save summary
     summary_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/ledger_summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    outputs = [
+        (ledger_file, ledger_entries),
+        (balances_file, monthly_balances),
+        (summary_file, summary),
+    ]
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        list(executor.map(lambda output: write_json(*output), outputs))
+    print(f"\n💾 Saved ledger entries to: {ledger_file}")
+    print(f"💾 Saved monthly balances to: {balances_file}")
     print(f"💾 Saved summary to: {summary_file}")
 
     # Print summary
@@ -301,5 +450,4 @@ def main():
 
 
 if __name__ == "__main__":
-    from datetime import timedelta
     main()
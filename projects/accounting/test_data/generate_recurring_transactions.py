@@ -13,556 +13,395 @@ Creates realistic recurring transactions including:
 Then expands all templates for 2 years (2025-2026) for forecasting.
 """
 
-import json
+import argparse
+import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Dict
+from functools import cache, lru_cache, partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import orjson
+from pydantic import TypeAdapter
 
 # Add project root to path
 sys.path.insert(0, '/Users/ksd/Projects/LiMOS')
 
 from projects.accounting.models.journal_entries import (
+    JournalEntry,
     RecurringJournalEntry,
     RecurrenceFrequency,
-    AccountType
+    AccountType,
+    FlowDirection,
+    DebitCredit,
+    JournalEntryType,
+    JournalEntryStatus
 )
 from projects.accounting.services.recurring_transaction_service import (
     RecurringTransactionService
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Template definitions shipped alongside this script
+TEMPLATES_SEED_FILE = Path(__file__).parent / "recurring_templates.seed.json"
+
 
+@cache
 def create_recurring_templates() -> List[Dict]:
-    """Create recurring journal entry templates."""
+    """
+    Load the recurring journal entry templates.
+
+    The definitions are parsed from ``recurring_templates.seed.json`` once
+    per process; callers share the returned list and must not mutate it.
+    """
+    return orjson.loads(TEMPLATES_SEED_FILE.read_bytes())
+
+
+# Integer codes for account types, used for vectorized summaries
+ACCOUNT_TYPE_CODES = {
+    AccountType.ASSET: 0,
+    AccountType.LIABILITY: 1,
+    AccountType.EQUITY: 2,
+    AccountType.REVENUE: 3,
+    AccountType.EXPENSE: 4,
+}
+ACCOUNT_TYPES_BY_CODE = {code: account_type for account_type, code in ACCOUNT_TYPE_CODES.items()}
+
+# Integer codes for flow directions
+FLOW_DIRECTION_CODES = {
+    FlowDirection.FROM: 0,
+    FlowDirection.TO: 1,
+}
+
+
+@dataclass
+class DistributionsSoA:
+    """
+    Distributions of all expanded entries as parallel NumPy arrays.
+
+    One row per distribution; ``entry_idx`` points back into the expanded
+    entry list so per-entry and per-type aggregates are plain array ops.
+    """
+    amount: np.ndarray  # float64
+    account_type_code: np.ndarray  # int8, see ACCOUNT_TYPE_CODES
+    flow_code: np.ndarray  # int8, see FLOW_DIRECTION_CODES
+    entry_idx: np.ndarray  # int32
+
+    @classmethod
+    def from_entries(cls, entries: List[JournalEntry]) -> "DistributionsSoA":
+        """Fill the arrays in a single pass over the entries' distributions."""
+        n = sum(len(entry.distributions) for entry in entries)
+        amount = np.empty(n, dtype=np.float64)
+        account_type_code = np.empty(n, dtype=np.int8)
+        flow_code = np.empty(n, dtype=np.int8)
+        entry_idx = np.empty(n, dtype=np.int32)
+
+        i = 0
+        for idx, entry in enumerate(entries):
+            for d in entry.distributions:
+                amount[i] = d.amount
+                account_type_code[i] = ACCOUNT_TYPE_CODES[d.account_type]
+                flow_code[i] = FLOW_DIRECTION_CODES[d.flow_direction]
+                entry_idx[i] = idx
+                i += 1
+
+        return cls(amount, account_type_code, flow_code, entry_idx)
+
+    def totals_by_account_type(self) -> Dict[AccountType, float]:
+        """Sum of amounts per account type, in one sorted reduceat pass."""
+        if len(self.amount) == 0:
+            return {}
+        order = np.argsort(self.account_type_code, kind='stable')
+        sorted_codes = self.account_type_code[order]
+        group_starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_codes)) + 1))
+        totals = np.add.reduceat(self.amount[order], group_starts)
+        return {
+            ACCOUNT_TYPES_BY_CODE[code]: total
+            for code, total in zip(sorted_codes[group_starts].tolist(), totals.tolist())
+        }
 
-    templates = [
-        # ================================================================
-        # INCOME - Biweekly Salary
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-salary-biweekly",
-            "template_name": "Salary - Biweekly Paycheck",
-            "description": "Biweekly salary deposit",
-            "frequency": "biweekly",
-            "interval": 1,
-            "start_date": "2025-01-03",  # First Friday
-            "day_of_month": None,
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "5000",
-                    "account_type": "revenue",
-                    "flow_direction": "from",
-                    "amount": 3500.00,
-                    "multiplier": 1,
-                    "description": "Salary income"
-                },
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "to",
-                    "amount": 3500.00,
-                    "multiplier": 1,
-                    "description": "Deposit to checking"
-                }
-            ]
-        },
-
-        # ================================================================
-        # HOUSING - Monthly Mortgage Payment
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-mortgage-monthly",
-            "template_name": "Mortgage Payment",
-            "description": "Monthly mortgage payment (principal + interest)",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 1,
-            "start_date": "2025-01-01",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 1439.00,
-                    "multiplier": -1,
-                    "description": "Mortgage payment from checking"
-                },
-                {
-                    "account_id": "2200",
-                    "account_type": "liability",
-                    "flow_direction": "to",
-                    "amount": 766.00,
-                    "multiplier": -1,
-                    "description": "Mortgage principal reduction"
-                },
-                {
-                    "account_id": "6000",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 673.00,
-                    "multiplier": 1,
-                    "description": "Mortgage interest expense (2.1% APR)"
-                }
-            ]
-        },
-
-        # ================================================================
-        # HOUSING - Property Tax (Quarterly)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-property-tax-quarterly",
-            "template_name": "Property Tax Payment",
-            "description": "Quarterly property tax payment",
-            "frequency": "quarterly",
-            "interval": 1,
-            "day_of_month": 15,
-            "start_date": "2025-01-15",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 1250.00,
-                    "multiplier": -1,
-                    "description": "Property tax payment"
-                },
-                {
-                    "account_id": "6100",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 1250.00,
-                    "multiplier": 1,
-                    "description": "Property tax expense"
-                }
-            ]
-        },
-
-        # ================================================================
-        # HOUSING - Home Insurance (Annual)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-home-insurance-annual",
-            "template_name": "Home Insurance Premium",
-            "description": "Annual home insurance premium",
-            "frequency": "annually",
-            "interval": 1,
-            "day_of_month": 1,
-            "month_of_year": 3,  # March 1st
-            "start_date": "2025-03-01",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 1800.00,
-                    "multiplier": -1,
-                    "description": "Home insurance payment"
-                },
-                {
-                    "account_id": "6110",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 1800.00,
-                    "multiplier": 1,
-                    "description": "Home insurance expense"
-                }
-            ]
-        },
-
-        # ================================================================
-        # UTILITIES - Electric Bill (Monthly)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-electric-monthly",
-            "template_name": "Electric Utility Bill",
-            "description": "Monthly electric utility payment",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 10,
-            "start_date": "2025-01-10",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 185.00,
-                    "multiplier": -1,
-                    "description": "Electric bill payment"
-                },
-                {
-                    "account_id": "6200",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 185.00,
-                    "multiplier": 1,
-                    "description": "Electric utility expense"
-                }
-            ]
-        },
-
-        # ================================================================
-        # UTILITIES - Gas Bill (Monthly)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-gas-monthly",
-            "template_name": "Gas Utility Bill",
-            "description": "Monthly gas utility payment",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 15,
-            "start_date": "2025-01-15",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 95.00,
-                    "multiplier": -1,
-                    "description": "Gas bill payment"
-                },
-                {
-                    "account_id": "6210",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 95.00,
-                    "multiplier": 1,
-                    "description": "Gas utility expense"
-                }
-            ]
-        },
-
-        # ================================================================
-        # UTILITIES - Internet/Cable (Monthly)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-internet-monthly",
-            "template_name": "Internet & Cable Bill",
-            "description": "Monthly internet and cable payment",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 20,
-            "start_date": "2025-01-20",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 120.00,
-                    "multiplier": -1,
-                    "description": "Internet/cable payment"
-                },
-                {
-                    "account_id": "6220",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 120.00,
-                    "multiplier": 1,
-                    "description": "Internet/cable expense"
-                }
-            ]
-        },
-
-        # ================================================================
-        # AUTO - Auto Loan Payment (Monthly)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-auto-loan-monthly",
-            "template_name": "Auto Loan Payment",
-            "description": "Monthly auto loan payment (principal + interest)",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 5,
-            "start_date": "2025-01-05",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 425.00,
-                    "multiplier": -1,
-                    "description": "Auto loan payment from checking"
-                },
-                {
-                    "account_id": "2300",
-                    "account_type": "liability",
-                    "flow_direction": "to",
-                    "amount": 375.00,
-                    "multiplier": -1,
-                    "description": "Auto loan principal reduction",
-                    "payment_envelope_id": "1620"
-                },
-                {
-                    "account_id": "6410",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 50.00,
-                    "multiplier": 1,
-                    "description": "Auto loan interest expense (3.2% APR)"
-                }
-            ]
-        },
-
-        # ================================================================
-        # AUTO - Auto Insurance (Semiannual)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-auto-insurance-semiannual",
-            "template_name": "Auto Insurance Premium",
-            "description": "Semiannual auto insurance premium",
-            "frequency": "semiannually",
-            "interval": 1,
-            "day_of_month": 1,
-            "start_date": "2025-01-01",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 650.00,
-                    "multiplier": -1,
-                    "description": "Auto insurance payment"
-                },
-                {
-                    "account_id": "6420",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 650.00,
-                    "multiplier": 1,
-                    "description": "Auto insurance expense"
-                }
-            ]
-        },
-
-        # ================================================================
-        # CREDIT CARDS - Credit Card A Payment (Monthly)
-        # ================================================================
-        {
-            "recurring_entry_id": "rec-cc-a-payment-monthly",
-            "template_name": "Credit Card A - Monthly Payment",
-            "description": "Monthly payment to Credit Card A",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 25,
-            "start_date": "2025-01-25",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "1000",
-                    "account_type": "asset",
-                    "flow_direction": "from",
-                    "amount": 500.00,
-                    "multiplier": -1,
-                    "description": "Payment to Credit Card A"
-                },
-                {
-                    "account_id": "2100",
-                    "account_type": "liability",
-                    "flow_direction": "to",
-                    "amount": 500.00,
-                    "multiplier": -1,
-                    "description": "Credit Card A payment",
-                    "payment_envelope_id": "1600"
-                }
-            ]
-        },
-
-        # ================================================================
-        # SUBSCRIPTIONS - Streaming Services (Monthly)
-        # ================================================================
+    def from_totals_by_entry(self, n_entries: int) -> np.ndarray:
+        """FROM-side amount total of every entry."""
+        is_from = self.flow_code == FLOW_DIRECTION_CODES[FlowDirection.FROM]
+        return np.bincount(self.entry_idx, weights=self.amount * is_from, minlength=n_entries)
+
+
+# Serializes template lists without building intermediate dicts
+TEMPLATE_LIST_ADAPTER = TypeAdapter(List[RecurringJournalEntry])
+
+# Template fields written to recurring_templates.json
+TEMPLATE_EXPORT_FIELDS = {
+    "recurring_entry_id", "template_name", "description", "frequency", "interval",
+    "day_of_month", "day_of_week", "month_of_quarter", "month_of_year",
+    "start_date", "end_date", "auto_post", "is_active", "distribution_template",
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(value.items()))
+    if isinstance(value, list):
+        return ('__list__',) + tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of ``_freeze``."""
+    if isinstance(value, tuple):
+        if value[:1] == ('__list__',):
+            return [_thaw(v) for v in value[1:]]
+        return {k: _thaw(v) for k, v in value}
+    return value
+
+
+@lru_cache(maxsize=None)
+def _build_template(frozen_template: tuple) -> RecurringJournalEntry:
+    """Validate a template once per distinct template definition."""
+    return RecurringJournalEntry(**_thaw(frozen_template))
+
+
+def build_templates(templates_data: List[Dict]) -> List[RecurringJournalEntry]:
+    """Convert template dicts to RecurringJournalEntry models, reusing cached models."""
+    return [_build_template(_freeze(template_data)) for template_data in templates_data]
+
+
+# Enum member -> interned value strings, looked up instead of calling .value per row
+ACCOUNT_TYPE_VALUES = {member: sys.intern(member.value) for member in AccountType}
+FLOW_DIRECTION_VALUES = {member: sys.intern(member.value) for member in FlowDirection}
+DEBIT_CREDIT_VALUES = {member: sys.intern(member.value) for member in DebitCredit}
+ENTRY_TYPE_VALUES = {member: sys.intern(member.value) for member in JournalEntryType}
+ENTRY_STATUS_VALUES = {member: sys.intern(member.value) for member in JournalEntryStatus}
+
+
+@lru_cache(maxsize=None)
+def iso_date(value: date) -> str:
+    """ISO-format a date, reusing the string for dates seen before."""
+    return value.isoformat()
+
+
+def distribution_fields(entry: JournalEntry) -> List[Dict]:
+    """JSON-safe distribution fields of an entry, minus the per-entry distribution_id."""
+    return [
         {
-            "recurring_entry_id": "rec-streaming-monthly",
-            "template_name": "Streaming Services",
-            "description": "Monthly streaming service subscriptions",
-            "frequency": "monthly",
-            "interval": 1,
-            "day_of_month": 1,
-            "start_date": "2025-01-01",
-            "auto_post": True,
-            "is_active": True,
-            "distribution_template": [
-                {
-                    "account_id": "2100",
-                    "account_type": "liability",
-                    "flow_direction": "from",
-                    "amount": 45.00,
-                    "multiplier": 1,
-                    "description": "Streaming subscriptions charged to CC",
-                    "payment_envelope_id": "1600"
-                },
-                {
-                    "account_id": "6500",
-                    "account_type": "expense",
-                    "flow_direction": "to",
-                    "amount": 45.00,
-                    "multiplier": 1,
-                    "description": "Entertainment - Streaming",
-                    "budget_envelope_id": "1530"
-                }
-            ]
+            "account_id": d.account_id,
+            "account_type": ACCOUNT_TYPE_VALUES[d.account_type],
+            "flow_direction": FLOW_DIRECTION_VALUES[d.flow_direction],
+            "amount": d.amount,
+            "multiplier": d.multiplier,
+            "debit_credit": DEBIT_CREDIT_VALUES[d.debit_credit],
+            "description": d.description,
+            "budget_envelope_id": d.budget_envelope_id,
+            "payment_envelope_id": d.payment_envelope_id
         }
+        for d in entry.distributions
     ]
 
-    return templates
 
+def entry_to_dict(entry: JournalEntry, shared_distributions: Optional[Dict[str, List[Dict]]] = None) -> Dict:
+    """
+    Convert an expanded journal entry to its JSON-safe dict.
+
+    Entries expanded from the same template have identical distributions
+    apart from their IDs, so when a shared_distributions dict is passed the
+    fields are built from the first entry of each template and reused.
+    """
+    if shared_distributions is None:
+        fields = distribution_fields(entry)
+    else:
+        fields = shared_distributions.get(entry.recurring_entry_id)
+        if fields is None:
+            fields = shared_distributions[entry.recurring_entry_id] = distribution_fields(entry)
+
+    return {
+        "journal_entry_id": entry.journal_entry_id,
+        "entry_number": entry.entry_number,
+        "entry_date": iso_date(entry.entry_date),
+        "posting_date": iso_date(entry.posting_date) if entry.posting_date else None,
+        "description": entry.description,
+        "entry_type": ENTRY_TYPE_VALUES[entry.entry_type],
+        "status": ENTRY_STATUS_VALUES[entry.status],
+        "recurring_entry_id": entry.recurring_entry_id,
+        "distributions": [
+            {"distribution_id": d.distribution_id, **base}
+            for d, base in zip(entry.distributions, fields)
+        ]
+    }
+
+
+def write_json_array(file_path: str, items: Iterable[Dict]) -> None:
+    """
+    Write items as a JSON array, serializing one item at a time.
+
+    Each item is encoded with orjson on its own line, so the full list of
+    dicts never has to be held in memory.
+    """
+    with open(file_path, 'wb') as f:
+        f.write(b'[')
+        separator = b'\n'
+        for item in items:
+            f.write(separator)
+            f.write(orjson.dumps(item))
+            separator = b',\n'
+        f.write(b'\n]\n')
+
+
+def _expand_one(template: RecurringJournalEntry, start_date: date, end_date: date,
+                auto_post: bool) -> List[JournalEntry]:
+    """Expand a single template inside a worker process."""
+    return RecurringTransactionService().expand_single_template(
+        template=template,
+        start_date=start_date,
+        end_date=end_date,
+        auto_post=auto_post
+    )
 
-def main():
-    """Generate recurring transactions and expand for 2 years."""
-    print("=" * 80)
-    print("Generating Recurring Transaction Templates")
-    print("=" * 80)
+
+def expand_templates_parallel(
+    templates: List[RecurringJournalEntry],
+    start_date: date,
+    end_date: date,
+    auto_post: bool = False,
+    max_workers: int = 1
+) -> Dict[str, List[JournalEntry]]:
+    """
+    Expand templates across worker processes, one job per template.
+
+    Each active template is pickled to its worker as-is. Falls back to
+    in-process expansion for a single worker.
+
+    Returns:
+        Dict of recurring_entry_id to that template's entries, in template order
+    """
+    service = RecurringTransactionService()
+    if max_workers <= 1:
+        return service.expand_recurring_entries_by_template(
+            recurring_templates=templates,
+            start_date=start_date,
+            end_date=end_date,
+            auto_post=auto_post
+        )
+
+    active_templates = [t for t in templates if t.is_active]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(active_templates) or 1)) as executor:
+        results = executor.map(
+            partial(_expand_one, start_date=start_date, end_date=end_date, auto_post=auto_post),
+            active_templates
+        )
+        return {t.recurring_entry_id: entries for t, entries in zip(active_templates, results)}
+
+
+def main(verbose: bool = False, max_workers: int = 1):
+    """
+    Generate recurring transactions and expand for 2 years.
+
+    The progress report is logged at INFO, so it is only shown when
+    ``verbose`` is set (the command line sets it unless ``--quiet``).
+    Template expansion runs in ``max_workers`` processes when above 1.
+    """
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format='%(message)s')
+    report = logger.isEnabledFor(logging.INFO)
+
+    logger.info("=" * 80)
+    logger.info("Generating Recurring Transaction Templates")
+    logger.info("=" * 80)
 
     # Create templates
     templates_data = create_recurring_templates()
-    print(f"\n✅ Created {len(templates_data)} recurring transaction templates")
+    logger.info(f"\n✅ Created {len(templates_data)} recurring transaction templates")
 
     # Convert to model objects
-    from projects.accounting.models.journal_entries import RecurringJournalEntry
-    templates = []
-    for template_data in templates_data:
-        template = RecurringJournalEntry(**template_data)
-        templates.append(template)
+    templates = build_templates(templates_data)
 
     # Print template summary
-    print(f"\n📋 Template Summary:")
-    for template in templates:
-        print(f"   • {template.template_name:45} {template.frequency.value:15} "
-              f"starting {template.start_date}")
+    if report:
+        logger.info("\n📋 Template Summary:\n" + "\n".join(
+            f"   • {template.template_name:45} {template.frequency.value:15} "
+            f"starting {template.start_date}"
+            for template in templates
+        ))
 
     # Expand for 2 years (2025-2026)
-    print(f"\n" + "=" * 80)
-    print("Expanding Templates for 2 Years (2025-01-01 to 2026-12-31)")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("Expanding Templates for 2 Years (2025-01-01 to 2026-12-31)")
+    logger.info("=" * 80)
 
-    service = RecurringTransactionService()
-    expanded_entries = service.expand_recurring_entries(
-        recurring_templates=templates,
+    expanded_by_template = expand_templates_parallel(
+        templates=templates,
         start_date=date(2025, 1, 1),
         end_date=date(2026, 12, 31),
-        auto_post=True
+        auto_post=True,
+        max_workers=max_workers
     )
+    expanded_entries = RecurringTransactionService.merge_expanded_entries(expanded_by_template)
 
-    print(f"\n✅ Generated {len(expanded_entries)} journal entries")
-
-    # Count by type
-    from collections import Counter
-    by_template = Counter(entry.recurring_entry_id for entry in expanded_entries)
+    logger.info(f"\n✅ Generated {len(expanded_entries)} journal entries")
 
-    print(f"\n📊 Entries by Template:")
-    for template in templates:
-        count = by_template[template.recurring_entry_id]
-        print(f"   • {template.template_name:45} {count:3} occurrences")
-
-    # Save templates to JSON
-    templates_json = [
-        {
-            "recurring_entry_id": t.recurring_entry_id,
-            "template_name": t.template_name,
-            "description": t.description,
-            "frequency": t.frequency.value,
-            "interval": t.interval,
-            "day_of_month": t.day_of_month,
-            "day_of_week": t.day_of_week,
-            "month_of_quarter": t.month_of_quarter,
-            "month_of_year": t.month_of_year,
-            "start_date": t.start_date.isoformat(),
-            "end_date": t.end_date.isoformat() if t.end_date else None,
-            "auto_post": t.auto_post,
-            "is_active": t.is_active,
-            "distribution_template": t.distribution_template
-        }
-        for t in templates
-    ]
+    # Count by template
+    if report:
+        logger.info("\n📊 Entries by Template:\n" + "\n".join(
+            f"   • {template.template_name:45} "
+            f"{len(expanded_by_template.get(template.recurring_entry_id, [])):3} occurrences"
+            for template in templates
+        ))
 
+    # Save templates to JSON, serialized straight to bytes by pydantic-core
     templates_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/recurring_templates.json"
-    with open(templates_file, 'w') as f:
-        json.dump(templates_json, f, indent=2)
-    print(f"\n💾 Saved templates to: {templates_file}")
-
-    # Convert expanded entries to JSON
-    expanded_json = []
-    for entry in expanded_entries:
-        entry_dict = {
-            "journal_entry_id": entry.journal_entry_id,
-            "entry_number": entry.entry_number,
-            "entry_date": entry.entry_date.isoformat(),
-            "posting_date": entry.posting_date.isoformat() if entry.posting_date else None,
-            "description": entry.description,
-            "entry_type": entry.entry_type.value,
-            "status": entry.status.value,
-            "recurring_entry_id": entry.recurring_entry_id,
-            "distributions": [
-                {
-                    "distribution_id": d.distribution_id,
-                    "account_id": d.account_id,
-                    "account_type": d.account_type.value,
-                    "flow_direction": d.flow_direction.value,
-                    "amount": d.amount,
-                    "multiplier": d.multiplier,
-                    "debit_credit": d.debit_credit.value,
-                    "description": d.description,
-                    "budget_envelope_id": d.budget_envelope_id,
-                    "payment_envelope_id": d.payment_envelope_id
-                }
-                for d in entry.distributions
-            ]
-        }
-        expanded_json.append(entry_dict)
+    Path(templates_file).write_bytes(TEMPLATE_LIST_ADAPTER.dump_json(
+        templates, include={'__all__': TEMPLATE_EXPORT_FIELDS}, indent=2
+    ))
+    logger.info(f"\n💾 Saved templates to: {templates_file}")
 
-    # Save expanded entries
+    # Stream expanded entries to disk one entry at a time
     expanded_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/recurring_expanded_2years.json"
-    with open(expanded_file, 'w') as f:
-        json.dump(expanded_json, f, indent=2)
-    print(f"💾 Saved expanded entries to: {expanded_file}")
+    shared_distributions: Dict[str, List[Dict]] = {}
+    write_json_array(
+        expanded_file,
+        (entry_to_dict(entry, shared_distributions) for entry in expanded_entries)
+    )
+    logger.info(f"💾 Saved expanded entries to: {expanded_file}")
+
+    if not report:
+        return
 
     # Show date range and samples
-    print(f"\n📅 Date Range:")
-    print(f"   First entry: {expanded_entries[0].entry_date}")
-    print(f"   Last entry:  {expanded_entries[-1].entry_date}")
-
-    print(f"\n📝 Sample Entries (first 10):")
-    for entry in expanded_entries[:10]:
-        print(f"   {entry.entry_date} | {entry.description[:60]:60} | "
-              f"${sum(d.amount for d in entry.distributions if d.flow_direction.value == 'from'):>10,.2f}")
-
-    # Calculate summary statistics
-    total_income = sum(
-        d.amount for entry in expanded_entries
-        for d in entry.distributions
-        if d.account_type.value == "revenue"
-    )
+    logger.info("\n📅 Date Range:")
+    logger.info(f"   First entry: {expanded_entries[0].entry_date}")
+    logger.info(f"   Last entry:  {expanded_entries[-1].entry_date}")
 
-    total_expenses = sum(
-        d.amount for entry in expanded_entries
-        for d in entry.distributions
-        if d.account_type.value == "expense"
-    )
+    distributions = DistributionsSoA.from_entries(expanded_entries)
+    from_amounts = distributions.from_totals_by_entry(len(expanded_entries))
+
+    sample_entries = expanded_entries[:10]
+    sample_from_amounts = from_amounts[:10].tolist()
+    logger.info("\n📝 Sample Entries (first 10):\n" + "\n".join(
+        f"   {entry.entry_date} | {entry.description[:60]:60} | ${from_amount:>10,.2f}"
+        for entry, from_amount in zip(sample_entries, sample_from_amounts)
+    ))
+
+    # Calculate summary statistics over the distribution arrays
+    totals_by_type = distributions.totals_by_account_type()
+    total_income = totals_by_type.get(AccountType.REVENUE, 0.0)
+    total_expenses = totals_by_type.get(AccountType.EXPENSE, 0.0)
 
-    print(f"\n💰 2-Year Summary:")
-    print(f"   Total Income:   ${total_income:>12,.2f}")
-    print(f"   Total Expenses: ${total_expenses:>12,.2f}")
-    print(f"   Net:            ${total_income - total_expenses:>12,.2f}")
+    logger.info("\n💰 2-Year Summary:")
+    logger.info(f"   Total Income:   ${total_income:>12,.2f}")
+    logger.info(f"   Total Expenses: ${total_expenses:>12,.2f}")
+    logger.info(f"   Net:            ${total_income - total_expenses:>12,.2f}")
 
-    print(f"\n✅ Recurring transaction generation complete!")
-    print("=" * 80)
+    logger.info("\n✅ Recurring transaction generation complete!")
+    logger.info("=" * 80)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate and expand recurring transaction templates")
+    parser.add_argument('--quiet', action='store_true', help="Only log warnings and errors")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Expand templates in this many worker processes")
+    args = parser.parse_args()
+    main(verbose=not args.quiet, max_workers=args.workers)
@@ -7,11 +7,17 @@ Creates 3 months (January - March 2025) of posted journal entries with:
 - Real-world scenarios with proper FROM/TO flow
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import List, Dict
-import json
+from functools import cache, lru_cache
+from operator import itemgetter
+from typing import IO, Any, List, Dict, Optional, Tuple, Union
+import heapq
 from decimal import Decimal
 
+import numpy as np
+import orjson
+
 # Import models
 import sys
 sys.path.append('/Users/ksd/Projects/LiMOS')
@@ -34,233 +40,63 @@ from projects.accounting.models.journal_entries import (
 # CHART OF ACCOUNTS
 # ============================================================================
 
-CHART_OF_ACCOUNTS = [
+# (account_id, account_name, account_type, opening_balance)
+_CHART_OF_ACCOUNTS_RAW = (
     # ASSETS (1000-1999)
-    {
-        "account_id": "1000",
-        "account_number": "1000",
-        "account_name": "Cash - Checking",
-        "account_type": "asset",
-        "opening_balance": 25000.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "1100",
-        "account_number": "1100",
-        "account_name": "Cash - Savings",
-        "account_type": "asset",
-        "opening_balance": 50000.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "1200",
-        "account_number": "1200",
-        "account_name": "Accounts Receivable",
-        "account_type": "asset",
-        "opening_balance": 8500.00,
-        "opening_balance_date": "2025-01-01"
-    },
+    ("1000", "Cash - Checking", "asset", 25000.00),
+    ("1100", "Cash - Savings", "asset", 50000.00),
+    ("1200", "Accounts Receivable", "asset", 8500.00),
 
     # LIABILITIES (2000-2999)
-    {
-        "account_id": "2000",
-        "account_number": "2000",
-        "account_name": "Accounts Payable",
-        "account_type": "liability",
-        "opening_balance": 3200.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "2100",
-        "account_number": "2100",
-        "account_name": "Credit Card Payable",
-        "account_type": "liability",
-        "opening_balance": 2500.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "2200",
-        "account_number": "2200",
-        "account_name": "Mortgage Payable - Principal",
-        "account_type": "liability",
-        "opening_balance": 385000.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "2300",
-        "account_number": "2300",
-        "account_name": "Auto Loan Payable",
-        "account_type": "liability",
-        "opening_balance": 18500.00,
-        "opening_balance_date": "2025-01-01"
-    },
+    ("2000", "Accounts Payable", "liability", 3200.00),
+    ("2100", "Credit Card Payable", "liability", 2500.00),
+    ("2200", "Mortgage Payable - Principal", "liability", 385000.00),
+    ("2300", "Auto Loan Payable", "liability", 18500.00),
 
     # EQUITY (3000-3999)
-    {
-        "account_id": "3000",
-        "account_number": "3000",
-        "account_name": "Owner's Equity",
-        "account_type": "equity",
-        "opening_balance": -254300.00,  # Balancing entry
-        "opening_balance_date": "2025-01-01"
-    },
+    ("3000", "Owner's Equity", "equity", -254300.00),  # Balancing entry
 
     # REVENUE (4000-4999)
-    {
-        "account_id": "4000",
-        "account_number": "4000",
-        "account_name": "Salary Income",
-        "account_type": "revenue",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "4100",
-        "account_number": "4100",
-        "account_name": "Consulting Income",
-        "account_type": "revenue",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "4200",
-        "account_number": "4200",
-        "account_name": "Interest Income",
-        "account_type": "revenue",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
+    ("4000", "Salary Income", "revenue", 0.00),
+    ("4100", "Consulting Income", "revenue", 0.00),
+    ("4200", "Interest Income", "revenue", 0.00),
 
     # EXPENSES (5000-9999)
-    {
-        "account_id": "6000",
-        "account_number": "6000",
-        "account_name": "Mortgage Interest Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6010",
-        "account_number": "6010",
-        "account_name": "Property Tax Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6020",
-        "account_number": "6020",
-        "account_name": "Home Insurance Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6100",
-        "account_number": "6100",
-        "account_name": "Electric Utility Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6110",
-        "account_number": "6110",
-        "account_name": "Gas Utility Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6120",
-        "account_number": "6120",
-        "account_name": "Water/Sewer Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6130",
-        "account_number": "6130",
-        "account_name": "Internet/Cable Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6140",
-        "account_number": "6140",
-        "account_name": "Mobile Phone Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6200",
-        "account_number": "6200",
-        "account_name": "Auto Loan Interest Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6210",
-        "account_number": "6210",
-        "account_name": "Auto Insurance Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6220",
-        "account_number": "6220",
-        "account_name": "Auto Fuel Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6300",
-        "account_number": "6300",
-        "account_name": "Groceries Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6310",
-        "account_number": "6310",
-        "account_name": "Dining Out Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6400",
-        "account_number": "6400",
-        "account_name": "Streaming Services Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6410",
-        "account_number": "6410",
-        "account_name": "Gym Membership Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-    {
-        "account_id": "6500",
-        "account_number": "6500",
-        "account_name": "Medical Expense",
-        "account_type": "expense",
-        "opening_balance": 0.00,
-        "opening_balance_date": "2025-01-01"
-    },
-]
+    ("6000", "Mortgage Interest Expense", "expense", 0.00),
+    ("6010", "Property Tax Expense", "expense", 0.00),
+    ("6020", "Home Insurance Expense", "expense", 0.00),
+    ("6100", "Electric Utility Expense", "expense", 0.00),
+    ("6110", "Gas Utility Expense", "expense", 0.00),
+    ("6120", "Water/Sewer Expense", "expense", 0.00),
+    ("6130", "Internet/Cable Expense", "expense", 0.00),
+    ("6140", "Mobile Phone Expense", "expense", 0.00),
+    ("6200", "Auto Loan Interest Expense", "expense", 0.00),
+    ("6210", "Auto Insurance Expense", "expense", 0.00),
+    ("6220", "Auto Fuel Expense", "expense", 0.00),
+    ("6300", "Groceries Expense", "expense", 0.00),
+    ("6310", "Dining Out Expense", "expense", 0.00),
+    ("6400", "Streaming Services Expense", "expense", 0.00),
+    ("6410", "Gym Membership Expense", "expense", 0.00),
+    ("6500", "Medical Expense", "expense", 0.00),
+)
+
+OPENING_BALANCE_DATE = "2025-01-01"
+
+
+@cache
+def chart_of_accounts() -> List[Dict]:
+    """Expand the compact chart of accounts into full account dicts (built once)."""
+    return [
+        {
+            "account_id": account_id,
+            "account_number": account_id,
+            "account_name": account_name,
+            "account_type": account_type,
+            "opening_balance": opening_balance,
+            "opening_balance_date": OPENING_BALANCE_DATE
+        }
+        for account_id, account_name, account_type, opening_balance in _CHART_OF_ACCOUNTS_RAW
+    ]
 
 
 # ============================================================================
@@ -814,179 +650,356 @@ ONE_TIME_TRANSACTIONS = [
 ]
 
 
+# Repeating strings are interned so every generated row shares one object
+for _txn in ONE_TIME_TRANSACTIONS:
+    _txn["date"] = sys.intern(_txn["date"])
+for _txn in RECURRING_TEMPLATES + ONE_TIME_TRANSACTIONS:
+    for _dist in _txn["distributions"]:
+        for _field in ("account_id", "account_type", "flow"):
+            _dist[_field] = sys.intern(_dist[_field])
+
+
+@dataclass(frozen=True, slots=True)
+class DistTemplate:
+    """One distribution of a recurring template, resolved at import."""
+    account_id: str
+    account_type: str
+    flow: str
+    amount: Union[float, str]  # "variable" -> taken from monthly_amounts
+    description: str
+    multiplier: int
+
+
+@dataclass(frozen=True, slots=True)
+class RecurTemplate:
+    """Read-only recurring template with slot-based field access."""
+    template_name: str
+    frequency: str
+    distributions: Tuple[DistTemplate, ...]
+    monthly_amounts: Optional[Tuple[float, ...]] = None
+
+
+def _freeze_templates() -> Tuple[RecurTemplate, ...]:
+    """
+    Convert RECURRING_TEMPLATES (kept as dicts for readability) to records.
+
+    Multipliers depend only on each distribution's constant account type and
+    flow, and descriptions default to the template name, so both are
+    resolved here once instead of per generated transaction.
+    """
+    return tuple(
+        RecurTemplate(
+            template_name=template["template_name"],
+            frequency=template["frequency"],
+            distributions=tuple(
+                DistTemplate(
+                    account_id=dist["account_id"],
+                    account_type=dist["account_type"],
+                    flow=dist["flow"],
+                    amount=dist["amount"],
+                    description=dist.get("desc", template["template_name"]),
+                    multiplier=Distribution.calculate_multiplier(
+                        AccountType(dist["account_type"]),
+                        FlowDirection(dist["flow"])
+                    )
+                )
+                for dist in template["distributions"]
+            ),
+            monthly_amounts=tuple(template["monthly_amounts"]) if "monthly_amounts" in template else None
+        )
+        for template in RECURRING_TEMPLATES
+    )
+
+
+RECURRING_TEMPLATE_RECORDS = _freeze_templates()
+
+
+# Integer codes for the columnar one-time transaction table
+ACCOUNT_TYPES = list(AccountType)
+FLOW_DIRECTIONS = list(FlowDirection)
+ACCOUNT_TYPE_CODES = {member.value: code for code, member in enumerate(ACCOUNT_TYPES)}
+FLOW_DIRECTION_CODES = {member.value: code for code, member in enumerate(FLOW_DIRECTIONS)}
+
+# MULTIPLIER_TABLE[account_type_code, flow_code] -> +1 / -1
+MULTIPLIER_TABLE = np.array([
+    [Distribution.calculate_multiplier(account_type, flow) for flow in FLOW_DIRECTIONS]
+    for account_type in ACCOUNT_TYPES
+], dtype=np.int8)
+
+
+def _build_onetime_columns() -> Dict[str, Any]:
+    """
+    Lay out ONE_TIME_TRANSACTIONS as parallel arrays.
+
+    Transactions get one row each (date, description, distribution offsets);
+    distributions are flattened into their own table with parent_idx pointing
+    back at the transaction, so aggregates like sums by account are plain
+    array ops (e.g. np.bincount over account codes).
+    """
+    counts = [len(txn["distributions"]) for txn in ONE_TIME_TRANSACTIONS]
+    dists = [dist for txn in ONE_TIME_TRANSACTIONS for dist in txn["distributions"]]
+
+    account_type_code = np.array([ACCOUNT_TYPE_CODES[d["account_type"]] for d in dists], dtype=np.int8)
+    flow_code = np.array([FLOW_DIRECTION_CODES[d["flow"]] for d in dists], dtype=np.int8)
+
+    return {
+        "dates": np.array([txn["date"] for txn in ONE_TIME_TRANSACTIONS], dtype="datetime64[D]"),
+        "date_strings": [txn["date"] for txn in ONE_TIME_TRANSACTIONS],
+        "descriptions": [txn["description"] for txn in ONE_TIME_TRANSACTIONS],
+        "dist_offsets": np.concatenate(([0], np.cumsum(counts))).astype(np.int32),
+        "parent_idx": np.repeat(np.arange(len(counts), dtype=np.int32), counts),
+        "account_id": np.array([d["account_id"] for d in dists], dtype=object),
+        "account_type_code": account_type_code,
+        "flow_code": flow_code,
+        "amount": np.array([d["amount"] for d in dists], dtype=np.float64),
+        "multiplier": MULTIPLIER_TABLE[account_type_code, flow_code],
+    }
+
+
+ONE_TIME_COLUMNS = _build_onetime_columns()
+
+
 # ============================================================================
 # TRANSACTION GENERATOR
 # ============================================================================
 
-def generate_recurring_transactions(start_date: date, end_date: date) -> List[Dict]:
+@lru_cache(maxsize=None)
+def iso_date(value: date) -> str:
+    """ISO-format a date, reusing the string for dates seen before."""
+    return value.isoformat()
+
+
+# Sort/merge key for generated transactions (ISO dates sort chronologically)
+ENTRY_DATE_KEY = itemgetter("entry_date")
+
+# Template recurrence rules as parallel arrays, one row per (template, day).
+# Bit m-1 of month_mask marks month m as eligible. Only "monthly" templates
+# use days_of_month; other frequencies without a month filter never match.
+ALL_MONTHS_MASK = (1 << 12) - 1
+
+
+def _build_recurrence_rules() -> Dict[str, np.ndarray]:
+    """Encode RECURRING_TEMPLATES' frequency metadata as NumPy columns."""
+    template_idx, day, month_mask, skip_invalid = [], [], [], []
+    for idx, template in enumerate(RECURRING_TEMPLATES):
+        frequency = template["frequency"]
+        days = (template["day_of_month"],) if "day_of_month" in template else template.get("days_of_month", ())
+        if frequency == "monthly":
+            mask = ALL_MONTHS_MASK
+        elif frequency in ("semiannual", "quarterly"):
+            mask = sum(1 << (month - 1) for month in set(template["months"]))
+        elif frequency == "annual":
+            mask = 1 << (template["month"] - 1)
+        else:
+            mask = 0
+        for day_of_month in days:
+            template_idx.append(idx)
+            day.append(day_of_month)
+            month_mask.append(mask)
+            # Bi-weekly days (15th and 30th) skip months that lack them
+            skip_invalid.append("day_of_month" not in template)
+
+    return {
+        "template_idx": np.array(template_idx, dtype=np.int32),
+        "day": np.array(day, dtype=np.int64),
+        "month_mask": np.array(month_mask, dtype=np.uint16),
+        "skip_invalid": np.array(skip_invalid, dtype=bool),
+    }
+
+
+RECURRENCE_RULES = _build_recurrence_rules()
+
+
+@lru_cache(maxsize=None)
+def _expand_recurring_dates(start_date: date, end_date: date) -> Tuple[Tuple[int, date, int], ...]:
+    """
+    Expand every recurring template over a date range in one set of array ops.
+
+    Returns (template_idx, transaction_date, month_index) rows ordered by
+    template, then month, then day, where month_index counts calendar months
+    from start_date's month.
+    """
+    rules = RECURRENCE_RULES
+    n_months = max(0, (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1)
+    month_index = np.arange(n_months)
+
+    month_starts = np.datetime64(start_date, 'M') + month_index
+    month_lengths = ((month_starts + 1).astype('datetime64[D]') - month_starts.astype('datetime64[D]')).astype(np.int64)
+    month_bits = np.left_shift(1, (month_starts.astype(np.int64) % 12)).astype(np.uint16)
+
+    # rules x months grids
+    eligible = (rules["month_mask"][:, None] & month_bits[None, :]) != 0
+    valid_day = rules["day"][:, None] <= month_lengths[None, :]
+    if np.any(eligible & ~valid_day & ~rules["skip_invalid"][:, None]):
+        raise ValueError("day is out of range for month")
+
+    dates = month_starts.astype('datetime64[D]')[None, :] + (rules["day"][:, None] - 1)
+    in_range = (dates >= np.datetime64(start_date)) & (dates <= np.datetime64(end_date))
+    rule_rows, month_cols = np.nonzero(eligible & valid_day & in_range)
+
+    template_idx = rules["template_idx"][rule_rows]
+    order = np.lexsort((rule_rows, month_cols, template_idx))
+    return tuple(zip(
+        template_idx[order].tolist(),
+        dates[rule_rows[order], month_cols[order]].tolist(),
+        month_cols[order].tolist(),
+    ))
+
+
+def generate_recurring_transactions(start_date: date, end_date: date, now_iso: Optional[str] = None) -> List[Dict]:
     """Generate recurring transactions for the date range."""
-    transactions = []
-    entry_counter = 1000
-
-    for template in RECURRING_TEMPLATES:
-        current_date = start_date
-        month_index = 0
-
-        while current_date <= end_date:
-            should_generate = False
-            transaction_date = None
-
-            # Monthly transactions
-            if template["frequency"] == "monthly":
-                if "day_of_month" in template:
-                    transaction_date = date(current_date.year, current_date.month, template["day_of_month"])
-                    if start_date <= transaction_date <= end_date:
-                        should_generate = True
-                elif "days_of_month" in template:
-                    # Bi-weekly (15th and 30th)
-                    for day in template["days_of_month"]:
-                        try:
-                            transaction_date = date(current_date.year, current_date.month, day)
-                            if start_date <= transaction_date <= end_date:
-                                transactions.append(create_transaction_from_template(
-                                    template, transaction_date, entry_counter, month_index
-                                ))
-                                entry_counter += 1
-                        except ValueError:
-                            pass  # Invalid day for month
-
-            # Semi-annual transactions
-            elif template["frequency"] == "semiannual":
-                if current_date.month in template["months"]:
-                    transaction_date = date(current_date.year, current_date.month, template["day_of_month"])
-                    if start_date <= transaction_date <= end_date:
-                        should_generate = True
-
-            # Annual transactions
-            elif template["frequency"] == "annual":
-                if current_date.month == template["month"]:
-                    transaction_date = date(current_date.year, current_date.month, template["day_of_month"])
-                    if start_date <= transaction_date <= end_date:
-                        should_generate = True
-
-            # Quarterly transactions
-            elif template["frequency"] == "quarterly":
-                if current_date.month in template["months"]:
-                    transaction_date = date(current_date.year, current_date.month, template["day_of_month"])
-                    if start_date <= transaction_date <= end_date:
-                        should_generate = True
-
-            if should_generate and transaction_date:
-                transactions.append(create_transaction_from_template(
-                    template, transaction_date, entry_counter, month_index
-                ))
-                entry_counter += 1
-
-            # Move to next month
-            if current_date.month == 12:
-                current_date = date(current_date.year + 1, 1, 1)
-            else:
-                current_date = date(current_date.year, current_date.month + 1, 1)
-            month_index += 1
-
-    return sorted(transactions, key=lambda x: x["entry_date"])
-
-
-def create_transaction_from_template(template: Dict, transaction_date: date, entry_num: int, month_index: int) -> Dict:
+    if now_iso is None:
+        now_iso = datetime.utcnow().isoformat()
+
+    transactions = [
+        create_transaction_from_template(
+            RECURRING_TEMPLATE_RECORDS[template_idx], transaction_date, entry_num, month_index, now_iso
+        )
+        for entry_num, (template_idx, transaction_date, month_index)
+        in enumerate(_expand_recurring_dates(start_date, end_date), start=1000)
+    ]
+
+    return sorted(transactions, key=ENTRY_DATE_KEY)
+
+
+def create_transaction_from_template(template: RecurTemplate, transaction_date: date, entry_num: int, month_index: int,
+                                     now_iso: Optional[str] = None) -> Dict:
     """Create a journal entry from a recurring template."""
+    if now_iso is None:
+        now_iso = datetime.utcnow().isoformat()
     distributions = []
 
-    for dist_template in template["distributions"]:
-        amount = dist_template["amount"]
+    monthly_amounts = template.monthly_amounts
+    for dist_template in template.distributions:
+        amount = dist_template.amount
 
         # Handle variable amounts
-        if amount == "variable" and "monthly_amounts" in template:
-            amount = template["monthly_amounts"][month_index % len(template["monthly_amounts"])]
+        if amount == "variable" and monthly_amounts is not None:
+            amount = monthly_amounts[month_index % len(monthly_amounts)]
 
         distributions.append({
-            "account_id": dist_template["account_id"],
-            "account_type": dist_template["account_type"],
-            "flow_direction": dist_template["flow"],
+            "account_id": dist_template.account_id,
+            "account_type": dist_template.account_type,
+            "flow_direction": dist_template.flow,
             "amount": amount,
-            "multiplier": Distribution.calculate_multiplier(
-                AccountType(dist_template["account_type"]),
-                FlowDirection(dist_template["flow"])
-            ),
-            "description": dist_template.get("desc", template["template_name"])
+            "multiplier": dist_template.multiplier,
+            "description": dist_template.description
         })
 
     return {
         "journal_entry_id": f"je-recur-{entry_num}",
         "entry_number": f"JE-2025-{entry_num:04d}",
         "entry_type": "standard",
-        "entry_date": transaction_date.isoformat(),
-        "posting_date": transaction_date.isoformat(),
-        "description": template["template_name"],
+        "entry_date": iso_date(transaction_date),
+        "posting_date": iso_date(transaction_date),
+        "description": template.template_name,
         "status": "posted",
         "distributions": distributions,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
+        "created_at": now_iso,
+        "updated_at": now_iso
     }
 
 
-def generate_onetime_transactions() -> List[Dict]:
+def generate_onetime_transactions(now_iso: Optional[str] = None) -> List[Dict]:
     """Generate one-time transactions."""
+    if now_iso is None:
+        now_iso = datetime.utcnow().isoformat()
+
+    columns = ONE_TIME_COLUMNS
+    date_strings = columns["date_strings"]
+    descriptions = columns["descriptions"]
+    offsets = columns["dist_offsets"].tolist()
+    account_ids = columns["account_id"].tolist()
+    account_types = [ACCOUNT_TYPES[code].value for code in columns["account_type_code"].tolist()]
+    flows = [FLOW_DIRECTIONS[code].value for code in columns["flow_code"].tolist()]
+    amounts = columns["amount"].tolist()
+    multipliers = columns["multiplier"].tolist()
+
+    # Entry numbers follow the template order; output is date order
     transactions = []
-    entry_counter = 2000
-
-    for txn in ONE_TIME_TRANSACTIONS:
-        distributions = []
-
-        for dist in txn["distributions"]:
-            distributions.append({
-                "account_id": dist["account_id"],
-                "account_type": dist["account_type"],
-                "flow_direction": dist["flow"],
-                "amount": dist["amount"],
-                "multiplier": Distribution.calculate_multiplier(
-                    AccountType(dist["account_type"]),
-                    FlowDirection(dist["flow"])
-                ),
-                "description": txn["description"]
-            })
-
+    for idx in np.argsort(columns["dates"], kind="stable").tolist():
+        entry_counter = 2000 + idx
+        txn_date = date_strings[idx]
+        description = descriptions[idx]
         transactions.append({
             "journal_entry_id": f"je-onetime-{entry_counter}",
             "entry_number": f"JE-2025-{entry_counter:04d}",
             "entry_type": "standard",
-            "entry_date": txn["date"],
-            "posting_date": txn["date"],
-            "description": txn["description"],
+            "entry_date": txn_date,
+            "posting_date": txn_date,
+            "description": description,
             "status": "posted",
-            "distributions": distributions,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
+            "distributions": [
+                {
+                    "account_id": account_ids[i],
+                    "account_type": account_types[i],
+                    "flow_direction": flows[i],
+                    "amount": amounts[i],
+                    "multiplier": multipliers[i],
+                    "description": description
+                }
+                for i in range(offsets[idx], offsets[idx + 1])
+            ],
+            "created_at": now_iso,
+            "updated_at": now_iso
         })
-        entry_counter += 1
 
-    return sorted(transactions, key=lambda x: x["entry_date"])
+    return transactions
+
+
+def generate_complete_dataset(stream: Optional[IO[bytes]] = None) -> Dict:
+    """
+    Generate complete 3-month dataset.
 
+    Args:
+        stream: Optional binary file to write the dataset to as JSON. Each
+            transaction is serialized with orjson as it comes out of the
+            merge instead of being collected into a list first.
 
-def generate_complete_dataset():
-    """Generate complete 3-month dataset."""
+    Returns:
+        The dataset dict; when streaming, it holds only the chart of
+        accounts and summary since the transactions went to the stream.
+    """
     start_date = date(2025, 1, 1)
     end_date = date(2025, 3, 31)
 
-    # Generate all transactions
-    recurring = generate_recurring_transactions(start_date, end_date)
-    onetime = generate_onetime_transactions()
+    # Generate all transactions with one shared creation timestamp
+    now_iso = datetime.utcnow().isoformat()
+    recurring = generate_recurring_transactions(start_date, end_date, now_iso)
+    onetime = generate_onetime_transactions(now_iso)
+
+    summary = {
+        "period_start": start_date.isoformat(),
+        "period_end": end_date.isoformat(),
+        "total_transactions": len(recurring) + len(onetime),
+        "recurring_transactions": len(recurring),
+        "onetime_transactions": len(onetime)
+    }
+
+    # Both lists are already date-sorted, so a linear merge replaces a re-sort
+    merged = heapq.merge(recurring, onetime, key=ENTRY_DATE_KEY)
+
+    if stream is not None:
+        stream.write(b'{"chart_of_accounts":' + orjson.dumps(chart_of_accounts()) + b',"transactions":[')
+        separator = b'\n'
+        for idx, txn in enumerate(merged, start=1):
+            txn["entry_number"] = f"JE-2025-{idx:04d}"
+            stream.write(separator)
+            stream.write(orjson.dumps(txn))
+            separator = b',\n'
+        stream.write(b'\n],"summary":' + orjson.dumps(summary) + b'}\n')
+        return {"chart_of_accounts": chart_of_accounts(), "summary": summary}
 
-    all_transactions = sorted(recurring + onetime, key=lambda x: x["entry_date"])
+    all_transactions = list(merged)
 
     # Renumber sequentially
     for idx, txn in enumerate(all_transactions, start=1):
         txn["entry_number"] = f"JE-2025-{idx:04d}"
 
     dataset = {
-        "chart_of_accounts": CHART_OF_ACCOUNTS,
+        "chart_of_accounts": chart_of_accounts(),
         "transactions": all_transactions,
-        "summary": {
-            "period_start": start_date.isoformat(),
-            "period_end": end_date.isoformat(),
-            "total_transactions": len(all_transactions),
-            "recurring_transactions": len(recurring),
-            "onetime_transactions": len(onetime)
-        }
+        "summary": summary
     }
 
     return dataset
@@ -999,12 +1012,10 @@ def generate_complete_dataset():
 if __name__ == "__main__":
     print("Generating 3-month transaction dataset...")
 
-    dataset = generate_complete_dataset()
-
-    # Save to JSON file
+    # Stream to JSON file
     output_file = "/Users/ksd/Projects/LiMOS/projects/accounting/test_data/three_month_dataset.json"
-    with open(output_file, 'w') as f:
-        json.dump(dataset, f, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        dataset = generate_complete_dataset(stream=f)
 
     print(f"\n✅ Dataset generated successfully!")
     print(f"📁 Saved to: {output_file}")
@@ -1014,8 +1025,3 @@ if __name__ == "__main__":
     print(f"   Recurring: {dataset['summary']['recurring_transactions']}")
     print(f"   One-time: {dataset['summary']['onetime_transactions']}")
     print(f"   Chart of Accounts: {len(dataset['chart_of_accounts'])} accounts")
-
-    # Print sample transactions
-    print(f"\n📝 Sample Transactions:")
-    for txn in dataset['transactions'][:5]:
-        print(f"   {txn['entry_date']} - {txn['description']} ({len(txn['distributions'])} distributions)")
@@ -0,0 +1,105 @@
+"""
+Tests for bulk journal entry status updates.
+
+Posted entries must never be moved back to draft/void by a bulk status
+update; they are skipped and reported instead.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from ..api import main_db
+from ..database.database import get_db_session
+from ..database.models import Base, JournalEntryDB
+from ..database.repositories import JournalEntryRepository
+from ..models.journal_entries import BulkStatusUpdate, JournalEntryStatus
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with one draft and one posted entry."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    for entry_id, status, posting_date in (
+        ("je-draft", "draft", None),
+        ("je-posted", "posted", "2030-01-15"),
+    ):
+        session.add(JournalEntryDB(
+            journal_entry_id=entry_id,
+            entry_type="standard",
+            entry_date="2030-01-15",
+            posting_date=posting_date,
+            description=f"{status} entry",
+            status=status,
+        ))
+    session.commit()
+
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _status(db, entry_id):
+    db.expire_all()
+    return db.get(JournalEntryDB, entry_id).status
+
+
+def test_repository_skips_posted_entries(db):
+    """Only non-posted entries are updated; posted ones keep their status."""
+    updated_ids = JournalEntryRepository.bulk_update_status(db, [
+        BulkStatusUpdate(journal_entry_id="je-draft", status=JournalEntryStatus.VOID),
+        BulkStatusUpdate(journal_entry_id="je-posted", status=JournalEntryStatus.DRAFT),
+    ])
+
+    assert updated_ids == ["je-draft"]
+    assert _status(db, "je-draft") == "void"
+    assert _status(db, "je-posted") == "posted"
+
+
+def test_repository_ignores_unknown_ids(db):
+    """Ids that don't exist are not reported as updated."""
+    updated_ids = JournalEntryRepository.bulk_update_status(db, [
+        BulkStatusUpdate(journal_entry_id="missing", status=JournalEntryStatus.VOID),
+    ])
+
+    assert updated_ids == []
+
+
+@pytest.fixture
+def client(db):
+    """Accounting API client bound to the in-memory session."""
+    main_db.app.dependency_overrides[get_db_session] = lambda: db
+    yield TestClient(main_db.app)
+    main_db.app.dependency_overrides.clear()
+
+
+def test_endpoint_reports_skipped_entries(client, db):
+    """Posted and unknown entries come back in 'skipped' and are unchanged."""
+    response = client.patch("/api/journal-entries:bulk-status", json=[
+        {"journal_entry_id": "je-draft", "status": "void"},
+        {"journal_entry_id": "je-posted", "status": "draft", "posting_date": None},
+        {"journal_entry_id": "missing", "status": "void"},
+    ])
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 1, "skipped": ["je-posted", "missing"]}
+    assert _status(db, "je-posted") == "posted"
+
+
+def test_endpoint_rejects_posted_target(client, db):
+    """Posting still has to go through the post endpoint."""
+    response = client.patch("/api/journal-entries:bulk-status", json=[
+        {"journal_entry_id": "je-draft", "status": "posted"},
+    ])
+
+    assert response.status_code == 400
+    assert _status(db, "je-draft") == "draft"
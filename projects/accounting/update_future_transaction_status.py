@@ -6,37 +6,124 @@ Updates all transactions with future dates to have status='draft' instead of 'po
 Updates both test dataset files and the live API database.
 """
 
+import asyncio
 import json
-import requests
+import mmap
+import os
+import httpx
+import numpy as np
 from pathlib import Path
-from datetime import datetime, date
+from datetime import date
 from typing import List, Dict, Any
 
+# orjson is much faster on multi-MB datasets; fall back to json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "http://localhost:8000/api"
 
+# Status values compared/assigned per transaction
+POSTED = "posted"
+DRAFT = "draft"
+
+# Maximum in-flight PUTs when updating the live database
+MAX_CONCURRENT_UPDATES = 16
+
 
 def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
     """Load JSON file."""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            # mmap rejects empty files; let orjson raise its usual error
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(f.read())
+            # Parse straight from the page cache, no read() copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
     with open(file_path, 'r') as f:
         return json.load(f)
 
 
+def _dump_json(value: Any) -> bytes:
+    """Serialize one value with orjson using the dataset options."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _write_json_array(f, items: List[Any]):
+    """Write a JSON array one orjson-encoded item per line."""
+    f.write(b'[')
+    separator = b'\n'
+    for item in items:
+        f.write(separator)
+        f.write(_dump_json(item))
+        separator = b',\n'
+    f.write(b'\n]')
+
+
 def save_json_file(file_path: Path, data: List[Dict[str, Any]]):
-    """Save JSON file with formatting."""
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    """
+    Save JSON file.
+
+    With orjson, lists (top-level or top-level dict values such as
+    'transactions') are written one item at a time, so the whole file is
+    never built as a single string.
+    """
+    if orjson is None:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        return
 
+    with open(file_path, 'wb') as f:
+        if isinstance(data, list):
+            _write_json_array(f, data)
+        elif isinstance(data, dict):
+            f.write(b'{')
+            separator = b'\n'
+            for key, value in data.items():
+                f.write(separator + _dump_json(key) + b': ')
+                if isinstance(value, list):
+                    _write_json_array(f, value)
+                else:
+                    f.write(_dump_json(value))
+                separator = b',\n'
+            f.write(b'\n}')
+        else:
+            f.write(_dump_json(data))
+        f.write(b'\n')
 
-def is_future_date(date_str: str) -> bool:
-    """Check if date string is in the future."""
+
+def is_future_date(date_str: str, today: date) -> bool:
+    """Check if date string (ISO date or datetime) is after today."""
     try:
-        entry_date = datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
-        return entry_date > date.today()
-    except Exception as e:
+        # The first 10 characters of any ISO date/datetime are the date
+        return date.fromisoformat(date_str[:10]) > today
+    except ValueError as e:
         print(f"Error parsing date {date_str}: {e}")
         return False
 
 
+def future_date_indices(transactions: List[Dict[str, Any]], today: date) -> List[int]:
+    """
+    Indices of transactions whose entry_date is after today.
+
+    The date column is compared in one NumPy pass; if any entry_date is not
+    a parseable ISO date, fall back to checking rows one at a time.
+    """
+    try:
+        entry_dates = np.array(
+            [(transaction.get('entry_date') or '')[:10] for transaction in transactions],
+            dtype='datetime64[D]'
+        )
+    except ValueError:
+        return [
+            idx for idx, transaction in enumerate(transactions)
+            if transaction.get('entry_date') and is_future_date(transaction['entry_date'], today)
+        ]
+    return np.flatnonzero(entry_dates > np.datetime64(today, 'D')).tolist()
+
+
 def update_test_dataset(file_path: Path):
     """Update transaction status in test dataset file."""
     print(f"\nUpdating {file_path.name}...")
@@ -53,71 +140,125 @@ def update_test_dataset(file_path: Path):
         print(f"   ✗ Unknown data format")
         return
 
-    for transaction in transactions:
-        entry_date = transaction.get('entry_date')
-        if entry_date and is_future_date(entry_date):
-            if transaction.get('status') == 'posted':
-                transaction['status'] = 'draft'
-                # Clear posting_date for draft transactions
-                transaction['posting_date'] = None
-                updated_count += 1
+    today = date.today()
+    for idx in future_date_indices(transactions, today):
+        transaction = transactions[idx]
+        if transaction.get('status') == POSTED:
+            transaction['status'] = DRAFT
+            # Clear posting_date for draft transactions
+            transaction['posting_date'] = None
+            updated_count += 1
 
     save_json_file(file_path, data)
     print(f"   Updated {updated_count} future transactions to draft status")
     print(f"   Total transactions in file: {len(transactions)}")
 
 
-def update_live_database():
+async def _put_draft(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    transaction: Dict[str, Any]
+) -> bool:
+    """PUT one future-dated transaction back as a draft; returns success."""
+    journal_entry_id = transaction.get('journal_entry_id')
+    entry_date = transaction.get('entry_date')
+
+    # Update transaction status to draft
+    update_payload = transaction.copy()
+    update_payload['status'] = DRAFT
+    update_payload['posting_date'] = None
+
+    async with semaphore:
+        try:
+            update_response = await client.put(
+                f"/journal-entries/{journal_entry_id}",
+                json=update_payload,
+                timeout=5
+            )
+        except Exception as e:
+            print(f"   ✗ Error updating {journal_entry_id}: {e}")
+            return False
+
+    if update_response.status_code == 200:
+        print(f"   ✓ Updated {journal_entry_id} ({entry_date})")
+        return True
+
+    print(f"   ✗ Failed to update {journal_entry_id}: {update_response.status_code}")
+    return False
+
+
+async def _bulk_set_draft(client: httpx.AsyncClient, candidates: List[Dict[str, Any]]):
+    """
+    Move all candidates to draft with one bulk-status PATCH.
+
+    Returns (updated, errors), or (None, None) if the server has no bulk
+    endpoint.
+    """
+    payload = [
+        {"journal_entry_id": transaction.get('journal_entry_id'), "status": DRAFT, "posting_date": None}
+        for transaction in candidates
+    ]
+    response = await client.patch("/journal-entries:bulk-status", json=payload)
+    if response.status_code in (404, 405):
+        return None, None
+    response.raise_for_status()
+
+    result = response.json()
+    updated_count = result["updated"]
+    skipped = result.get("skipped", [])
+    print(f"   ✓ Updated {updated_count} entries in one bulk request")
+    if skipped:
+        # The server never re-drafts posted entries; they need a reversal
+        print(f"   ✗ Skipped {len(skipped)} entries the server would not re-draft (already posted)")
+    return updated_count, len(candidates) - updated_count
+
+
+async def _put_drafts(client: httpx.AsyncClient, candidates: List[Dict[str, Any]]):
+    """PUT candidates back as drafts concurrently; returns (updated, errors)."""
+    # Updates touch disjoint entries, so send them concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+    results = await asyncio.gather(*(
+        _put_draft(client, semaphore, transaction) for transaction in candidates
+    ))
+    updated_count = sum(results)
+    return updated_count, len(results) - updated_count
+
+
+async def update_live_database():
     """Update transaction status in live API database."""
     print(f"\nUpdating live database via API...")
 
-    try:
-        # Get all transactions
-        response = requests.get(f"{API_BASE_URL}/journal-entries", params={"limit": 1000}, timeout=10)
-        response.raise_for_status()
-        transactions = response.json()
-
-        print(f"   Found {len(transactions)} total transactions")
-
-        updated_count = 0
-        error_count = 0
-
-        for transaction in transactions:
-            entry_date = transaction.get('entry_date')
-            journal_entry_id = transaction.get('journal_entry_id')
-
-            if entry_date and is_future_date(entry_date) and transaction.get('status') == 'posted':
-                try:
-                    # Update transaction status to draft
-                    update_payload = transaction.copy()
-                    update_payload['status'] = 'draft'
-                    update_payload['posting_date'] = None
-
-                    update_response = requests.put(
-                        f"{API_BASE_URL}/journal-entries/{journal_entry_id}",
-                        json=update_payload,
-                        timeout=5
-                    )
-
-                    if update_response.status_code == 200:
-                        updated_count += 1
-                        print(f"   ✓ Updated {journal_entry_id} ({entry_date})")
-                    else:
-                        error_count += 1
-                        print(f"   ✗ Failed to update {journal_entry_id}: {update_response.status_code}")
-
-                except Exception as e:
-                    error_count += 1
-                    print(f"   ✗ Error updating {journal_entry_id}: {e}")
-
-        print(f"\n   Updated {updated_count} future transactions to draft status")
-        if error_count > 0:
-            print(f"   {error_count} errors occurred")
-
-    except requests.exceptions.ConnectionError:
-        print("   ✗ Could not connect to API server. Make sure it's running on http://localhost:8000")
-    except Exception as e:
-        print(f"   ✗ Error: {e}")
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    async with httpx.AsyncClient(base_url=API_BASE_URL, limits=limits, timeout=10.0) as client:
+        try:
+            # Get all transactions
+            response = await client.get("/journal-entries", params={"limit": 1000})
+            response.raise_for_status()
+            transactions = response.json()
+
+            print(f"   Found {len(transactions)} total transactions")
+
+            today = date.today()
+            candidates = [
+                transaction for transaction in transactions
+                if transaction.get('entry_date')
+                and is_future_date(transaction['entry_date'], today)
+                and transaction.get('status') == POSTED
+            ]
+
+            updated_count, error_count = await _bulk_set_draft(client, candidates)
+            if updated_count is None:
+                # Server without the bulk endpoint: update entries one by one
+                updated_count, error_count = await _put_drafts(client, candidates)
+
+            print(f"\n   Updated {updated_count} future transactions to draft status")
+            if error_count > 0:
+                print(f"   {error_count} errors occurred")
+
+        except httpx.ConnectError:
+            print("   ✗ Could not connect to API server. Make sure it's running on http://localhost:8000")
+        except Exception as e:
+            print(f"   ✗ Error: {e}")
 
 
 def main():
@@ -147,7 +288,7 @@ def main():
             print(f"\nSkipping {file_path.name} (file not found)")
 
     # Update live database
-    update_live_database()
+    asyncio.run(update_live_database())
 
     print("\n" + "=" * 70)
     print("COMPLETE!")
@@ -0,0 +1,159 @@
+"""
+API Response Cache
+
+Optional caches for hot read-only endpoints:
+
+- Redis read-through cache for list/stats response bodies, enabled only
+  when the redis package is installed and REDIS_URL is set.
+- In-process TTL cache (cachetools) for single-row lookups by ID, used
+  as a per-worker L1 in front of the database.
+
+Without the optional packages every lookup falls through to the database.
+Write handlers clear both caches after committing, before they respond;
+writes made outside this process (or in another worker) are picked up
+once the TTL expires.
+
+JSON responses built here carry an ETag derived from the body, and a
+matching If-None-Match is answered with an empty 304.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import orjson
+from fastapi import Request, Response
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+
+CACHE_PREFIX = "limos:api:"
+CACHE_TTL_SECONDS = int(os.getenv("API_CACHE_TTL", "30"))
+
+LOCAL_CACHE_SIZE = 10_000
+LOCAL_CACHE_TTL_SECONDS = 5
+
+
+def _connect():
+    """Create the Redis client, or None when caching is disabled."""
+    url = os.getenv("REDIS_URL")
+    if redis is None or not url:
+        return None
+    return redis.Redis.from_url(url)
+
+
+redis_client = _connect()
+
+local_cache = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL_SECONDS) if TTLCache is not None else None
+local_cache_lock = threading.Lock()
+
+
+def cached_lookup(key: Hashable, fetch: Callable[[], Optional[Any]]) -> Optional[Any]:
+    """
+    Return fetch() through the in-process TTL cache.
+
+    Misses (None) are not cached, so a 404 never hides a newly created row.
+    Cached values are shared between requests and must not be mutated.
+    """
+    if local_cache is None:
+        return fetch()
+
+    with local_cache_lock:
+        value = local_cache.get(key)
+    if value is None:
+        value = fetch()
+        if value is not None:
+            with local_cache_lock:
+                local_cache[key] = value
+    return value
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match lists etag (or is *)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, f"W/{etag}", "*") for tag in if_none_match.split(","))
+
+
+def etag_response(request: Request, body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Return body as JSON with an ETag, or an empty 304 if the client has it.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: Serialized JSON body
+        headers: Extra headers for both the 200 and the 304
+
+    Returns:
+        200 Response with body, or 304 Response without one
+    """
+    etag = body_etag(body)
+    headers = {**(headers or {}), "ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def json_etag_response(request: Request, content: Any) -> Response:
+    """Serialize content with orjson and return it through etag_response."""
+    return etag_response(request, orjson.dumps(content))
+
+
+def cached_json_response(key: str, build: Callable[[], Any], request: Request) -> Response:
+    """
+    Return a JSON response for key, building and caching it on a miss.
+
+    Args:
+        key: Cache key (namespaced automatically)
+        build: Produces the JSON-compatible body on a cache miss
+        request: Incoming request, for the ETag / If-None-Match check
+
+    Returns:
+        Response with the serialized JSON body (or 304)
+    """
+    if redis_client is None:
+        return json_etag_response(request, build())
+
+    key = CACHE_PREFIX + key
+    try:
+        body = redis_client.get(key)
+    except redis.RedisError:
+        body = None
+    if body is None:
+        body = orjson.dumps(build())
+        try:
+            redis_client.setex(key, CACHE_TTL_SECONDS, body)
+        except redis.RedisError:
+            pass
+    return etag_response(request, body)
+
+
+def invalidate_cache() -> None:
+    """Drop every cached API response and lookup."""
+    if local_cache is not None:
+        with local_cache_lock:
+            local_cache.clear()
+
+    if redis_client is None:
+        return
+    try:
+        keys = list(redis_client.scan_iter(match=CACHE_PREFIX + "*", count=500))
+        if keys:
+            redis_client.unlink(*keys)
+    except redis.RedisError:
+        pass
@@ -13,17 +13,23 @@ All endpoints are prefixed by module:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import routers from each module
 from .routers import accounting, fleet, orchestrator
 
+# Health check dependencies
+from projects.fleet.database import get_db_connection, VehicleRepository
+from projects.accounting.database import JournalEntryRepository
+
 # Initialize FastAPI app
 app = FastAPI(
     title="LiMOS Unified API",
     description="Unified REST API for Life Management Operating System",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware - configure for your frontend
@@ -72,33 +78,21 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+def health_check():
     """Combined health check for all modules."""
-    # Import database functions from each module
-    from projects.fleet.database import get_db_connection, VehicleRepository
-    from projects.accounting.database import get_db, JournalEntryRepository
-
     # Check accounting
     try:
-        # For Notion backend, db is None; for SQL, get a session
-        from projects.accounting.database import ACCOUNTING_BACKEND
-        if ACCOUNTING_BACKEND == "notion":
-            db = None
-        else:
-            db_gen = get_db()
-            db = next(db_gen)
-
-        # Try to get journal entries count
-        entries = JournalEntryRepository.get_all(db, limit=1)
+        # Same backend-aware dependency as the accounting routes:
+        # None for Notion, a SQL session otherwise
+        db_gen = accounting.get_db_dependency()
+        db = next(db_gen)
+        try:
+            # Try to get journal entries count
+            entries = JournalEntryRepository.get_all(db, limit=1)
+        finally:
+            db_gen.close()
         accounting_status = "healthy"
         acct_data = {"entries_accessible": len(entries) >= 0}
-
-        # Close SQL session if it was opened
-        if ACCOUNTING_BACKEND != "notion":
-            try:
-                next(db_gen)
-            except StopIteration:
-                pass
     except Exception as e:
         accounting_status = f"error: {str(e)}"
         acct_data = {}
@@ -107,9 +101,8 @@ async def health_check():
     try:
         conn = get_db_connection()
         try:
-            vehicles = VehicleRepository.get_all(conn, limit=1)
+            fleet_data_loaded = VehicleRepository.has_any(conn)
             fleet_status = "healthy"
-            fleet_data_loaded = len(vehicles) > 0
         finally:
             conn.close()
     except Exception as e:
@@ -6,7 +6,9 @@ This module defines all event types, categories, and data models used
 by the event classification system.
 """
 
+import json
 from enum import Enum
+from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 
@@ -70,6 +72,19 @@ class EventCategory(str, Enum):
 # Event Models
 # ============
 
+EXAMPLES_DIR = Path(__file__).parent / "examples"
+
+
+def load_schema_example(schema: Dict[str, Any], model: type) -> None:
+    """
+    Add the model's example from examples/<ModelName>.json to its JSON schema.
+
+    Only called when a schema is generated (e.g. for /docs), so the example
+    payloads aren't built at import time.
+    """
+    schema["example"] = json.loads((EXAMPLES_DIR / f"{model.__name__}.json").read_text())
+
+
 class ClassifiedEvent(BaseModel):
     """
     A classified event ready for module routing.
@@ -113,25 +128,7 @@ class ClassifiedEvent(BaseModel):
     )
 
     class Config:
-        schema_extra = {
-            "example": {
-                "event_type": "pump_event",
-                "category": "fleet",
-                "module": "fleet",
-                "action": "create",
-                "extracted_data": {
-                    "price": 3.75,
-                    "quantity": 12.0,
-                    "unit_of_measure": "gallons",
-                    "cost": 45.00,
-                    "fuel_type": "regular",
-                    "odometer": 45000
-                },
-                "confidence": 0.98,
-                "is_primary": True,
-                "triggers_secondary": ["purchase"]
-            }
-        }
+        json_schema_extra = staticmethod(load_schema_example)
 
 
 class EventClassificationResult(BaseModel):
@@ -165,46 +162,7 @@ class EventClassificationResult(BaseModel):
     )
 
     class Config:
-        schema_extra = {
-            "example": {
-                "primary_event": {
-                    "event_type": "pump_event",
-                    "category": "fleet",
-                    "module": "fleet",
-                    "action": "create",
-                    "extracted_data": {
-                        "price": 3.75,
-                        "quantity": 12.0,
-                        "unit_of_measure": "gallons",
-                        "cost": 45.00,
-                        "fuel_type": "regular",
-                        "odometer": 45000
-                    },
-                    "confidence": 0.98,
-                    "is_primary": True,
-                    "triggers_secondary": ["purchase"]
-                },
-                "secondary_events": [
-                    {
-                        "event_type": "purchase",
-                        "category": "money",
-                        "module": "accounting",
-                        "action": "create",
-                        "extracted_data": {
-                            "amount": 45.00,
-                            "description": "Fuel purchase",
-                            "category": "gas"
-                        },
-                        "confidence": 0.98,
-                        "is_primary": False,
-                        "triggers_secondary": None
-                    }
-                ],
-                "intent": "Log vehicle refueling and expense",
-                "confidence": 0.98,
-                "clarification_needed": None
-            }
-        }
+        json_schema_extra = staticmethod(load_schema_example)
 
 
 # Event Type Mappings
@@ -283,23 +241,36 @@ CATEGORY_MODULE_MAP = {
 }
 
 
+# Event type string -> category / module, resolved once from the maps above
+_TYPE_TO_CATEGORY = {
+    event_type: EVENT_CATEGORY_MAP[enum_value]
+    for event_type, enum_value in EVENT_TYPE_MAP.items()
+}
+_TYPE_TO_MODULE = {
+    event_type: CATEGORY_MODULE_MAP[category]
+    for event_type, category in _TYPE_TO_CATEGORY.items()
+}
+
+
 # Helper Functions
 # ================
 
 def get_event_category(event_type: str) -> EventCategory:
     """Get the category for a given event type string."""
-    enum_value = EVENT_TYPE_MAP.get(event_type)
-    if not enum_value:
-        raise ValueError(f"Unknown event type: {event_type}")
-    return EVENT_CATEGORY_MAP[enum_value]
+    try:
+        return _TYPE_TO_CATEGORY[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
 
 
 def get_event_module(event_type: str) -> str:
     """Get the module name for a given event type string."""
-    category = get_event_category(event_type)
-    return CATEGORY_MODULE_MAP[category]
+    try:
+        return _TYPE_TO_MODULE[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
 
 
 def is_valid_event_type(event_type: str) -> bool:
     """Check if an event type string is valid."""
-    return event_type in EVENT_TYPE_MAP
+    return event_type in _TYPE_TO_MODULE
@@ -4,9 +4,11 @@ Accounting Module Router
 All accounting endpoints prefixed with /api/accounting/*
 """
 
-from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi import APIRouter, HTTPException, status, Query, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+import hashlib
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
 from sqlalchemy.orm import Session
 
 # Import models from accounting module
@@ -16,6 +18,7 @@ from projects.accounting.models.journal_entries import (
     RecurringJournalEntry,
     AccountType,
     JournalEntryStatus,
+    BulkStatusUpdate,
 )
 from projects.accounting.models.budget_envelopes import (
     BudgetEnvelope,
@@ -30,30 +33,45 @@ from projects.accounting.database import (
     BudgetEnvelopeRepository,
     PaymentEnvelopeRepository,
     RecurringJournalEntryRepository,
+    get_envelope_summary,
+    get_record_counts,
     ACCOUNTING_BACKEND
 )
 
+from projects.api.cache import (
+    cached_json_response,
+    cached_lookup,
+    etag_matches,
+    invalidate_cache,
+    json_etag_response,
+)
+
 # Import services from accounting module
 from projects.accounting.services.envelope_service import EnvelopeService
 from projects.accounting.services.recurring_transaction_service import RecurringTransactionService
 
-# Initialize router
+# Initialize router (write handlers clear the read cache once committed)
 router = APIRouter()
 
+# Enum member -> stored string value for repository filters (None -> None)
+STATUS_VALUES = {member: member.value for member in JournalEntryStatus}
+ACCOUNT_TYPE_VALUES = {member: member.value for member in AccountType}
+
+# Generated entries inserted per round trip when expanding templates
+EXPAND_INSERT_BATCH_SIZE = 500
+
 # Initialize services
 envelope_service = EnvelopeService()
 recurring_service = RecurringTransactionService()
 
-# Backend-aware database dependency
-def get_db_dependency():
-    """
-    Returns database session or None based on backend.
-    For SQL: returns SQLAlchemy session
-    For Notion: returns None (Notion repositories don't need sessions)
-    """
-    if ACCOUNTING_BACKEND == "notion":
+# Backend-aware database dependency, selected once at import
+if ACCOUNTING_BACKEND == "notion":
+    def get_db_dependency():
+        """Returns None: Notion repositories don't need sessions."""
         yield None
-    else:
+else:
+    def get_db_dependency():
+        """Returns a SQLAlchemy session, closed after the request."""
         db_gen = get_db()
         db = next(db_gen)
         try:
@@ -69,15 +87,21 @@ def get_db_dependency():
 # JOURNAL ENTRIES
 # ============================================================================
 
-@router.post("/journal-entries", response_model=JournalEntry, status_code=status.HTTP_201_CREATED)
-async def create_journal_entry(entry: JournalEntry, db = Depends(get_db_dependency)):
+@router.post(
+    "/journal-entries",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": JournalEntry}}
+)
+def create_journal_entry(entry: JournalEntry, db = Depends(get_db_dependency)):
     """Create a new journal entry."""
     # Validate balanced
     if not entry.is_balanced():
+        from_total, to_total = entry.balance_totals()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Journal entry is not balanced. FROM: {sum(d.amount for d in entry.get_from_distributions())}, "
-                   f"TO: {sum(d.amount for d in entry.get_to_distributions())}"
+            detail=f"Journal entry is not balanced. FROM: {from_total}, TO: {to_total}"
         )
 
     created_entry = JournalEntryRepository.create(db, entry)
@@ -85,11 +109,18 @@ async def create_journal_entry(entry: JournalEntry, db = Depends(get_db_dependen
     if entry.status == JournalEntryStatus.POSTED:
         envelope_service.post_journal_entry(entry)
 
-    return created_entry
+    invalidate_cache()
+    return ORJSONResponse(created_entry.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/journal-entries", response_model=List[JournalEntry])
-async def list_journal_entries(
+@router.get(
+    "/journal-entries",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[JournalEntry]}}
+)
+def list_journal_entries(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Filter by start date (ISO format)"),
     end_date: Optional[str] = Query(None, description="Filter by end date (ISO format)"),
     status: Optional[JournalEntryStatus] = Query(None, description="Filter by status"),
@@ -101,26 +132,54 @@ async def list_journal_entries(
         db,
         start_date=start_date,
         end_date=end_date,
-        status=status.value if status else None,
+        status=STATUS_VALUES.get(status),
         limit=limit
     )
-    return entries
+    # Already-validated models; skip FastAPI's response re-validation
+    return json_etag_response(request, [entry.model_dump(mode="json") for entry in entries])
 
 
-@router.get("/journal-entries/{entry_id}", response_model=JournalEntry)
-async def get_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
-    """Get a specific journal entry by ID."""
+def journal_entry_etag(entry: JournalEntry) -> str:
+    """Strong ETag for a journal entry, derived from its id, last update and status."""
+    digest = hashlib.blake2b(
+        f"{entry.journal_entry_id}:{entry.updated_at}:{entry.status}".encode(),
+        digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+@router.get(
+    "/journal-entries/{entry_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": JournalEntry}}
+)
+def get_journal_entry(entry_id: str, request: Request, db = Depends(get_db_dependency)):
+    """Get a specific journal entry by ID (supports If-None-Match)."""
     entry = JournalEntryRepository.get_by_id(db, entry_id)
     if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Journal entry {entry_id} not found"
         )
-    return entry
+
+    # Any entry (posted ones included) can still be voided, so clients revalidate every time
+    etag = journal_entry_etag(entry)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    return ORJSONResponse(entry.model_dump(mode="json"), headers=cache_headers)
 
 
-@router.put("/journal-entries/{entry_id}", response_model=JournalEntry)
-async def update_journal_entry(entry_id: str, entry: JournalEntry, db = Depends(get_db_dependency)):
+@router.put(
+    "/journal-entries/{entry_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": JournalEntry}}
+)
+def update_journal_entry(entry_id: str, entry: JournalEntry, db = Depends(get_db_dependency)):
     """Update a journal entry (only if not posted)."""
     existing = JournalEntryRepository.get_by_id(db, entry_id)
     if not existing:
@@ -136,18 +195,36 @@ async def update_journal_entry(entry_id: str, entry: JournalEntry, db = Depends(
         )
 
     if not entry.is_balanced():
+        from_total, to_total = entry.balance_totals()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Journal entry is not balanced"
+            detail=f"Journal entry is not balanced. FROM: {from_total}, TO: {to_total}"
         )
 
     entry.journal_entry_id = entry_id
     updated_entry = JournalEntryRepository.update(db, entry_id, entry)
-    return updated_entry
+    invalidate_cache()
+    return ORJSONResponse(updated_entry.model_dump(mode="json"))
+
+
+@router.patch("/journal-entries:bulk-status")
+def bulk_update_journal_entry_status(updates: List[BulkStatusUpdate], db = Depends(get_db_dependency)):
+    """Change status/posting_date of many journal entries in one request and commit."""
+    if any(update.status == JournalEntryStatus.POSTED for update in updates):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use the post endpoint to post journal entries"
+        )
+
+    # Posted entries (and unknown ids) are left untouched and reported back
+    updated_ids = set(JournalEntryRepository.bulk_update_status(db, updates))
+    skipped = [update.journal_entry_id for update in updates if update.journal_entry_id not in updated_ids]
+    invalidate_cache()
+    return {"updated": len(updated_ids), "skipped": skipped}
 
 
 @router.delete("/journal-entries/{entry_id}")
-async def void_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
+def void_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
     """Void a journal entry."""
     entry = JournalEntryRepository.get_by_id(db, entry_id)
     if not entry:
@@ -158,11 +235,17 @@ async def void_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
 
     entry.status = JournalEntryStatus.VOID
     JournalEntryRepository.update(db, entry_id, entry)
+    invalidate_cache()
     return {"message": f"Journal entry {entry_id} voided successfully"}
 
 
-@router.post("/journal-entries/{entry_id}/post", response_model=JournalEntry)
-async def post_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
+@router.post(
+    "/journal-entries/{entry_id}/post",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": JournalEntry}}
+)
+def post_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
     """Post a journal entry - changes status to POSTED and updates envelope balances."""
     entry = JournalEntryRepository.get_by_id(db, entry_id)
     if not entry:
@@ -182,119 +265,174 @@ async def post_journal_entry(entry_id: str, db = Depends(get_db_dependency)):
     updated_entry = JournalEntryRepository.update(db, entry_id, entry)
     envelope_service.post_journal_entry(updated_entry)
 
-    return updated_entry
+    invalidate_cache()
+    return ORJSONResponse(updated_entry.model_dump(mode="json"))
 
 
 # ============================================================================
 # CHART OF ACCOUNTS
 # ============================================================================
 
-@router.get("/accounts", response_model=List[ChartOfAccounts])
-async def list_accounts(
+@router.get(
+    "/accounts",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ChartOfAccounts]}}
+)
+def list_accounts(
+    request: Request,
     account_type: Optional[AccountType] = Query(None, description="Filter by account type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db = Depends(get_db_dependency)
 ):
     """List all accounts in the chart of accounts."""
-    accounts = ChartOfAccountsRepository.get_all(
-        db,
-        account_type=account_type.value if account_type else None,
-        is_active=is_active
-    )
-    return accounts
+    def build():
+        accounts = ChartOfAccountsRepository.get_all(
+            db,
+            account_type=ACCOUNT_TYPE_VALUES.get(account_type),
+            is_active=is_active
+        )
+        return [account.model_dump(mode="json") for account in accounts]
 
+    return cached_json_response(f"accounts:{ACCOUNT_TYPE_VALUES.get(account_type)}:{is_active}", build, request)
 
-@router.get("/accounts/{account_id}", response_model=ChartOfAccounts)
-async def get_account(account_id: str, db = Depends(get_db_dependency)):
+
+@router.get(
+    "/accounts/{account_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ChartOfAccounts}}
+)
+def get_account(account_id: str, request: Request, db = Depends(get_db_dependency)):
     """Get a specific account by ID."""
-    account = ChartOfAccountsRepository.get_by_id(db, account_id)
+    account = cached_lookup(
+        ("account", account_id),
+        lambda: ChartOfAccountsRepository.get_by_id(db, account_id)
+    )
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Account {account_id} not found"
         )
-    return account
+    return json_etag_response(request, account.model_dump(mode="json"))
 
 
-@router.post("/accounts", response_model=ChartOfAccounts, status_code=status.HTTP_201_CREATED)
-async def create_account(account: ChartOfAccounts, db = Depends(get_db_dependency)):
+@router.post(
+    "/accounts",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": ChartOfAccounts}}
+)
+def create_account(account: ChartOfAccounts, db = Depends(get_db_dependency)):
     """Create a new account."""
     created_account = ChartOfAccountsRepository.create(db, account)
-    return created_account
+    invalidate_cache()
+    return ORJSONResponse(created_account.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/accounts/{account_id}", response_model=ChartOfAccounts)
-async def update_account(account_id: str, account: ChartOfAccounts, db = Depends(get_db_dependency)):
+@router.put(
+    "/accounts/{account_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ChartOfAccounts}}
+)
+def update_account(account_id: str, account: ChartOfAccounts, db = Depends(get_db_dependency)):
     """Update an existing account."""
-    existing = ChartOfAccountsRepository.get_by_id(db, account_id)
-    if not existing:
+    updated_account = ChartOfAccountsRepository.update(db, account_id, account)
+    if not updated_account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Account {account_id} not found"
         )
-
-    updated_account = ChartOfAccountsRepository.update(db, account_id, account)
-    return updated_account
+    invalidate_cache()
+    return ORJSONResponse(updated_account.model_dump(mode="json"))
 
 
 # ============================================================================
 # BUDGET ENVELOPES
 # ============================================================================
 
-@router.get("/envelopes/budget", response_model=List[BudgetEnvelope])
-async def list_budget_envelopes(
+@router.get(
+    "/envelopes/budget",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[BudgetEnvelope]}}
+)
+def list_budget_envelopes(
+    request: Request,
     active_only: bool = Query(False, description="Return only active envelopes"),
     db = Depends(get_db_dependency)
 ):
     """List all budget envelopes."""
-    envelopes = BudgetEnvelopeRepository.get_all(db, active_only=active_only)
-    return envelopes
+    def build():
+        envelopes = BudgetEnvelopeRepository.get_all(db, active_only=active_only)
+        return [envelope.model_dump(mode="json") for envelope in envelopes]
+
+    return cached_json_response(f"envelopes:budget:{active_only}", build, request)
 
 
-@router.get("/envelopes/budget/{envelope_id}", response_model=BudgetEnvelope)
-async def get_budget_envelope(envelope_id: str, db = Depends(get_db_dependency)):
+@router.get(
+    "/envelopes/budget/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": BudgetEnvelope}}
+)
+def get_budget_envelope(envelope_id: str, request: Request, db = Depends(get_db_dependency)):
     """Get a specific budget envelope."""
-    envelope = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
+    envelope = cached_lookup(
+        ("budget_envelope", envelope_id),
+        lambda: BudgetEnvelopeRepository.get_by_id(db, envelope_id)
+    )
     if not envelope:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget envelope {envelope_id} not found"
         )
-    return envelope
+    return json_etag_response(request, envelope.model_dump(mode="json"))
 
 
-@router.post("/envelopes/budget", response_model=BudgetEnvelope, status_code=status.HTTP_201_CREATED)
-async def create_budget_envelope(envelope: BudgetEnvelope, db = Depends(get_db_dependency)):
+@router.post(
+    "/envelopes/budget",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": BudgetEnvelope}}
+)
+def create_budget_envelope(envelope: BudgetEnvelope, db = Depends(get_db_dependency)):
     """Create a new budget envelope."""
     created_envelope = BudgetEnvelopeRepository.create(db, envelope)
-    return created_envelope
+    invalidate_cache()
+    return ORJSONResponse(created_envelope.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/envelopes/budget/{envelope_id}", response_model=BudgetEnvelope)
-async def update_budget_envelope(envelope_id: str, envelope: BudgetEnvelope, db = Depends(get_db_dependency)):
+@router.put(
+    "/envelopes/budget/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": BudgetEnvelope}}
+)
+def update_budget_envelope(envelope_id: str, envelope: BudgetEnvelope, db = Depends(get_db_dependency)):
     """Update a budget envelope."""
-    existing = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    updated_envelope = BudgetEnvelopeRepository.update(db, envelope_id, envelope)
+    if not updated_envelope:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget envelope {envelope_id} not found"
         )
-
-    updated_envelope = BudgetEnvelopeRepository.update(db, envelope_id, envelope)
-    return updated_envelope
+    invalidate_cache()
+    return ORJSONResponse(updated_envelope.model_dump(mode="json"))
 
 
 @router.delete("/envelopes/budget/{envelope_id}")
-async def delete_budget_envelope(envelope_id: str, db = Depends(get_db_dependency)):
+def delete_budget_envelope(envelope_id: str, db = Depends(get_db_dependency)):
     """Delete a budget envelope."""
-    existing = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    if not BudgetEnvelopeRepository.delete(db, envelope_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget envelope {envelope_id} not found"
         )
-
-    BudgetEnvelopeRepository.delete(db, envelope_id)
+    invalidate_cache()
     return {"message": f"Budget envelope {envelope_id} deleted successfully"}
 
 
@@ -302,60 +440,86 @@ async def delete_budget_envelope(envelope_id: str, db = Depends(get_db_dependenc
 # PAYMENT ENVELOPES
 # ============================================================================
 
-@router.get("/envelopes/payment", response_model=List[PaymentEnvelope])
-async def list_payment_envelopes(
+@router.get(
+    "/envelopes/payment",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[PaymentEnvelope]}}
+)
+def list_payment_envelopes(
+    request: Request,
     active_only: bool = Query(False, description="Return only active envelopes"),
     db = Depends(get_db_dependency)
 ):
     """List all payment envelopes."""
-    envelopes = PaymentEnvelopeRepository.get_all(db, active_only=active_only)
-    return envelopes
+    def build():
+        envelopes = PaymentEnvelopeRepository.get_all(db, active_only=active_only)
+        return [envelope.model_dump(mode="json") for envelope in envelopes]
+
+    return cached_json_response(f"envelopes:payment:{active_only}", build, request)
 
 
-@router.get("/envelopes/payment/{envelope_id}", response_model=PaymentEnvelope)
-async def get_payment_envelope(envelope_id: str, db = Depends(get_db_dependency)):
+@router.get(
+    "/envelopes/payment/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": PaymentEnvelope}}
+)
+def get_payment_envelope(envelope_id: str, request: Request, db = Depends(get_db_dependency)):
     """Get a specific payment envelope."""
-    envelope = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
+    envelope = cached_lookup(
+        ("payment_envelope", envelope_id),
+        lambda: PaymentEnvelopeRepository.get_by_id(db, envelope_id)
+    )
     if not envelope:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment envelope {envelope_id} not found"
         )
-    return envelope
+    return json_etag_response(request, envelope.model_dump(mode="json"))
 
 
-@router.post("/envelopes/payment", response_model=PaymentEnvelope, status_code=status.HTTP_201_CREATED)
-async def create_payment_envelope(envelope: PaymentEnvelope, db = Depends(get_db_dependency)):
+@router.post(
+    "/envelopes/payment",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": PaymentEnvelope}}
+)
+def create_payment_envelope(envelope: PaymentEnvelope, db = Depends(get_db_dependency)):
     """Create a new payment envelope."""
     created_envelope = PaymentEnvelopeRepository.create(db, envelope)
-    return created_envelope
+    invalidate_cache()
+    return ORJSONResponse(created_envelope.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/envelopes/payment/{envelope_id}", response_model=PaymentEnvelope)
-async def update_payment_envelope(envelope_id: str, envelope: PaymentEnvelope, db = Depends(get_db_dependency)):
+@router.put(
+    "/envelopes/payment/{envelope_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": PaymentEnvelope}}
+)
+def update_payment_envelope(envelope_id: str, envelope: PaymentEnvelope, db = Depends(get_db_dependency)):
     """Update a payment envelope."""
-    existing = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    updated_envelope = PaymentEnvelopeRepository.update(db, envelope_id, envelope)
+    if not updated_envelope:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment envelope {envelope_id} not found"
         )
-
-    updated_envelope = PaymentEnvelopeRepository.update(db, envelope_id, envelope)
-    return updated_envelope
+    invalidate_cache()
+    return ORJSONResponse(updated_envelope.model_dump(mode="json"))
 
 
 @router.delete("/envelopes/payment/{envelope_id}")
-async def delete_payment_envelope(envelope_id: str, db = Depends(get_db_dependency)):
+def delete_payment_envelope(envelope_id: str, db = Depends(get_db_dependency)):
     """Delete a payment envelope."""
-    existing = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
-    if not existing:
+    if not PaymentEnvelopeRepository.delete(db, envelope_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment envelope {envelope_id} not found"
         )
-
-    PaymentEnvelopeRepository.delete(db, envelope_id)
+    invalidate_cache()
     return {"message": f"Payment envelope {envelope_id} deleted successfully"}
 
 
@@ -363,105 +527,150 @@ async def delete_payment_envelope(envelope_id: str, db = Depends(get_db_dependen
 # RECURRING TEMPLATES
 # ============================================================================
 
-@router.get("/recurring-templates", response_model=List[RecurringJournalEntry])
-async def list_recurring_templates(
+@router.get(
+    "/recurring-templates",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[RecurringJournalEntry]}}
+)
+def list_recurring_templates(
+    request: Request,
     active_only: bool = Query(False, description="Return only active templates"),
     db = Depends(get_db_dependency)
 ):
     """List all recurring journal entry templates."""
-    templates = RecurringJournalEntryRepository.get_all(db, active_only=active_only)
-    return templates
+    def build():
+        templates = RecurringJournalEntryRepository.get_all(db, active_only=active_only)
+        return [template.model_dump(mode="json") for template in templates]
+
+    return cached_json_response(f"recurring-templates:{active_only}", build, request)
 
 
-@router.get("/recurring-templates/{template_id}", response_model=RecurringJournalEntry)
-async def get_recurring_template(template_id: str, db = Depends(get_db_dependency)):
+@router.get(
+    "/recurring-templates/{template_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecurringJournalEntry}}
+)
+def get_recurring_template(template_id: str, request: Request, db = Depends(get_db_dependency)):
     """Get a specific recurring template."""
-    template = RecurringJournalEntryRepository.get_by_id(db, template_id)
+    template = cached_lookup(
+        ("recurring_template", template_id),
+        lambda: RecurringJournalEntryRepository.get_by_id(db, template_id)
+    )
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-    return template
+    return json_etag_response(request, template.model_dump(mode="json"))
 
 
-@router.post("/recurring-templates", response_model=RecurringJournalEntry, status_code=status.HTTP_201_CREATED)
-async def create_recurring_template(template: RecurringJournalEntry, db = Depends(get_db_dependency)):
+@router.post(
+    "/recurring-templates",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": RecurringJournalEntry}}
+)
+def create_recurring_template(template: RecurringJournalEntry, db = Depends(get_db_dependency)):
     """Create a new recurring template."""
     created_template = RecurringJournalEntryRepository.create(db, template)
-    return created_template
+    invalidate_cache()
+    return ORJSONResponse(created_template.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/recurring-templates/{template_id}", response_model=RecurringJournalEntry)
-async def update_recurring_template(template_id: str, template: RecurringJournalEntry, db = Depends(get_db_dependency)):
+@router.put(
+    "/recurring-templates/{template_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecurringJournalEntry}}
+)
+def update_recurring_template(template_id: str, template: RecurringJournalEntry, db = Depends(get_db_dependency)):
     """Update a recurring template."""
-    existing = RecurringJournalEntryRepository.get_by_id(db, template_id)
-    if not existing:
+    updated_template = RecurringJournalEntryRepository.update(db, template_id, template)
+    if not updated_template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-
-    updated_template = RecurringJournalEntryRepository.update(db, template_id, template)
-    return updated_template
+    invalidate_cache()
+    return ORJSONResponse(updated_template.model_dump(mode="json"))
 
 
-@router.patch("/recurring-templates/{template_id}/toggle-active", response_model=RecurringJournalEntry)
-async def toggle_recurring_template(template_id: str, db = Depends(get_db_dependency)):
+@router.patch(
+    "/recurring-templates/{template_id}/toggle-active",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecurringJournalEntry}}
+)
+def toggle_recurring_template(template_id: str, db = Depends(get_db_dependency)):
     """Toggle active status of a recurring template."""
-    template = RecurringJournalEntryRepository.get_by_id(db, template_id)
-    if not template:
+    toggled_template = RecurringJournalEntryRepository.toggle_active(db, template_id)
+    if not toggled_template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-
-    template.is_active = not template.is_active
-    updated_template = RecurringJournalEntryRepository.update(db, template_id, template)
-    return updated_template
+    invalidate_cache()
+    return ORJSONResponse(toggled_template.model_dump(mode="json"))
 
 
 @router.delete("/recurring-templates/{template_id}")
-async def delete_recurring_template(template_id: str, db = Depends(get_db_dependency)):
+def delete_recurring_template(template_id: str, db = Depends(get_db_dependency)):
     """Delete a recurring template."""
-    existing = RecurringJournalEntryRepository.get_by_id(db, template_id)
-    if not existing:
+    if not RecurringJournalEntryRepository.delete(db, template_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring template {template_id} not found"
         )
-
-    RecurringJournalEntryRepository.delete(db, template_id)
+    invalidate_cache()
     return {"message": f"Recurring template {template_id} deleted successfully"}
 
 
-@router.post("/recurring-templates/expand", response_model=List[JournalEntry])
-async def expand_recurring_templates(
-    start_date: str = Query(..., description="Start date (ISO format)"),
-    end_date: str = Query(..., description="End date (ISO format)"),
+@router.post(
+    "/recurring-templates/expand",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[JournalEntry]}}
+)
+def expand_recurring_templates(
+    start_date: date = Query(..., description="Start date (ISO format)"),
+    end_date: date = Query(..., description="End date (ISO format)"),
     auto_post: bool = Query(False, description="Automatically post generated entries"),
     db = Depends(get_db_dependency)
 ):
     """Expand all active recurring templates into journal entries for the specified date range."""
-    templates = RecurringJournalEntryRepository.get_all(db, active_only=True)
-    generated_entries = []
-
-    for template in templates:
-        entries = recurring_service.expand_recurring_entry(
-            template=template,
+    # One posting timestamp shared by every entry in this expansion
+    now = datetime.utcnow()
+    created_entries = []
+    pending_entries = []
+
+    # Stream active templates and expand them one batch at a time
+    for templates in RecurringJournalEntryRepository.iter_active_batches(db):
+        entries_by_template = recurring_service.expand_recurring_entries_by_template(
+            recurring_templates=templates,
             start_date=start_date,
             end_date=end_date
         )
+        auto_post_ids = {t.recurring_entry_id for t in templates if auto_post and t.auto_post}
+
+        for template_id, entries in entries_by_template.items():
+            if template_id in auto_post_ids:
+                for entry in entries:
+                    entry.status = JournalEntryStatus.POSTED
+                    entry.posted_at = now
 
-        for entry in entries:
-            if auto_post and template.auto_post:
-                entry.status = JournalEntryStatus.POSTED
-                entry.posted_at = datetime.utcnow()
+            pending_entries.extend(entries)
 
-            created_entry = JournalEntryRepository.create(db, entry)
-            generated_entries.append(created_entry)
+        # Insert in chunks; everything is committed together below
+        if len(pending_entries) >= EXPAND_INSERT_BATCH_SIZE:
+            created_entries.extend(JournalEntryRepository.bulk_create(db, pending_entries, commit=False))
+            pending_entries = []
 
-    return generated_entries
+    created_entries.extend(JournalEntryRepository.bulk_create(db, pending_entries))
+    invalidate_cache()
+    return ORJSONResponse([entry.model_dump(mode="json") for entry in created_entries])
 
 
 # ============================================================================
@@ -469,13 +678,16 @@ async def expand_recurring_templates(
 # ============================================================================
 
 @router.get("/forecast/account/{account_id}")
-async def forecast_account(
+def forecast_account(
     account_id: str,
-    target_date: str = Query(..., description="Target date for forecast"),
+    target_date: date = Query(..., description="Target date for forecast"),
     db = Depends(get_db_dependency)
 ):
     """Forecast account balance based on recurring transactions."""
-    account = ChartOfAccountsRepository.get_by_id(db, account_id)
+    account = cached_lookup(
+        ("account", account_id),
+        lambda: ChartOfAccountsRepository.get_by_id(db, account_id)
+    )
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -483,7 +695,7 @@ async def forecast_account(
         )
 
     current_balance = account.current_balance
-    as_of_date = datetime.now().strftime("%Y-%m-%d")
+    as_of_date = date.today().isoformat()
 
     return {
         "account_id": account_id,
@@ -498,42 +710,32 @@ async def forecast_account(
 
 
 @router.get("/forecast/envelope/{envelope_id}")
-async def forecast_envelope(
+def forecast_envelope(
     envelope_id: str,
-    target_date: str = Query(..., description="Target date for forecast"),
+    target_date: date = Query(..., description="Target date for forecast"),
     db = Depends(get_db_dependency)
 ):
     """Forecast envelope balance based on recurring transactions."""
-    budget_envelope = BudgetEnvelopeRepository.get_by_id(db, envelope_id)
-    if budget_envelope:
-        return {
-            "envelope_id": envelope_id,
-            "envelope_name": budget_envelope.envelope_name,
-            "current_balance": budget_envelope.current_balance,
-            "as_of_date": datetime.now().strftime("%Y-%m-%d"),
-            "target_date": target_date,
-            "projected_balance": budget_envelope.current_balance,
-            "balance_change": 0.0,
-            "transactions_applied": 0
-        }
-
-    payment_envelope = PaymentEnvelopeRepository.get_by_id(db, envelope_id)
-    if payment_envelope:
-        return {
-            "envelope_id": envelope_id,
-            "envelope_name": payment_envelope.envelope_name,
-            "current_balance": payment_envelope.current_balance,
-            "as_of_date": datetime.now().strftime("%Y-%m-%d"),
-            "target_date": target_date,
-            "projected_balance": payment_envelope.current_balance,
-            "balance_change": 0.0,
-            "transactions_applied": 0
-        }
-
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Envelope {envelope_id} not found"
-    )
+    as_of_date = date.today().isoformat()
+
+    envelope = get_envelope_summary(db, envelope_id)
+    if not envelope:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Envelope {envelope_id} not found"
+        )
+
+    _, envelope_name, current_balance = envelope
+    return {
+        "envelope_id": envelope_id,
+        "envelope_name": envelope_name,
+        "current_balance": current_balance,
+        "as_of_date": as_of_date,
+        "target_date": target_date,
+        "projected_balance": current_balance,
+        "balance_change": 0.0,
+        "transactions_applied": 0
+    }
 
 
 # ============================================================================
@@ -541,12 +743,6 @@ async def forecast_envelope(
 # ============================================================================
 
 @router.get("/stats/summary")
-async def get_stats_summary(db = Depends(get_db_dependency)):
+def get_stats_summary(request: Request, db = Depends(get_db_dependency)):
     """Get system statistics summary."""
-    return {
-        "accounts": len(ChartOfAccountsRepository.get_all(db)),
-        "journal_entries": len(JournalEntryRepository.get_all(db)),
-        "budget_envelopes": len(BudgetEnvelopeRepository.get_all(db)),
-        "payment_envelopes": len(PaymentEnvelopeRepository.get_all(db)),
-        "recurring_templates": len(RecurringJournalEntryRepository.get_all(db)),
-    }
+    return cached_json_response("stats:summary", lambda: get_record_counts(db), request)
@@ -8,7 +8,9 @@ applies parsing conditionals to calculate missing data.
 Based on rules defined in EVENT_CLASSIFICATION_RULES.md
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import re
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from projects.api.models.events import (
     ClassifiedEvent,
     EventClassificationResult,
@@ -21,6 +23,28 @@ from projects.api.models.events import (
     get_event_module,
 )
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Event type values used on the per-call classification path
+_PUMP_TYPE = FleetEventType.PUMP.value
+_PURCHASE_TYPE = MoneyEventType.PURCHASE.value
+_STOCK_TYPE = InventoryEventType.STOCK.value
+
+# Intents for classifiers that may add a secondary purchase event
+_PUMP_INTENT = "Log vehicle refueling event"
+_PUMP_INTENT_WITH_EXPENSE = "Log vehicle refueling event and expense"
+_STOCK_INTENT = "Add item to food inventory"
+_STOCK_INTENT_WITH_EXPENSE = "Add item to food inventory and record expense"
+
 
 # Keyword Definitions
 # ===================
@@ -57,6 +81,131 @@ APPOINTMENT_KEYWORDS = ["appointment", "meeting", "scheduled", "book", "reserve"
 REMINDER_KEYWORDS = ["remind me", "reminder", "don't forget", "alert me", "notification"]
 TASK_KEYWORDS = ["task", "todo", "to-do", "need to", "must", "add task", "due"]
 
+# Keyword group tag -> keyword list, scanned together in one pass
+KEYWORD_GROUPS: Dict[str, List[str]] = {
+    "purchase": PURCHASE_KEYWORDS,
+    "return": RETURN_KEYWORDS,
+    "transfer": TRANSFER_KEYWORDS,
+    "ap_payment": AP_PAYMENT_KEYWORDS,
+    "ap_invoice": AP_INVOICE_KEYWORDS,
+    "deposit": DEPOSIT_KEYWORDS,
+    "ach": ACH_KEYWORDS,
+    "sales": SALES_KEYWORDS,
+    "pump": PUMP_KEYWORDS,
+    "repair": REPAIR_KEYWORDS,
+    "maint": MAINT_KEYWORDS,
+    "travel": TRAVEL_KEYWORDS,
+    "meal": MEAL_KEYWORDS,
+    "exercise": EXERCISE_KEYWORDS,
+    "hike": HIKE_KEYWORDS,
+    "stock": STOCK_KEYWORDS,
+    "expiration": EXPIRATION_KEYWORDS,
+    "use_food": USE_FOOD_KEYWORDS,
+    "food_expiry_check": FOOD_EXPIRY_CHECK_KEYWORDS,
+    "appointment": APPOINTMENT_KEYWORDS,
+    "reminder": REMINDER_KEYWORDS,
+    "task": TASK_KEYWORDS,
+}
+
+
+def build_keyword_tags() -> Dict[str, FrozenSet[str]]:
+    """Map each distinct keyword to every group tag it belongs to."""
+    keyword_tags: Dict[str, Set[str]] = {}
+    for tag, keywords in KEYWORD_GROUPS.items():
+        for kw in keywords:
+            keyword_tags.setdefault(kw, set()).add(tag)
+    return {kw: frozenset(tags) for kw, tags in keyword_tags.items()}
+
+
+KEYWORD_TAGS = build_keyword_tags()
+
+# Keywords match on word boundaries ("ate" must not match inside "gate"):
+# a keyword edge that is a word character may not touch another one.
+# ASCII word characters, to agree with Hyperscan's \b
+WORD_RE = re.compile(r"\w+", re.ASCII)
+WORD_CHAR_RE = re.compile(r"\w", re.ASCII)
+
+
+def keyword_bounds(kw: str) -> Tuple[bool, bool]:
+    """Whether the keyword needs a word boundary before / after it."""
+    return bool(WORD_CHAR_RE.match(kw[0])), bool(WORD_CHAR_RE.match(kw[-1]))
+
+
+def keyword_regex(kw: str, boundary: str) -> str:
+    """Regex for kw with the given boundary assertion on its word-character edges."""
+    before, after = keyword_bounds(kw)
+    return (boundary[0] if before else "") + re.escape(kw) + (boundary[1] if after else "")
+
+
+# Single-word keywords are looked up by token; the rest are phrases
+WORD_KEYWORD_TAGS: Dict[str, FrozenSet[str]] = {
+    kw: tags for kw, tags in KEYWORD_TAGS.items() if WORD_RE.fullmatch(kw)
+}
+PHRASE_PATTERNS: List[Tuple["re.Pattern[str]", FrozenSet[str]]] = [
+    (re.compile(keyword_regex(kw, (r"(?<!\w)", r"(?!\w)")), re.ASCII), tags)
+    for kw, tags in KEYWORD_TAGS.items() if kw not in WORD_KEYWORD_TAGS
+]
+
+# Pattern id -> group tags, for the Hyperscan database
+KEYWORD_ID_TAGS: List[FrozenSet[str]] = list(KEYWORD_TAGS.values())
+
+if hyperscan is not None:
+    # Case-sensitive on purpose: commands are lowercased before scanning,
+    # matching the substring checks this replaces
+    KEYWORD_DATABASE = hyperscan.Database()
+    KEYWORD_DATABASE.compile(
+        expressions=[keyword_regex(kw, (r"\b", r"\b")).encode() for kw in KEYWORD_TAGS],
+        ids=list(range(len(KEYWORD_ID_TAGS))),
+        elements=len(KEYWORD_ID_TAGS),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(KEYWORD_ID_TAGS),
+    )
+else:
+    KEYWORD_DATABASE = None
+
+if KEYWORD_DATABASE is None and ahocorasick is not None:
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _tags in KEYWORD_TAGS.items():
+        KEYWORD_AUTOMATON.add_word(_kw, (len(_kw), *keyword_bounds(_kw), _tags))
+    KEYWORD_AUTOMATON.make_automaton()
+else:
+    KEYWORD_AUTOMATON = None
+
+
+def _on_keyword_match(pattern_id: int, start: int, end: int, flags: int, hits: Set[str]) -> None:
+    """Hyperscan match callback: record the matched keyword's group tags."""
+    hits |= KEYWORD_ID_TAGS[pattern_id]
+
+
+def match_keyword_groups(command_lower: str) -> Set[str]:
+    """
+    Return the tags of every keyword group with a keyword in the command.
+
+    Scans once with Hyperscan or pyahocorasick, whichever is installed
+    (Hyperscan preferred). Otherwise single-word keywords are looked up
+    from the command's tokens and only phrases are searched for.
+    """
+    hits: Set[str] = set()
+    if KEYWORD_DATABASE is not None:
+        KEYWORD_DATABASE.scan(command_lower.encode(), match_event_handler=_on_keyword_match, context=hits)
+    elif KEYWORD_AUTOMATON is not None:
+        last = len(command_lower) - 1
+        for end, (length, before, after, tags) in KEYWORD_AUTOMATON.iter(command_lower):
+            start = end - length + 1
+            if before and start > 0 and WORD_CHAR_RE.match(command_lower, start - 1):
+                continue
+            if after and end < last and WORD_CHAR_RE.match(command_lower, end + 1):
+                continue
+            hits |= tags
+    else:
+        for token in frozenset(WORD_RE.findall(command_lower)):
+            tags = WORD_KEYWORD_TAGS.get(token)
+            if tags:
+                hits |= tags
+        for pattern, tags in PHRASE_PATTERNS:
+            if pattern.search(command_lower):
+                hits |= tags
+    return hits
+
 
 # Classifier Functions
 # ====================
@@ -104,10 +253,11 @@ def classify_from_claude_response(parsed_data: Dict[str, Any]) -> EventClassific
     extracted_data = apply_parsing_conditionals(primary_event_type, extracted_data)
 
     # Build primary event
+    category, module = get_event_info(primary_event_type)
     primary_event = ClassifiedEvent(
         event_type=primary_event_type,
-        category=get_event_category_str(primary_event_type),
-        module=get_event_module(primary_event_type),
+        category=category,
+        module=module,
         action=parsed_data.get("action", "create"),
         extracted_data=extracted_data,
         confidence=confidence,
@@ -121,10 +271,11 @@ def classify_from_claude_response(parsed_data: Dict[str, Any]) -> EventClassific
         for event_type in event_types[1:]:
             secondary_data = build_secondary_event_data(primary_event_type, event_type, extracted_data)
             if secondary_data:
+                category, module = get_event_info(event_type)
                 secondary_events.append(ClassifiedEvent(
                     event_type=event_type,
-                    category=get_event_category_str(event_type),
-                    module=get_event_module(event_type),
+                    category=category,
+                    module=module,
                     action="create",
                     extracted_data=secondary_data,
                     confidence=confidence,
@@ -152,61 +303,14 @@ def classify_from_keywords(
     Analyzes command text for keywords and determines event type.
     """
     command_lower = command.lower()
+    hits = match_keyword_groups(command_lower)
 
     # Try to classify in priority order (most specific first)
     result = None
-
-    # Fleet Events (high priority - specific keywords)
-    if any(kw in command_lower for kw in PUMP_KEYWORDS):
-        result = classify_pump_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in TRAVEL_KEYWORDS):
-        result = classify_travel_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in REPAIR_KEYWORDS):
-        result = classify_repair_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in MAINT_KEYWORDS):
-        result = classify_maint_event(command_lower, parsed_data)
-
-    # Inventory Events (check for expiration context)
-    elif any(kw in command_lower for kw in FOOD_EXPIRY_CHECK_KEYWORDS):
-        result = classify_food_expiry_check(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in USE_FOOD_KEYWORDS) and not any(kw in command_lower for kw in MEAL_KEYWORDS):
-        result = classify_use_food_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in STOCK_KEYWORDS) and any(kw in command_lower for kw in EXPIRATION_KEYWORDS):
-        result = classify_stock_event(command_lower, parsed_data)
-
-    # Money Events
-    elif any(kw in command_lower for kw in RETURN_KEYWORDS):
-        result = classify_return_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in TRANSFER_KEYWORDS):
-        result = classify_transfer_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in DEPOSIT_KEYWORDS):
-        result = classify_deposit_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in AP_PAYMENT_KEYWORDS):
-        result = classify_ap_payment_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in AP_INVOICE_KEYWORDS):
-        result = classify_ap_invoice_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in SALES_KEYWORDS):
-        result = classify_sales_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in ACH_KEYWORDS):
-        result = classify_ach_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in PURCHASE_KEYWORDS):
-        result = classify_purchase_event(command_lower, parsed_data)
-
-    # Health Events
-    elif any(kw in command_lower for kw in HIKE_KEYWORDS):
-        result = classify_hike_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in EXERCISE_KEYWORDS):
-        result = classify_exercise_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in MEAL_KEYWORDS):
-        result = classify_meal_event(command_lower, parsed_data)
-
-    # Calendar Events
-    elif any(kw in command_lower for kw in REMINDER_KEYWORDS):
-        result = classify_reminder_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in TASK_KEYWORDS):
-        result = classify_task_event(command_lower, parsed_data)
-    elif any(kw in command_lower for kw in APPOINTMENT_KEYWORDS):
-        result = classify_appointment_event(command_lower, parsed_data)
+    for required, excluded, classifier in KEYWORD_CLASSIFIERS:
+        if hits.issuperset(required) and hits.isdisjoint(excluded):
+            result = run_classifier(classifier, command_lower, parsed_data)
+            break
 
     if result:
         return result
@@ -235,41 +339,40 @@ def classify_from_keywords(
 
 def classify_pump_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
     """Classify refueling event with conditional parsing."""
-    # Apply PumpEvent parsing conditionals
-    parsed_data = apply_pump_event_conditionals(data)
+    # Apply PumpEvent parsing conditionals (resolved values come back as locals)
+    parsed_data, cost, price, gallons = resolve_pump_event_fields(data)
+    has_cost = bool(cost) and cost > 0
 
     # Calculate confidence
-    confidence = 0.7
-    if parsed_data.get("gallons") and parsed_data.get("cost"):
-        confidence += 0.1
-    if parsed_data.get("odometer"):
-        confidence += 0.1
-    if parsed_data.get("price"):
-        confidence += 0.05
-
-    confidence = min(confidence, 1.0)
+    confidence = min(
+        0.7
+        + 0.1 * bool(gallons and cost)
+        + 0.1 * bool(parsed_data.get("odometer"))
+        + 0.05 * bool(price),
+        1.0
+    )
 
     primary_event = ClassifiedEvent(
-        event_type=FleetEventType.PUMP.value,
+        event_type=_PUMP_TYPE,
         category=EventCategory.FLEET,
         module="fleet",
         action="create",
         extracted_data=parsed_data,
         confidence=confidence,
         is_primary=True,
-        triggers_secondary=["purchase"] if parsed_data.get("cost", 0) > 0 else None
+        triggers_secondary=["purchase"] if has_cost else None
     )
 
     # Create secondary Purchase event if cost > 0
     secondary_events = []
-    if parsed_data.get("cost", 0) > 0:
+    if has_cost:
         secondary_events.append(ClassifiedEvent(
-            event_type=MoneyEventType.PURCHASE.value,
+            event_type=_PURCHASE_TYPE,
             category=EventCategory.MONEY,
             module="accounting",
             action="create",
             extracted_data={
-                "amount": parsed_data.get("cost"),
+                "amount": cost,
                 "description": "Fuel purchase",
                 "category": "gas",
             },
@@ -281,7 +384,7 @@ def classify_pump_event(command: str, data: Dict[str, Any]) -> EventClassificati
     return EventClassificationResult(
         primary_event=primary_event,
         secondary_events=secondary_events if secondary_events else None,
-        intent="Log vehicle refueling event" + (" and expense" if secondary_events else ""),
+        intent=_PUMP_INTENT_WITH_EXPENSE if secondary_events else _PUMP_INTENT,
         confidence=confidence,
         clarification_needed=None
     )
@@ -289,16 +392,14 @@ def classify_pump_event(command: str, data: Dict[str, Any]) -> EventClassificati
 
 def classify_purchase_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
     """Classify purchase event."""
-    confidence = 0.85
-    if data.get("amount") and data.get("description"):
-        confidence = 0.90
-    if data.get("merchant"):
-        confidence += 0.05
-
-    confidence = min(confidence, 1.0)
+    confidence = min(
+        (0.90 if data.get("amount") and data.get("description") else 0.85)
+        + 0.05 * bool(data.get("merchant")),
+        1.0
+    )
 
     primary_event = ClassifiedEvent(
-        event_type=MoneyEventType.PURCHASE.value,
+        event_type=_PURCHASE_TYPE,
         category=EventCategory.MONEY,
         module="accounting",
         action="create",
@@ -319,16 +420,14 @@ def classify_purchase_event(command: str, data: Dict[str, Any]) -> EventClassifi
 
 def classify_stock_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
     """Classify food inventory stock event."""
-    confidence = 0.85
-    if data.get("item_name") and data.get("quantity"):
-        confidence = 0.90
-    if data.get("expiration_date"):
-        confidence += 0.05
-
-    confidence = min(confidence, 1.0)
+    confidence = min(
+        (0.90 if data.get("item_name") and data.get("quantity") else 0.85)
+        + 0.05 * bool(data.get("expiration_date")),
+        1.0
+    )
 
     primary_event = ClassifiedEvent(
-        event_type=InventoryEventType.STOCK.value,
+        event_type=_STOCK_TYPE,
         category=EventCategory.INVENTORY,
         module="inventory",
         action="create",
@@ -342,7 +441,7 @@ def classify_stock_event(command: str, data: Dict[str, Any]) -> EventClassificat
     secondary_events = []
     if data.get("cost"):
         secondary_events.append(ClassifiedEvent(
-            event_type=MoneyEventType.PURCHASE.value,
+            event_type=_PURCHASE_TYPE,
             category=EventCategory.MONEY,
             module="accounting",
             action="create",
@@ -359,67 +458,280 @@ def classify_stock_event(command: str, data: Dict[str, Any]) -> EventClassificat
     return EventClassificationResult(
         primary_event=primary_event,
         secondary_events=secondary_events if secondary_events else None,
-        intent="Add item to food inventory" + (" and record expense" if secondary_events else ""),
+        intent=_STOCK_INTENT_WITH_EXPENSE if secondary_events else _STOCK_INTENT,
         confidence=confidence,
         clarification_needed=None
     )
 
 
-# Stub classifiers for other event types (to be expanded)
+def create_simple_event_result(
+    command: str,
+    data: Dict[str, Any],
+    event_type: str,
+    category: EventCategory,
+    module: str,
+    confidence: float,
+    intent: str,
+    action: str = "create"
+) -> EventClassificationResult:
+    """
+    Helper to create a simple single-event result.
 
-def classify_return_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.RETURN.value, EventCategory.MONEY, "accounting", data, 0.85, "Record product return")
+    Takes (command, data) first so stub classifiers can be partials of it.
+    """
+    primary_event = ClassifiedEvent(
+        event_type=event_type,
+        category=category,
+        module=module,
+        action=action,
+        extracted_data=data,
+        confidence=confidence,
+        is_primary=True,
+        triggers_secondary=None
+    )
 
-def classify_transfer_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.TRANSFER.value, EventCategory.MONEY, "accounting", data, 0.88, "Transfer money between accounts")
+    return EventClassificationResult(
+        primary_event=primary_event,
+        secondary_events=None,
+        intent=intent,
+        confidence=confidence,
+        clarification_needed=None
+    )
 
-def classify_deposit_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.DEPOSIT.value, EventCategory.MONEY, "accounting", data, 0.85, "Record deposit/income")
 
-def classify_ap_payment_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.AP_PAYMENT.value, EventCategory.MONEY, "accounting", data, 0.82, "Record bill payment")
+# Stub classifiers for other event types (to be expanded).
+# Partials of create_simple_event_result, called as classifier(command, data).
 
-def classify_ap_invoice_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.AP_INVOICE.value, EventCategory.MONEY, "accounting", data, 0.80, "Record received bill/invoice")
+classify_return_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.RETURN.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.85,
+    intent="Record product return"
+)
 
-def classify_sales_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.SALES.value, EventCategory.MONEY, "accounting", data, 0.85, "Record sale of item")
+classify_transfer_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.TRANSFER.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.88,
+    intent="Transfer money between accounts"
+)
 
-def classify_ach_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(MoneyEventType.ACH.value, EventCategory.MONEY, "accounting", data, 0.88, "Record ACH transaction")
+classify_deposit_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.DEPOSIT.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.85,
+    intent="Record deposit/income"
+)
 
-def classify_travel_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(FleetEventType.TRAVEL.value, EventCategory.FLEET, "fleet", data, 0.85, "Log trip for mileage tracking")
+classify_ap_payment_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.AP_PAYMENT.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.82,
+    intent="Record bill payment"
+)
 
-def classify_repair_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(FleetEventType.REPAIR.value, EventCategory.FLEET, "fleet", data, 0.85, "Log vehicle repair")
+classify_ap_invoice_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.AP_INVOICE.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.80,
+    intent="Record received bill/invoice"
+)
 
-def classify_maint_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(FleetEventType.MAINT.value, EventCategory.FLEET, "fleet", data, 0.83, "Log vehicle maintenance")
+classify_sales_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.SALES.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.85,
+    intent="Record sale of item"
+)
 
-def classify_meal_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(HealthEventType.MEAL.value, EventCategory.HEALTH, "health", data, 0.80, "Log meal")
+classify_ach_event = partial(
+    create_simple_event_result,
+    event_type=MoneyEventType.ACH.value,
+    category=EventCategory.MONEY,
+    module="accounting",
+    confidence=0.88,
+    intent="Record ACH transaction"
+)
 
-def classify_exercise_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(HealthEventType.EXERCISE.value, EventCategory.HEALTH, "health", data, 0.85, "Log exercise activity")
+classify_travel_event = partial(
+    create_simple_event_result,
+    event_type=FleetEventType.TRAVEL.value,
+    category=EventCategory.FLEET,
+    module="fleet",
+    confidence=0.85,
+    intent="Log trip for mileage tracking"
+)
 
-def classify_hike_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(HealthEventType.HIKE.value, EventCategory.HEALTH, "health", data, 0.88, "Log hiking activity")
+classify_repair_event = partial(
+    create_simple_event_result,
+    event_type=FleetEventType.REPAIR.value,
+    category=EventCategory.FLEET,
+    module="fleet",
+    confidence=0.85,
+    intent="Log vehicle repair"
+)
 
-def classify_use_food_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(InventoryEventType.USE_FOOD.value, EventCategory.INVENTORY, "inventory", data, 0.80, "Record food item usage")
+classify_maint_event = partial(
+    create_simple_event_result,
+    event_type=FleetEventType.MAINT.value,
+    category=EventCategory.FLEET,
+    module="fleet",
+    confidence=0.83,
+    intent="Log vehicle maintenance"
+)
 
-def classify_food_expiry_check(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(InventoryEventType.FOOD_EXPIRY_CHECK.value, EventCategory.INVENTORY, "inventory", data, 0.90, "Check for expiring food items", action="read")
+classify_meal_event = partial(
+    create_simple_event_result,
+    event_type=HealthEventType.MEAL.value,
+    category=EventCategory.HEALTH,
+    module="health",
+    confidence=0.80,
+    intent="Log meal"
+)
 
-def classify_appointment_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(CalendarEventType.APPOINTMENT.value, EventCategory.CALENDAR, "calendar", data, 0.85, "Schedule appointment")
+classify_exercise_event = partial(
+    create_simple_event_result,
+    event_type=HealthEventType.EXERCISE.value,
+    category=EventCategory.HEALTH,
+    module="health",
+    confidence=0.85,
+    intent="Log exercise activity"
+)
 
-def classify_reminder_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(CalendarEventType.REMINDER.value, EventCategory.CALENDAR, "calendar", data, 0.88, "Set reminder")
+classify_hike_event = partial(
+    create_simple_event_result,
+    event_type=HealthEventType.HIKE.value,
+    category=EventCategory.HEALTH,
+    module="health",
+    confidence=0.88,
+    intent="Log hiking activity"
+)
+
+classify_use_food_event = partial(
+    create_simple_event_result,
+    event_type=InventoryEventType.USE_FOOD.value,
+    category=EventCategory.INVENTORY,
+    module="inventory",
+    confidence=0.80,
+    intent="Record food item usage"
+)
+
+classify_food_expiry_check = partial(
+    create_simple_event_result,
+    event_type=InventoryEventType.FOOD_EXPIRY_CHECK.value,
+    category=EventCategory.INVENTORY,
+    module="inventory",
+    confidence=0.90,
+    intent="Check for expiring food items",
+    action="read"
+)
+
+classify_appointment_event = partial(
+    create_simple_event_result,
+    event_type=CalendarEventType.APPOINTMENT.value,
+    category=EventCategory.CALENDAR,
+    module="calendar",
+    confidence=0.85,
+    intent="Schedule appointment"
+)
+
+classify_reminder_event = partial(
+    create_simple_event_result,
+    event_type=CalendarEventType.REMINDER.value,
+    category=EventCategory.CALENDAR,
+    module="calendar",
+    confidence=0.88,
+    intent="Set reminder"
+)
+
+classify_task_event = partial(
+    create_simple_event_result,
+    event_type=CalendarEventType.TASK.value,
+    category=EventCategory.CALENDAR,
+    module="calendar",
+    confidence=0.82,
+    intent="Create task/todo"
+)
 
-def classify_task_event(command: str, data: Dict[str, Any]) -> EventClassificationResult:
-    return create_simple_event_result(CalendarEventType.TASK.value, EventCategory.CALENDAR, "calendar", data, 0.82, "Create task/todo")
+
+# Keyword classifier priority (most specific first):
+# (required group tags, excluded group tags, classifier)
+KEYWORD_CLASSIFIERS: List[Tuple[Tuple[str, ...], Tuple[str, ...], Callable[[str, Dict[str, Any]], EventClassificationResult]]] = [
+    # Fleet Events (high priority - specific keywords)
+    (("pump",), (), classify_pump_event),
+    (("travel",), (), classify_travel_event),
+    (("repair",), (), classify_repair_event),
+    (("maint",), (), classify_maint_event),
+
+    # Inventory Events (check for expiration context)
+    (("food_expiry_check",), (), classify_food_expiry_check),
+    (("use_food",), ("meal",), classify_use_food_event),
+    (("stock", "expiration"), (), classify_stock_event),
+
+    # Money Events
+    (("return",), (), classify_return_event),
+    (("transfer",), (), classify_transfer_event),
+    (("deposit",), (), classify_deposit_event),
+    (("ap_payment",), (), classify_ap_payment_event),
+    (("ap_invoice",), (), classify_ap_invoice_event),
+    (("sales",), (), classify_sales_event),
+    (("ach",), (), classify_ach_event),
+    (("purchase",), (), classify_purchase_event),
+
+    # Health Events
+    (("hike",), (), classify_hike_event),
+    (("exercise",), (), classify_exercise_event),
+    (("meal",), (), classify_meal_event),
+
+    # Calendar Events
+    (("reminder",), (), classify_reminder_event),
+    (("task",), (), classify_task_event),
+    (("appointment",), (), classify_appointment_event),
+]
+
+CLASSIFICATION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _run_classifier_cached(
+    classifier: Callable[[str, Dict[str, Any]], EventClassificationResult],
+    command: str,
+    data_key: Tuple[Tuple[str, type, Any], ...]
+) -> EventClassificationResult:
+    return classifier(command, {key: value for key, _, value in data_key})
+
+
+def run_classifier(
+    classifier: Callable[[str, Dict[str, Any]], EventClassificationResult],
+    command: str,
+    data: Dict[str, Any]
+) -> EventClassificationResult:
+    """
+    Run a classifier, memoizing the result for repeated (command, data) inputs.
+
+    Data with unhashable values (lists, nested dicts) is classified uncached.
+    The key keeps item order and value types, so cached results match an
+    uncached call exactly (cost=3 and cost=3.0 don't share a result).
+    Cached results are shared between calls and must not be mutated.
+    """
+    data_key = tuple((key, type(value), value) for key, value in data.items())
+    try:
+        hash(data_key)
+    except TypeError:
+        return classifier(command, data)
+    return _run_classifier_cached(classifier, command, data_key)
 
 
 # Parsing Conditionals
@@ -429,12 +741,11 @@ def apply_parsing_conditionals(event_type: str, data: Dict[str, Any]) -> Dict[st
     """
     Apply parsing conditionals based on event type to calculate missing fields.
 
-    Implements the conditional rules from EVENT_CLASSIFICATION_RULES.md
+    Implements the conditional rules from EVENT_CLASSIFICATION_RULES.md;
+    event types without a ruleset in PARSING_CONDITIONALS pass through.
     """
-    if event_type == FleetEventType.PUMP.value or event_type == "pump_event":
-        return apply_pump_event_conditionals(data)
-
-    return data
+    conditionals = PARSING_CONDITIONALS.get(event_type)
+    return conditionals(data) if conditionals else data
 
 
 def apply_pump_event_conditionals(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -445,28 +756,51 @@ def apply_pump_event_conditionals(data: Dict[str, Any]) -> Dict[str, Any]:
     - IF Have(cost) AND Have(price) AND Missing(gallons) → calculate gallons
     - IF Have(gallons) AND Have(price) AND Missing(cost) → calculate cost
     """
-    result = data.copy()
+    return resolve_pump_event_fields(data)[0]
+
+
+def resolve_pump_event_fields(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Any, Any, Any]:
+    """
+    Apply PumpEvent parsing conditionals and return the resolved fields.
+
+    Returns:
+        (data, cost, price, gallons), where the values are those of the
+        returned dict, so callers don't have to look them up again
+    """
+    cost = data.get("cost")
+    price = data.get("price")
+    gallons = data.get("gallons")
+    quantity = data.get("quantity")
+    amount = gallons or quantity
 
-    cost = result.get("cost")
-    price = result.get("price")
-    gallons = result.get("gallons") or result.get("quantity")
+    # Collect calculated fields; data is copied only if something fires
+    patch = {}
 
     # Calculate gallons if missing
-    if cost and price and not gallons:
-        result["gallons"] = cost / price
-        result["quantity"] = result["gallons"]
-        result["unit_of_measure"] = "gallons"
+    if cost and price and not amount:
+        gallons = cost / price
+        patch["gallons"] = gallons
+        patch["quantity"] = gallons
+        patch["unit_of_measure"] = "gallons"
 
     # Calculate cost if missing
-    elif gallons and price and not cost:
-        result["cost"] = gallons * price
+    elif amount and price and not cost:
+        cost = amount * price
+        patch["cost"] = cost
 
     # Ensure we have quantity and unit_of_measure
-    if gallons and not result.get("quantity"):
-        result["quantity"] = gallons
-        result["unit_of_measure"] = "gallons"
+    if amount and not quantity:
+        patch["quantity"] = amount
+        patch["unit_of_measure"] = "gallons"
+
+    return ({**data, **patch} if patch else data), cost, price, gallons
 
-    return result
+
+# Event type value -> parsing conditionals for that event type
+PARSING_CONDITIONALS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    FleetEventType.PUMP.value: apply_pump_event_conditionals,
+    "pump_event": apply_pump_event_conditionals,
+}
 
 
 def build_secondary_event_data(
@@ -479,7 +813,7 @@ def build_secondary_event_data(
 
     E.g., PumpEvent → Purchase (use cost from PumpEvent)
     """
-    if secondary_event_type == "purchase" or secondary_event_type == MoneyEventType.PURCHASE.value:
+    if secondary_event_type == "purchase" or secondary_event_type == _PURCHASE_TYPE:
         # Extract cost from primary event
         amount = primary_data.get("cost") or primary_data.get("amount")
         if not amount:
@@ -497,57 +831,49 @@ def build_secondary_event_data(
 # Helper Functions
 # ================
 
-def create_simple_event_result(
-    event_type: str,
-    category: EventCategory,
-    module: str,
-    data: Dict[str, Any],
-    confidence: float,
-    intent: str,
-    action: str = "create"
-) -> EventClassificationResult:
-    """Helper to create a simple single-event result."""
-    primary_event = ClassifiedEvent(
-        event_type=event_type,
-        category=category,
-        module=module,
-        action=action,
-        extracted_data=data,
-        confidence=confidence,
-        is_primary=True,
-        triggers_secondary=None
-    )
-
-    return EventClassificationResult(
-        primary_event=primary_event,
-        secondary_events=None,
-        intent=intent,
-        confidence=confidence,
-        clarification_needed=None
-    )
+# Event type value -> category, built once from the event type enums
+EVENT_VALUE_CATEGORY_MAP: Dict[str, EventCategory] = {}
+for _enum_cls, _category in (
+    (MoneyEventType, EventCategory.MONEY),
+    (FleetEventType, EventCategory.FLEET),
+    (HealthEventType, EventCategory.HEALTH),
+    (InventoryEventType, EventCategory.INVENTORY),
+    (CalendarEventType, EventCategory.CALENDAR),
+):
+    for _member in _enum_cls:
+        EVENT_VALUE_CATEGORY_MAP.setdefault(_member.value, _category)
 
 
 def get_event_category_str(event_type: str) -> EventCategory:
     """Get EventCategory enum from event type string."""
-    if event_type in [e.value for e in MoneyEventType]:
-        return EventCategory.MONEY
-    elif event_type in [e.value for e in FleetEventType]:
-        return EventCategory.FLEET
-    elif event_type in [e.value for e in HealthEventType]:
-        return EventCategory.HEALTH
-    elif event_type in [e.value for e in InventoryEventType]:
-        return EventCategory.INVENTORY
-    elif event_type in [e.value for e in CalendarEventType]:
-        return EventCategory.CALENDAR
-    return EventCategory.MONEY  # Default
+    return EVENT_VALUE_CATEGORY_MAP.get(event_type, EventCategory.MONEY)  # Default
+
+
+# Event type value -> (category, module), so building an event is one lookup
+EVENT_VALUE_INFO_MAP: Dict[str, Tuple[EventCategory, str]] = {
+    value: (category, get_event_module(value))
+    for value, category in EVENT_VALUE_CATEGORY_MAP.items()
+}
+
+
+def get_event_info(event_type: str) -> Tuple[EventCategory, str]:
+    """Get (category, module) for an event type string."""
+    info = EVENT_VALUE_INFO_MAP.get(event_type)
+    if info is None:
+        # Unknown types keep the default category / module error behaviour
+        return get_event_category_str(event_type), get_event_module(event_type)
+    return info
+
+
+# Event type -> accounting category for the generated purchase
+EVENT_ACCOUNTING_CATEGORY_MAP: Dict[str, str] = {
+    "pump_event": "gas",
+    "repair_event": "auto_repair",
+    "maint_event": "auto_maintenance",
+    "stock_event": "groceries",
+}
 
 
 def get_category_for_event(event_type: str) -> str:
     """Get accounting category for an event type."""
-    category_map = {
-        "pump_event": "gas",
-        "repair_event": "auto_repair",
-        "maint_event": "auto_maintenance",
-        "stock_event": "groceries",
-    }
-    return category_map.get(event_type, "general")
+    return EVENT_ACCOUNTING_CATEGORY_MAP.get(event_type, "general")
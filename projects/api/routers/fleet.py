@@ -4,7 +4,8 @@ Fleet Management Module Router
 All fleet endpoints prefixed with /api/fleet/*
 """
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 import sqlite3
 
@@ -20,7 +21,7 @@ from projects.fleet.models import (
 
 # Import database from fleet module
 from projects.fleet.database import (
-    get_db_connection,
+    get_db,
     VehicleRepository,
     FuelEventRepository,
     MaintenanceEventRepository,
@@ -30,23 +31,34 @@ from projects.fleet.database import (
 )
 
 # Initialize router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-# No longer needed - we'll use get_db_connection() directly
+def _require(obj, kind: str, obj_id: str):
+    """Return obj, or raise a 404 for "<kind> <obj_id>" if it is missing."""
+    if not obj:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{kind} {obj_id} not found"
+        )
+    return obj
 
 
 # ============================================================================
 # VEHICLE ENDPOINTS
 # ============================================================================
 
-@router.post("/vehicles", response_model=Vehicle, status_code=status.HTTP_201_CREATED)
-async def create_vehicle(vehicle: VehicleCreate):
+@router.post(
+    "/vehicles",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": Vehicle}}
+)
+async def create_vehicle(vehicle: VehicleCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new vehicle."""
-    conn = get_db_connection()
     try:
         created_vehicle = VehicleRepository.create(conn, vehicle)
-        return created_vehicle
+        return ORJSONResponse(created_vehicle.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
     except sqlite3.IntegrityError as e:
         if "UNIQUE constraint failed" in str(e):
             raise HTTPException(
@@ -54,344 +66,250 @@ async def create_vehicle(vehicle: VehicleCreate):
                 detail="Vehicle with this VIN already exists"
             )
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    finally:
-        conn.close()
 
 
-@router.get("/vehicles", response_model=List[Vehicle])
+@router.get(
+    "/vehicles",
+    response_model=None,
+    responses={200: {"model": List[Vehicle]}}
+)
 async def list_vehicles(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of vehicles to return"),
-    offset: int = Query(0, ge=0, description="Number of vehicles to skip")
+    offset: int = Query(0, ge=0, description="Number of vehicles to skip"),
+    conn: sqlite3.Connection = Depends(get_db)
 ):
     """List all vehicles with pagination."""
-    conn = get_db_connection()
-    try:
-        vehicles = VehicleRepository.get_all(conn, limit=limit, offset=offset)
-        return vehicles
-    finally:
-        conn.close()
+    vehicles = VehicleRepository.get_all(conn, limit=limit, offset=offset)
+    return ORJSONResponse([item.model_dump(mode="json") for item in vehicles])
 
 
-@router.get("/vehicles/{vehicle_id}", response_model=Vehicle)
-async def get_vehicle(vehicle_id: str):
+@router.get(
+    "/vehicles/{vehicle_id}",
+    response_model=None,
+    responses={200: {"model": Vehicle}}
+)
+async def get_vehicle(vehicle_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Get a specific vehicle by ID."""
-    conn = get_db_connection()
-    try:
-        vehicle = VehicleRepository.get_by_id(conn, vehicle_id)
-        if not vehicle:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {vehicle_id} not found"
-            )
-        return vehicle
+    vehicle = _require(VehicleRepository.get_by_id(conn, vehicle_id), "Vehicle", vehicle_id)
+    return ORJSONResponse(vehicle.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
-@router.put("/vehicles/{vehicle_id}", response_model=Vehicle)
-async def update_vehicle(vehicle_id: str, vehicle: VehicleCreate):
+@router.put(
+    "/vehicles/{vehicle_id}",
+    response_model=None,
+    responses={200: {"model": Vehicle}}
+)
+async def update_vehicle(vehicle_id: str, vehicle: VehicleCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Update a vehicle."""
-    conn = get_db_connection()
-    try:
-        updated_vehicle = VehicleRepository.update(conn, vehicle_id, vehicle)
-        if not updated_vehicle:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {vehicle_id} not found"
-            )
-        return updated_vehicle
+    updated_vehicle = _require(VehicleRepository.update(conn, vehicle_id, vehicle), "Vehicle", vehicle_id)
+    return ORJSONResponse(updated_vehicle.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
 @router.delete("/vehicles/{vehicle_id}")
-async def delete_vehicle(vehicle_id: str):
+async def delete_vehicle(vehicle_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Delete a vehicle."""
-    conn = get_db_connection()
-    try:
-        deleted = VehicleRepository.delete(conn, vehicle_id)
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {vehicle_id} not found"
-            )
-        return {"message": f"Vehicle {vehicle_id} deleted successfully"}
+    _require(VehicleRepository.delete(conn, vehicle_id), "Vehicle", vehicle_id)
+    return {"message": f"Vehicle {vehicle_id} deleted successfully"}
 
 
-    finally:
-        conn.close()
 # ============================================================================
 # FUEL EVENT ENDPOINTS
 # ============================================================================
 
-@router.post("/fuel-events", response_model=FuelEvent, status_code=status.HTTP_201_CREATED)
-async def create_fuel_event(fuel_event: FuelEventCreate):
+@router.post(
+    "/fuel-events",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": FuelEvent}}
+)
+async def create_fuel_event(fuel_event: FuelEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new fuel event."""
-    conn = get_db_connection()
-    try:
-        # Verify vehicle exists
-        vehicle = VehicleRepository.get_by_id(conn, fuel_event.vehicle_id)
-        if not vehicle:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {fuel_event.vehicle_id} not found"
-            )
+    created_event = _require(FuelEventRepository.create(conn, fuel_event), "Vehicle", fuel_event.vehicle_id)
+    return ORJSONResponse(created_event.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
-        created_event = FuelEventRepository.create(conn, fuel_event)
-        return created_event
 
-
-    finally:
-        conn.close()
-@router.get("/fuel-events", response_model=List[FuelEvent])
+@router.get(
+    "/fuel-events",
+    response_model=None,
+    responses={200: {"model": List[FuelEvent]}}
+)
 async def list_fuel_events(
     vehicle_id: Optional[str] = Query(None, description="Filter by vehicle ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
-    offset: int = Query(0, ge=0, description="Number of events to skip")
+    offset: int = Query(0, ge=0, description="Number of events to skip"),
+    conn: sqlite3.Connection = Depends(get_db)
 ):
     """List all fuel events with optional vehicle filter."""
-    conn = get_db_connection()
-    try:
-        events = FuelEventRepository.get_all(conn, vehicle_id=vehicle_id, limit=limit, offset=offset)
-        return events
+    events = FuelEventRepository.get_all(conn, vehicle_id=vehicle_id, limit=limit, offset=offset)
+    return ORJSONResponse([item.model_dump(mode="json") for item in events])
 
 
-    finally:
-        conn.close()
-@router.get("/fuel-events/{fuel_id}", response_model=FuelEvent)
-async def get_fuel_event(fuel_id: str):
+@router.get(
+    "/fuel-events/{fuel_id}",
+    response_model=None,
+    responses={200: {"model": FuelEvent}}
+)
+async def get_fuel_event(fuel_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Get a specific fuel event by ID."""
-    conn = get_db_connection()
-    try:
-        event = FuelEventRepository.get_by_id(conn, fuel_id)
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Fuel event {fuel_id} not found"
-            )
-        return event
+    event = _require(FuelEventRepository.get_by_id(conn, fuel_id), "Fuel event", fuel_id)
+    return ORJSONResponse(event.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
-@router.put("/fuel-events/{fuel_id}", response_model=FuelEvent)
-async def update_fuel_event(fuel_id: str, fuel_event: FuelEventCreate):
+@router.put(
+    "/fuel-events/{fuel_id}",
+    response_model=None,
+    responses={200: {"model": FuelEvent}}
+)
+async def update_fuel_event(fuel_id: str, fuel_event: FuelEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Update a fuel event."""
-    conn = get_db_connection()
-    try:
-        updated_event = FuelEventRepository.update(conn, fuel_id, fuel_event)
-        if not updated_event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Fuel event {fuel_id} not found"
-            )
-        return updated_event
+    updated_event = _require(FuelEventRepository.update(conn, fuel_id, fuel_event), "Fuel event", fuel_id)
+    return ORJSONResponse(updated_event.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
 @router.delete("/fuel-events/{fuel_id}")
-async def delete_fuel_event(fuel_id: str):
+async def delete_fuel_event(fuel_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Delete a fuel event."""
-    conn = get_db_connection()
-    try:
-        deleted = FuelEventRepository.delete(conn, fuel_id)
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Fuel event {fuel_id} not found"
-            )
-        return {"message": f"Fuel event {fuel_id} deleted successfully"}
+    _require(FuelEventRepository.delete(conn, fuel_id), "Fuel event", fuel_id)
+    return {"message": f"Fuel event {fuel_id} deleted successfully"}
 
 
-    finally:
-        conn.close()
 # ============================================================================
 # MAINTENANCE EVENT ENDPOINTS
 # ============================================================================
 
-@router.post("/maintenance-events", response_model=MaintenanceEvent, status_code=status.HTTP_201_CREATED)
-async def create_maintenance_event(maintenance: MaintenanceEventCreate):
+@router.post(
+    "/maintenance-events",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": MaintenanceEvent}}
+)
+async def create_maintenance_event(maintenance: MaintenanceEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new maintenance event."""
-    conn = get_db_connection()
-    try:
-        # Verify vehicle exists
-        vehicle = VehicleRepository.get_by_id(conn, maintenance.vehicle_id)
-        if not vehicle:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {maintenance.vehicle_id} not found"
-            )
-
-        created_event = MaintenanceEventRepository.create(conn, maintenance)
-        return created_event
+    created_event = _require(MaintenanceEventRepository.create(conn, maintenance), "Vehicle", maintenance.vehicle_id)
+    return ORJSONResponse(created_event.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
 
-    finally:
-        conn.close()
-@router.get("/maintenance-events", response_model=List[MaintenanceEvent])
+@router.get(
+    "/maintenance-events",
+    response_model=None,
+    responses={200: {"model": List[MaintenanceEvent]}}
+)
 async def list_maintenance_events(
     vehicle_id: Optional[str] = Query(None, description="Filter by vehicle ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
-    offset: int = Query(0, ge=0, description="Number of events to skip")
+    offset: int = Query(0, ge=0, description="Number of events to skip"),
+    conn: sqlite3.Connection = Depends(get_db)
 ):
     """List all maintenance events with optional vehicle filter."""
-    conn = get_db_connection()
-    try:
-        events = MaintenanceEventRepository.get_all(conn, vehicle_id=vehicle_id, limit=limit, offset=offset)
-        return events
+    events = MaintenanceEventRepository.get_all(conn, vehicle_id=vehicle_id, limit=limit, offset=offset)
+    return ORJSONResponse([item.model_dump(mode="json") for item in events])
 
 
-    finally:
-        conn.close()
-@router.get("/maintenance-events/{maintenance_id}", response_model=MaintenanceEvent)
-async def get_maintenance_event(maintenance_id: str):
+@router.get(
+    "/maintenance-events/{maintenance_id}",
+    response_model=None,
+    responses={200: {"model": MaintenanceEvent}}
+)
+async def get_maintenance_event(maintenance_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Get a specific maintenance event by ID."""
-    conn = get_db_connection()
-    try:
-        event = MaintenanceEventRepository.get_by_id(conn, maintenance_id)
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Maintenance event {maintenance_id} not found"
-            )
-        return event
+    event = _require(MaintenanceEventRepository.get_by_id(conn, maintenance_id), "Maintenance event", maintenance_id)
+    return ORJSONResponse(event.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
-@router.put("/maintenance-events/{maintenance_id}", response_model=MaintenanceEvent)
-async def update_maintenance_event(maintenance_id: str, maintenance: MaintenanceEventCreate):
+@router.put(
+    "/maintenance-events/{maintenance_id}",
+    response_model=None,
+    responses={200: {"model": MaintenanceEvent}}
+)
+async def update_maintenance_event(maintenance_id: str, maintenance: MaintenanceEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Update a maintenance event."""
-    conn = get_db_connection()
-    try:
-        updated_event = MaintenanceEventRepository.update(conn, maintenance_id, maintenance)
-        if not updated_event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Maintenance event {maintenance_id} not found"
-            )
-        return updated_event
+    updated_event = _require(MaintenanceEventRepository.update(conn, maintenance_id, maintenance), "Maintenance event", maintenance_id)
+    return ORJSONResponse(updated_event.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
 @router.delete("/maintenance-events/{maintenance_id}")
-async def delete_maintenance_event(maintenance_id: str):
+async def delete_maintenance_event(maintenance_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Delete a maintenance event."""
-    conn = get_db_connection()
-    try:
-        deleted = MaintenanceEventRepository.delete(conn, maintenance_id)
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Maintenance event {maintenance_id} not found"
-            )
-        return {"message": f"Maintenance event {maintenance_id} deleted successfully"}
+    _require(MaintenanceEventRepository.delete(conn, maintenance_id), "Maintenance event", maintenance_id)
+    return {"message": f"Maintenance event {maintenance_id} deleted successfully"}
 
 
-    finally:
-        conn.close()
 # ============================================================================
 # REPAIR EVENT ENDPOINTS
 # ============================================================================
 
-@router.post("/repair-events", response_model=RepairEvent, status_code=status.HTTP_201_CREATED)
-async def create_repair_event(repair: RepairEventCreate):
+@router.post(
+    "/repair-events",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": RepairEvent}}
+)
+async def create_repair_event(repair: RepairEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new repair event."""
-    conn = get_db_connection()
-    try:
-        # Verify vehicle exists
-        vehicle = VehicleRepository.get_by_id(conn, repair.vehicle_id)
-        if not vehicle:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {repair.vehicle_id} not found"
-            )
+    created_event = _require(RepairEventRepository.create(conn, repair), "Vehicle", repair.vehicle_id)
+    return ORJSONResponse(created_event.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
 
-        created_event = RepairEventRepository.create(conn, repair)
-        return created_event
 
-
-    finally:
-        conn.close()
-@router.get("/repair-events", response_model=List[RepairEvent])
+@router.get(
+    "/repair-events",
+    response_model=None,
+    responses={200: {"model": List[RepairEvent]}}
+)
 async def list_repair_events(
     vehicle_id: Optional[str] = Query(None, description="Filter by vehicle ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
-    offset: int = Query(0, ge=0, description="Number of events to skip")
+    offset: int = Query(0, ge=0, description="Number of events to skip"),
+    conn: sqlite3.Connection = Depends(get_db)
 ):
     """List all repair events with optional vehicle filter."""
-    conn = get_db_connection()
-    try:
-        events = RepairEventRepository.get_all(conn, vehicle_id=vehicle_id, limit=limit, offset=offset)
-        return events
+    events = RepairEventRepository.get_all(conn, vehicle_id=vehicle_id, limit=limit, offset=offset)
+    return ORJSONResponse([item.model_dump(mode="json") for item in events])
 
 
-    finally:
-        conn.close()
-@router.get("/repair-events/{repair_id}", response_model=RepairEvent)
-async def get_repair_event(repair_id: str):
+@router.get(
+    "/repair-events/{repair_id}",
+    response_model=None,
+    responses={200: {"model": RepairEvent}}
+)
+async def get_repair_event(repair_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Get a specific repair event by ID."""
-    conn = get_db_connection()
-    try:
-        event = RepairEventRepository.get_by_id(conn, repair_id)
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Repair event {repair_id} not found"
-            )
-        return event
+    event = _require(RepairEventRepository.get_by_id(conn, repair_id), "Repair event", repair_id)
+    return ORJSONResponse(event.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
-@router.put("/repair-events/{repair_id}", response_model=RepairEvent)
-async def update_repair_event(repair_id: str, repair: RepairEventCreate):
+@router.put(
+    "/repair-events/{repair_id}",
+    response_model=None,
+    responses={200: {"model": RepairEvent}}
+)
+async def update_repair_event(repair_id: str, repair: RepairEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Update a repair event."""
-    conn = get_db_connection()
-    try:
-        updated_event = RepairEventRepository.update(conn, repair_id, repair)
-        if not updated_event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Repair event {repair_id} not found"
-            )
-        return updated_event
+    updated_event = _require(RepairEventRepository.update(conn, repair_id, repair), "Repair event", repair_id)
+    return ORJSONResponse(updated_event.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
 @router.delete("/repair-events/{repair_id}")
-async def delete_repair_event(repair_id: str):
+async def delete_repair_event(repair_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Delete a repair event."""
-    conn = get_db_connection()
-    try:
-        deleted = RepairEventRepository.delete(conn, repair_id)
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Repair event {repair_id} not found"
-            )
-        return {"message": f"Repair event {repair_id} deleted successfully"}
+    _require(RepairEventRepository.delete(conn, repair_id), "Repair event", repair_id)
+    return {"message": f"Repair event {repair_id} deleted successfully"}
 
 
-    finally:
-        conn.close()
 # ============================================================================
 # VENDOR ENDPOINTS
 # ============================================================================
 
-@router.post("/vendors", response_model=Vendor, status_code=status.HTTP_201_CREATED)
-async def create_vendor(vendor: VendorCreate):
+@router.post(
+    "/vendors",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": Vendor}}
+)
+async def create_vendor(vendor: VendorCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new vendor."""
     try:
-        conn = get_db_connection()
-        try:
-            created_vendor = VendorRepository.create(conn, vendor)
-            return created_vendor
-        finally:
-            conn.close()
+        created_vendor = VendorRepository.create(conn, vendor)
+        return ORJSONResponse(created_vendor.model_dump(mode="json"), status_code=status.HTTP_201_CREATED)
     except sqlite3.IntegrityError as e:
         if "UNIQUE constraint failed" in str(e):
             raise HTTPException(
@@ -401,118 +319,91 @@ async def create_vendor(vendor: VendorCreate):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/vendors", response_model=List[Vendor])
+@router.get(
+    "/vendors",
+    response_model=None,
+    responses={200: {"model": List[Vendor]}}
+)
 async def list_vendors(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of vendors to return"),
-    offset: int = Query(0, ge=0, description="Number of vendors to skip")
+    offset: int = Query(0, ge=0, description="Number of vendors to skip"),
+    conn: sqlite3.Connection = Depends(get_db)
 ):
     """List all vendors with pagination."""
-    conn = get_db_connection()
-    try:
-        vendors = VendorRepository.get_all(conn, limit=limit, offset=offset)
-        return vendors
+    vendors = VendorRepository.get_all(conn, limit=limit, offset=offset)
+    return ORJSONResponse([item.model_dump(mode="json") for item in vendors])
 
 
-    finally:
-        conn.close()
-@router.get("/vendors/{vendor_id}", response_model=Vendor)
-async def get_vendor(vendor_id: str):
+@router.get(
+    "/vendors/{vendor_id}",
+    response_model=None,
+    responses={200: {"model": Vendor}}
+)
+async def get_vendor(vendor_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Get a specific vendor by ID."""
-    conn = get_db_connection()
-    try:
-        vendor = VendorRepository.get_by_id(conn, vendor_id)
-        if not vendor:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vendor {vendor_id} not found"
-            )
-        return vendor
+    vendor = _require(VendorRepository.get_by_id(conn, vendor_id), "Vendor", vendor_id)
+    return ORJSONResponse(vendor.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
-@router.put("/vendors/{vendor_id}", response_model=Vendor)
-async def update_vendor(vendor_id: str, vendor: VendorCreate):
+@router.put(
+    "/vendors/{vendor_id}",
+    response_model=None,
+    responses={200: {"model": Vendor}}
+)
+async def update_vendor(vendor_id: str, vendor: VendorCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Update a vendor."""
-    conn = get_db_connection()
-    try:
-        updated_vendor = VendorRepository.update(conn, vendor_id, vendor)
-        if not updated_vendor:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vendor {vendor_id} not found"
-            )
-        return updated_vendor
+    updated_vendor = _require(VendorRepository.update(conn, vendor_id, vendor), "Vendor", vendor_id)
+    return ORJSONResponse(updated_vendor.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
 @router.delete("/vendors/{vendor_id}")
-async def delete_vendor(vendor_id: str):
+async def delete_vendor(vendor_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Delete a vendor."""
-    conn = get_db_connection()
-    try:
-        deleted = VendorRepository.delete(conn, vendor_id)
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vendor {vendor_id} not found"
-            )
-        return {"message": f"Vendor {vendor_id} deleted successfully"}
+    _require(VendorRepository.delete(conn, vendor_id), "Vendor", vendor_id)
+    return {"message": f"Vendor {vendor_id} deleted successfully"}
 
 
-    finally:
-        conn.close()
 # ============================================================================
 # ANALYTICS ENDPOINTS
 # ============================================================================
 
-@router.get("/analytics/vehicle/{vehicle_id}", response_model=VehicleSummary)
-async def get_vehicle_summary(vehicle_id: str):
+@router.get(
+    "/analytics/vehicle/{vehicle_id}",
+    response_model=None,
+    responses={200: {"model": VehicleSummary}}
+)
+async def get_vehicle_summary(vehicle_id: str, conn: sqlite3.Connection = Depends(get_db)):
     """Get comprehensive analytics summary for a vehicle."""
-    conn = get_db_connection()
-    try:
-        summary = AnalyticsRepository.get_vehicle_summary(conn, vehicle_id)
-        if not summary:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vehicle {vehicle_id} not found"
-            )
-        return summary
+    summary = _require(AnalyticsRepository.get_vehicle_summary(conn, vehicle_id), "Vehicle", vehicle_id)
+    return ORJSONResponse(summary.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
-@router.get("/analytics/fleet", response_model=FleetSummary)
-async def get_fleet_summary():
+@router.get(
+    "/analytics/fleet",
+    response_model=None,
+    responses={200: {"model": FleetSummary}}
+)
+async def get_fleet_summary(conn: sqlite3.Connection = Depends(get_db)):
     """Get fleet-wide analytics summary."""
-    conn = get_db_connection()
-    try:
-        summary = AnalyticsRepository.get_fleet_summary(conn)
-        return summary
+    summary = AnalyticsRepository.get_fleet_summary(conn)
+    return ORJSONResponse(summary.model_dump(mode="json"))
 
 
-    finally:
-        conn.close()
 # ============================================================================
 # STATISTICS
 # ============================================================================
 
 @router.get("/stats/summary")
-async def get_stats_summary():
+async def get_stats_summary(conn: sqlite3.Connection = Depends(get_db)):
     """Get system statistics summary."""
-    conn = get_db_connection()
-    try:
-        vehicles = VehicleRepository.get_all(conn, limit=10000)
-        fuel_events = FuelEventRepository.get_all(conn, limit=10000)
-        maintenance_events = MaintenanceEventRepository.get_all(conn, limit=10000)
-        repair_events = RepairEventRepository.get_all(conn, limit=10000)
-
-        return {
-            "vehicles": len(vehicles),
-            "fuel_events": len(fuel_events),
-            "maintenance_events": len(maintenance_events),
-            "repair_events": len(repair_events),
-        }
-    finally:
-        conn.close()
\ No newline at end of file
+    vehicles = VehicleRepository.get_all(conn, limit=10000)
+    fuel_events = FuelEventRepository.get_all(conn, limit=10000)
+    maintenance_events = MaintenanceEventRepository.get_all(conn, limit=10000)
+    repair_events = RepairEventRepository.get_all(conn, limit=10000)
+
+    return {
+        "vehicles": len(vehicles),
+        "fuel_events": len(fuel_events),
+        "maintenance_events": len(maintenance_events),
+        "repair_events": len(repair_events),
+    }
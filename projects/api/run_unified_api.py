@@ -43,7 +43,10 @@ def main():
         host="0.0.0.0",
         port=9000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        access_log=False
     )
 
 
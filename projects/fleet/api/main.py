@@ -78,19 +78,14 @@ async def root():
 @app.get("/health", tags=["Health"])
 async def health_check(conn: sqlite3.Connection = Depends(get_db)):
     """Detailed health check with database stats."""
-    vehicles = VehicleRepository.get_all(conn, limit=1)
-    fuel_events = FuelEventRepository.get_all(conn, limit=1)
-    maintenance = MaintenanceEventRepository.get_all(conn, limit=1)
-    repairs = RepairEventRepository.get_all(conn, limit=1)
-
     return {
         "status": "healthy",
         "database": "connected",
         "data_loaded": {
-            "vehicles": len(vehicles) > 0,
-            "fuel_events": len(fuel_events) > 0,
-            "maintenance_events": len(maintenance) > 0,
-            "repair_events": len(repairs) > 0
+            "vehicles": VehicleRepository.has_any(conn),
+            "fuel_events": FuelEventRepository.has_any(conn),
+            "maintenance_events": MaintenanceEventRepository.has_any(conn),
+            "repair_events": RepairEventRepository.has_any(conn)
         }
     }
 
@@ -168,15 +163,12 @@ async def delete_vehicle(vehicle_id: str, conn: sqlite3.Connection = Depends(get
 @app.post("/api/fuel-events", response_model=FuelEvent, status_code=status.HTTP_201_CREATED, tags=["Fuel Events"])
 async def create_fuel_event(fuel_event: FuelEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new fuel event."""
-    # Verify vehicle exists
-    vehicle = VehicleRepository.get_by_id(conn, fuel_event.vehicle_id)
-    if not vehicle:
+    created_event = FuelEventRepository.create(conn, fuel_event)
+    if not created_event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vehicle {fuel_event.vehicle_id} not found"
         )
-
-    created_event = FuelEventRepository.create(conn, fuel_event)
     return created_event
 
 
@@ -235,15 +227,12 @@ async def delete_fuel_event(fuel_id: str, conn: sqlite3.Connection = Depends(get
 @app.post("/api/maintenance-events", response_model=MaintenanceEvent, status_code=status.HTTP_201_CREATED, tags=["Maintenance"])
 async def create_maintenance_event(maintenance: MaintenanceEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new maintenance event."""
-    # Verify vehicle exists
-    vehicle = VehicleRepository.get_by_id(conn, maintenance.vehicle_id)
-    if not vehicle:
+    created_event = MaintenanceEventRepository.create(conn, maintenance)
+    if not created_event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vehicle {maintenance.vehicle_id} not found"
         )
-
-    created_event = MaintenanceEventRepository.create(conn, maintenance)
     return created_event
 
 
@@ -306,15 +295,12 @@ async def delete_maintenance_event(maintenance_id: str, conn: sqlite3.Connection
 @app.post("/api/repair-events", response_model=RepairEvent, status_code=status.HTTP_201_CREATED, tags=["Repairs"])
 async def create_repair_event(repair: RepairEventCreate, conn: sqlite3.Connection = Depends(get_db)):
     """Create a new repair event."""
-    # Verify vehicle exists
-    vehicle = VehicleRepository.get_by_id(conn, repair.vehicle_id)
-    if not vehicle:
+    created_event = RepairEventRepository.create(conn, repair)
+    if not created_event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vehicle {repair.vehicle_id} not found"
         )
-
-    created_event = RepairEventRepository.create(conn, repair)
     return created_event
 
 
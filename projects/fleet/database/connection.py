@@ -2,8 +2,13 @@
 Database Connection Management for Fleet Management API
 
 Provides SQLite database connection and session management.
+
+API requests borrow connections from a small pool instead of opening and
+closing the database file on every request.
 """
 
+import os
+import queue
 import sqlite3
 from typing import Generator
 from pathlib import Path
@@ -12,6 +17,14 @@ from pathlib import Path
 # Database file path
 DB_PATH = Path(__file__).parent.parent / "fleet_management.db"
 
+# Idle connections kept open for reuse by get_db()
+POOL_SIZE = int(os.getenv("FLEET_DB_POOL_SIZE", "8"))
+
+# Compiled statements kept per connection; covers every query the repositories issue
+STATEMENT_CACHE_SIZE = 256
+
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
 
 def get_db_connection() -> sqlite3.Connection:
     """
@@ -20,21 +33,44 @@ def get_db_connection() -> sqlite3.Connection:
     Returns:
         sqlite3.Connection: Configured database connection
     """
-    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)  # Allow multi-threading for FastAPI
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        check_same_thread=False,  # Allow multi-threading for FastAPI
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row  # Enable column access by name
     conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
     return conn
 
 
+def _open_pooled_connection() -> sqlite3.Connection:
+    """Open a connection for the pool, with WAL so readers don't block writers."""
+    conn = get_db_connection()
+    conn.execute("PRAGMA journal_mode = WAL")
+    return conn
+
+
 def get_db() -> Generator[sqlite3.Connection, None, None]:
     """
     Dependency for FastAPI to get database connections.
 
+    Connections come from the pool (or are opened when it is empty) and go
+    back to it after the request; any transaction left open is rolled back
+    first. Connections beyond POOL_SIZE are closed.
+
     Yields:
-        sqlite3.Connection: Database connection that will be automatically closed
+        sqlite3.Connection: Database connection for the current request
     """
-    conn = get_db_connection()
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _open_pooled_connection()
     try:
         yield conn
     finally:
-        conn.close()
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
@@ -76,6 +76,13 @@ class VehicleRepository:
 
         return [Vehicle(**_row_to_dict(row)) for row in cursor.fetchall()]
 
+    @staticmethod
+    def has_any(conn: sqlite3.Connection) -> bool:
+        """Check whether at least one vehicle exists."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM vehicles LIMIT 1")
+        return cursor.fetchone() is not None
+
     @staticmethod
     def update(conn: sqlite3.Connection, vehicle_id: str, vehicle: VehicleCreate) -> Optional[Vehicle]:
         """Update a vehicle."""
@@ -122,8 +129,8 @@ class FuelEventRepository:
     """Repository for fuel event CRUD operations."""
 
     @staticmethod
-    def create(conn: sqlite3.Connection, fuel_event: FuelEventCreate) -> FuelEvent:
-        """Create a new fuel event."""
+    def create(conn: sqlite3.Connection, fuel_event: FuelEventCreate) -> Optional[FuelEvent]:
+        """Create a new fuel event, or return None if the vehicle does not exist."""
         fuel_id = str(uuid.uuid4())
         created_at = datetime.utcnow().isoformat()
         date_time = fuel_event.date_time.isoformat() if fuel_event.date_time else created_at
@@ -134,7 +141,9 @@ class FuelEventRepository:
                 fuel_id, vehicle_id, gallons, odometer_reading, total_cost,
                 price_per_gallon, fuel_type, is_consumable, consumption_rate,
                 date_time, latitude, longitude, station_name, receipt_image_path, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            )
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM vehicles WHERE vehicle_id = ?)
         """, (
             fuel_id, fuel_event.vehicle_id, float(fuel_event.gallons), fuel_event.odometer_reading,
             float(fuel_event.total_cost) if fuel_event.total_cost else None,
@@ -142,10 +151,14 @@ class FuelEventRepository:
             fuel_event.fuel_type.value, fuel_event.is_consumable,
             float(fuel_event.consumption_rate) if fuel_event.consumption_rate else None,
             date_time, fuel_event.latitude, fuel_event.longitude,
-            fuel_event.station_name, fuel_event.receipt_image_path, created_at
+            fuel_event.station_name, fuel_event.receipt_image_path, created_at,
+            fuel_event.vehicle_id
         ))
         conn.commit()
 
+        if cursor.rowcount == 0:
+            return None
+
         # Update vehicle mileage
         VehicleRepository.update_mileage(conn, fuel_event.vehicle_id, fuel_event.odometer_reading)
 
@@ -188,6 +201,13 @@ class FuelEventRepository:
 
         return [FuelEvent(**_row_to_dict(row)) for row in cursor.fetchall()]
 
+    @staticmethod
+    def has_any(conn: sqlite3.Connection) -> bool:
+        """Check whether at least one fuel event exists."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM fuel_events LIMIT 1")
+        return cursor.fetchone() is not None
+
     @staticmethod
     def update(conn: sqlite3.Connection, fuel_id: str, fuel_event: FuelEventCreate) -> Optional[FuelEvent]:
         """Update a fuel event."""
@@ -232,8 +252,8 @@ class MaintenanceEventRepository:
     """Repository for maintenance event CRUD operations."""
 
     @staticmethod
-    def create(conn: sqlite3.Connection, maintenance: MaintenanceEventCreate) -> MaintenanceEvent:
-        """Create a new maintenance event."""
+    def create(conn: sqlite3.Connection, maintenance: MaintenanceEventCreate) -> Optional[MaintenanceEvent]:
+        """Create a new maintenance event, or return None if the vehicle does not exist."""
         maintenance_id = str(uuid.uuid4())
         created_at = datetime.utcnow().isoformat()
         date = maintenance.date.isoformat() if maintenance.date else created_at
@@ -243,15 +263,20 @@ class MaintenanceEventRepository:
             INSERT INTO maintenance_events (
                 maintenance_id, vehicle_id, date, maintenance_type, description,
                 cost, vendor, odometer_reading, next_service_due, parts_replaced, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            )
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM vehicles WHERE vehicle_id = ?)
         """, (
             maintenance_id, maintenance.vehicle_id, date, maintenance.maintenance_type,
             maintenance.description, float(maintenance.cost), maintenance.vendor,
             maintenance.odometer_reading, maintenance.next_service_due,
-            maintenance.parts_replaced, created_at
+            maintenance.parts_replaced, created_at, maintenance.vehicle_id
         ))
         conn.commit()
 
+        if cursor.rowcount == 0:
+            return None
+
         # Update vehicle mileage if provided
         if maintenance.odometer_reading:
             VehicleRepository.update_mileage(conn, maintenance.vehicle_id, maintenance.odometer_reading)
@@ -295,6 +320,13 @@ class MaintenanceEventRepository:
 
         return [MaintenanceEvent(**_row_to_dict(row)) for row in cursor.fetchall()]
 
+    @staticmethod
+    def has_any(conn: sqlite3.Connection) -> bool:
+        """Check whether at least one maintenance event exists."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM maintenance_events LIMIT 1")
+        return cursor.fetchone() is not None
+
     @staticmethod
     def update(conn: sqlite3.Connection, maintenance_id: str, maintenance: MaintenanceEventCreate) -> Optional[MaintenanceEvent]:
         """Update a maintenance event."""
@@ -334,8 +366,8 @@ class RepairEventRepository:
     """Repository for repair event CRUD operations."""
 
     @staticmethod
-    def create(conn: sqlite3.Connection, repair: RepairEventCreate) -> RepairEvent:
-        """Create a new repair event."""
+    def create(conn: sqlite3.Connection, repair: RepairEventCreate) -> Optional[RepairEvent]:
+        """Create a new repair event, or return None if the vehicle does not exist."""
         repair_id = str(uuid.uuid4())
         created_at = datetime.utcnow().isoformat()
         date = repair.date.isoformat() if repair.date else created_at
@@ -345,14 +377,19 @@ class RepairEventRepository:
             INSERT INTO repair_events (
                 repair_id, vehicle_id, date, repair_type, description,
                 cost, vendor, odometer_reading, warranty_info, severity, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            )
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM vehicles WHERE vehicle_id = ?)
         """, (
             repair_id, repair.vehicle_id, date, repair.repair_type, repair.description,
             float(repair.cost), repair.vendor, repair.odometer_reading,
-            repair.warranty_info, repair.severity.value, created_at
+            repair.warranty_info, repair.severity.value, created_at, repair.vehicle_id
         ))
         conn.commit()
 
+        if cursor.rowcount == 0:
+            return None
+
         # Update vehicle mileage if provided
         if repair.odometer_reading:
             VehicleRepository.update_mileage(conn, repair.vehicle_id, repair.odometer_reading)
@@ -396,6 +433,13 @@ class RepairEventRepository:
 
         return [RepairEvent(**_row_to_dict(row)) for row in cursor.fetchall()]
 
+    @staticmethod
+    def has_any(conn: sqlite3.Connection) -> bool:
+        """Check whether at least one repair event exists."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM repair_events LIMIT 1")
+        return cursor.fetchone() is not None
+
     @staticmethod
     def update(conn: sqlite3.Connection, repair_id: str, repair: RepairEventCreate) -> Optional[RepairEvent]:
         """Update a repair event."""
@@ -437,59 +481,54 @@ class AnalyticsRepository:
     @staticmethod
     def get_vehicle_summary(conn: sqlite3.Connection, vehicle_id: str) -> Optional[VehicleSummary]:
         """Get comprehensive summary for a vehicle."""
-        vehicle = VehicleRepository.get_by_id(conn, vehicle_id)
-        if not vehicle:
-            return None
-
         cursor = conn.cursor()
 
-        # Get fuel costs and MPG
-        cursor.execute("""
-            SELECT
-                COALESCE(SUM(total_cost), 0) as total_fuel_cost,
-                COUNT(*) as fuel_count
-            FROM fuel_events
-            WHERE vehicle_id = ? AND is_consumable = 0
-        """, (vehicle_id,))
-        fuel_data = cursor.fetchone()
-
-        # Calculate average MPG
+        # Vehicle row plus fuel/maintenance/repair aggregates in one query
         cursor.execute("""
-            SELECT consumption_rate FROM fuel_events
-            WHERE vehicle_id = ? AND consumption_rate IS NOT NULL AND is_consumable = 0
-            ORDER BY date_time DESC
-        """, (vehicle_id,))
-        mpg_values = [row[0] for row in cursor.fetchall()]
-        average_mpg = sum(mpg_values) / len(mpg_values) if mpg_values else None
-
-        # Get maintenance costs
-        cursor.execute("""
-            SELECT COALESCE(SUM(cost), 0) as total, COUNT(*) as count
-            FROM maintenance_events WHERE vehicle_id = ?
-        """, (vehicle_id,))
-        maint_data = cursor.fetchone()
+            WITH fuel AS (
+                SELECT
+                    COALESCE(SUM(total_cost), 0) AS total_fuel_cost,
+                    COUNT(*) AS fuel_event_count,
+                    AVG(consumption_rate) AS average_mpg
+                FROM fuel_events
+                WHERE vehicle_id = :vehicle_id AND is_consumable = 0
+            ),
+            maint AS (
+                SELECT
+                    COALESCE(SUM(cost), 0) AS total_maintenance_cost,
+                    COUNT(*) AS maintenance_event_count
+                FROM maintenance_events WHERE vehicle_id = :vehicle_id
+            ),
+            repair AS (
+                SELECT
+                    COALESCE(SUM(cost), 0) AS total_repair_cost,
+                    COUNT(*) AS repair_event_count
+                FROM repair_events WHERE vehicle_id = :vehicle_id
+            )
+            SELECT vehicles.*, fuel.*, maint.*, repair.*
+            FROM vehicles, fuel, maint, repair
+            WHERE vehicles.vehicle_id = :vehicle_id
+        """, {"vehicle_id": vehicle_id})
+        row = cursor.fetchone()
+        if not row:
+            return None
 
-        # Get repair costs
-        cursor.execute("""
-            SELECT COALESCE(SUM(cost), 0) as total, COUNT(*) as count
-            FROM repair_events WHERE vehicle_id = ?
-        """, (vehicle_id,))
-        repair_data = cursor.fetchone()
+        data = _row_to_dict(row)
+        stats = {key: data.pop(key) for key in (
+            "total_fuel_cost", "fuel_event_count", "average_mpg",
+            "total_maintenance_cost", "maintenance_event_count",
+            "total_repair_cost", "repair_event_count",
+        )}
+        vehicle = Vehicle(**data)
 
-        total_operating_cost = fuel_data[0] + maint_data[0] + repair_data[0]
+        total_operating_cost = stats["total_fuel_cost"] + stats["total_maintenance_cost"] + stats["total_repair_cost"]
         cost_per_mile = total_operating_cost / vehicle.current_mileage if vehicle.current_mileage > 0 else None
 
         return VehicleSummary(
             vehicle=vehicle,
-            total_fuel_cost=fuel_data[0],
-            total_maintenance_cost=maint_data[0],
-            total_repair_cost=repair_data[0],
             total_operating_cost=total_operating_cost,
-            average_mpg=average_mpg,
-            fuel_event_count=fuel_data[1],
-            maintenance_event_count=maint_data[1],
-            repair_event_count=repair_data[1],
-            cost_per_mile=cost_per_mile
+            cost_per_mile=cost_per_mile,
+            **stats
         )
 
     @staticmethod
@@ -497,49 +536,33 @@ class AnalyticsRepository:
         """Get fleet-wide summary statistics."""
         cursor = conn.cursor()
 
-        # Count vehicles
-        cursor.execute("SELECT COUNT(*) FROM vehicles")
-        total_vehicles = cursor.fetchone()[0]
-
-        # Fuel stats
-        cursor.execute("""
-            SELECT
-                COUNT(*) as count,
-                COALESCE(SUM(total_cost), 0) as total_cost
-            FROM fuel_events WHERE is_consumable = 0
-        """)
-        fuel_data = cursor.fetchone()
-
-        # Maintenance stats
-        cursor.execute("""
-            SELECT COUNT(*) as count, COALESCE(SUM(cost), 0) as total
-            FROM maintenance_events
-        """)
-        maint_data = cursor.fetchone()
-
-        # Repair stats
-        cursor.execute("""
-            SELECT COUNT(*) as count, COALESCE(SUM(cost), 0) as total
-            FROM repair_events
-        """)
-        repair_data = cursor.fetchone()
-
-        # Average fleet MPG
+        # Vehicle count plus fuel/maintenance/repair aggregates in one query
         cursor.execute("""
-            SELECT consumption_rate FROM fuel_events
-            WHERE consumption_rate IS NOT NULL AND is_consumable = 0
+            WITH fuel AS (
+                SELECT
+                    COUNT(*) AS total_fuel_events,
+                    COALESCE(SUM(total_cost), 0) AS total_fuel_cost,
+                    AVG(consumption_rate) AS average_fleet_mpg
+                FROM fuel_events WHERE is_consumable = 0
+            ),
+            maint AS (
+                SELECT
+                    COUNT(*) AS total_maintenance_events,
+                    COALESCE(SUM(cost), 0) AS total_maintenance_cost
+                FROM maintenance_events
+            ),
+            repair AS (
+                SELECT
+                    COUNT(*) AS total_repair_events,
+                    COALESCE(SUM(cost), 0) AS total_repair_cost
+                FROM repair_events
+            )
+            SELECT (SELECT COUNT(*) FROM vehicles) AS total_vehicles, fuel.*, maint.*, repair.*
+            FROM fuel, maint, repair
         """)
-        mpg_values = [row[0] for row in cursor.fetchall()]
-        average_fleet_mpg = sum(mpg_values) / len(mpg_values) if mpg_values else None
+        stats = _row_to_dict(cursor.fetchone())
 
         return FleetSummary(
-            total_vehicles=total_vehicles,
-            total_fuel_events=fuel_data[0],
-            total_maintenance_events=maint_data[0],
-            total_repair_events=repair_data[0],
-            total_fuel_cost=fuel_data[1],
-            total_maintenance_cost=maint_data[1],
-            total_repair_cost=repair_data[1],
-            total_operating_cost=fuel_data[1] + maint_data[1] + repair_data[1],
-            average_fleet_mpg=average_fleet_mpg
+            total_operating_cost=stats["total_fuel_cost"] + stats["total_maintenance_cost"] + stats["total_repair_cost"],
+            **stats
         )